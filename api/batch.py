@@ -0,0 +1,96 @@
+# api/batch.py - Batch API Blueprint
+import os
+from flask import Blueprint, current_app, request, jsonify
+from werkzeug.exceptions import HTTPException
+from utils.data_manager import deferred_writes, write_many
+from api.events import add_event, edit_event, remove_event
+from api.layers import add_layer, edit_layer, remove_layer
+from api.recurring_patterns import (
+    add_recurring_pattern, edit_recurring_pattern, move_pattern_occurrence,
+    remove_pattern_occurrence, remove_recurring_pattern,
+)
+from api.tasks import add_task, edit_task, remove_task
+
+batch_bp = Blueprint('batch', __name__)
+
+# Upper bound on the number of operations accepted in one batch
+BATCH_MAX_OPERATIONS = int(os.environ.get('CALENDAR_BATCH_MAX_OPERATIONS', 200))
+
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+# Write route endpoint -> the operation behind it, called as fn(data=body, **view_args)
+BATCH_OPERATIONS = {
+    'events.create_event': add_event,
+    'events.update_event': edit_event,
+    'events.delete_event': remove_event,
+    'recurring_patterns.create_recurring_pattern': add_recurring_pattern,
+    'recurring_patterns.update_recurring_pattern': edit_recurring_pattern,
+    'recurring_patterns.delete_recurring_pattern': remove_recurring_pattern,
+    'recurring_patterns.delete_recurring_event': remove_recurring_pattern,
+    'recurring_patterns.move_occurrence': move_pattern_occurrence,
+    'recurring_patterns.delete_occurrence': remove_pattern_occurrence,
+    'layers.create_layer': add_layer,
+    'layers.update_layer': edit_layer,
+    'layers.delete_layer': remove_layer,
+    'tasks.create_task': add_task,
+    'tasks.update_task': edit_task,
+    'tasks.delete_task': remove_task,
+}
+
+def _resolve(operation):
+    """(operation function, view_args) for one operation, or raise ValueError"""
+    if not isinstance(operation, dict):
+        raise ValueError('operation must be an object')
+    method = str(operation.get('method', '')).upper()
+    path = operation.get('path')
+    if method not in WRITE_METHODS:
+        raise ValueError(f"method must be one of {', '.join(WRITE_METHODS)}")
+    if not isinstance(path, str):
+        raise ValueError('path is required')
+    try:
+        endpoint, view_args = current_app.url_map.bind('localhost').match(path, method=method)
+    except HTTPException:
+        raise ValueError(f'no route for {method} {path}')
+    if endpoint not in BATCH_OPERATIONS:
+        raise ValueError(f'{method} {path} cannot be batched')
+    if not isinstance(operation.get('body', {}), dict):
+        raise ValueError('body must be an object')
+    return BATCH_OPERATIONS[endpoint], view_args
+
+@batch_bp.route('/batch', methods=['POST'])
+def run_batch():
+    """Run several write operations in one request and commit them together.
+
+    Body: {"operations": [{"method": "PUT", "path": "/api/layers/<id>",
+    "body": {...}}, ...]}. Operations run in order through the same
+    functions as the routes, against the request's store snapshot and the
+    exception index, both of which lay the staged writes over their reads,
+    so each operation sees the writes of those before it. Nothing is saved until every operation has
+    succeeded; then all touched collections are committed at once. The
+    first failing operation aborts the batch with its status code.
+    """
+    data = request.get_json(silent=True) or {}
+    operations = data.get('operations')
+    if not isinstance(operations, list) or not operations:
+        return jsonify({'error': 'operations must be a non-empty list'}), 400
+    if len(operations) > BATCH_MAX_OPERATIONS:
+        return jsonify({'error': f'At most {BATCH_MAX_OPERATIONS} operations per batch'}), 400
+
+    resolved = []
+    for index, operation in enumerate(operations):
+        try:
+            resolved.append(_resolve(operation))
+        except ValueError as e:
+            return jsonify({'error': f'Operation {index}: {e}'}), 400
+
+    results = []
+    with deferred_writes() as pending:
+        for index, (operation, (run, view_args)) in enumerate(zip(operations, resolved)):
+            body, status = run(data=operation.get('body', {}), **view_args)
+            results.append({'status': status, 'body': body})
+            if status >= 400:
+                return jsonify({'committed': False, 'failed': index, 'results': results}), status
+
+    if not write_many(pending.changes()):
+        return jsonify({'error': 'Failed to save batch', 'committed': False, 'results': results}), 500
+    return jsonify({'committed': True, 'results': results})
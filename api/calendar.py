@@ -0,0 +1,76 @@
+# api/calendar.py - Calendar Bootstrap API Blueprint
+from flask import Blueprint, request, jsonify
+from datetime import date, datetime
+from utils.http_cache import conditional_get, gzipped
+from utils.snapshot import get_snapshot
+from api.events import iter_calendar_events
+from api.recurring_patterns import describe_pattern
+
+calendar_bp = Blueprint('calendar', __name__)
+
+BOOTSTRAP_COLLECTIONS = ('layers', 'events', 'recurring_patterns', 'tasks')
+
+# Reads retried when a write lands between them before giving up on a clean snapshot
+SNAPSHOT_ATTEMPTS = 3
+
+def _load_snapshot(window_start, window_end):
+    """Read every collection the bootstrap needs, all at the same versions.
+
+    If a write slipped in between the reads, the request's snapshot is
+    dropped and read again so the payload never mixes states.
+    """
+    snapshot = get_snapshot()
+    for _ in range(SNAPSHOT_ATTEMPTS):
+        data = {
+            'layers': snapshot.layers,
+            'events': snapshot.events_in_range(window_start, window_end),
+            'recurring_patterns': snapshot.recurring_patterns,
+            'tasks': snapshot.tasks,
+        }
+        if snapshot.is_current():
+            break
+        snapshot.forget()
+    return data
+
+def _requested_date():
+    """The day whose tasks are included: ?date= or, by default, today"""
+    return request.args.get('date') or date.today().isoformat()
+
+@calendar_bp.route('/calendar/bootstrap', methods=['GET'])
+@conditional_get(*BOOTSTRAP_COLLECTIONS, key=_requested_date)
+@gzipped
+def get_bootstrap():
+    """Everything the calendar needs on page load, in one response.
+
+    Requires ?start=&end= (ISO dates) for the event window; ?date= picks
+    the day whose tasks are included (default today). Returns layers,
+    windowed events, patterns with their exception summaries and tasks,
+    all built from one snapshot of the store.
+    """
+    window_start = request.args.get('start')
+    window_end = request.args.get('end')
+    if not window_start or not window_end:
+        return jsonify({'error': 'start and end are required'}), 400
+    try:
+        datetime.fromisoformat(window_start.replace('Z', ''))
+        datetime.fromisoformat(window_end.replace('Z', ''))
+    except ValueError:
+        return jsonify({'error': 'start and end must be ISO dates'}), 400
+    ymd = _requested_date()
+
+    snapshot = _load_snapshot(window_start, window_end)
+    layers = snapshot['layers']
+    patterns = snapshot['recurring_patterns']
+
+    events = iter_calendar_events(
+        snapshot['events'], patterns, layers,
+        window_start=window_start, window_end=window_end,
+    )
+    return jsonify({
+        'range': {'start': window_start, 'end': window_end},
+        'layers': list(layers.values()),
+        'events': list(events),
+        'recurring_patterns': [describe_pattern(pattern, layers) for pattern in patterns.values()],
+        'tasks': [task for task in snapshot['tasks'].values() if task.get('date') == ymd],
+        'date': ymd,
+    })
@@ -0,0 +1,80 @@
+# api/changes.py - Change Feed API Blueprint
+import json
+import os
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from utils.change_feed import change_feed
+
+changes_bp = Blueprint('changes', __name__)
+
+# Seconds of silence after which the stream sends a keep-alive comment
+HEARTBEAT_SECONDS = float(os.environ.get('CALENDAR_SSE_HEARTBEAT', 15))
+
+# Record fields copied into stream notifications, enough to tell which range changed
+NOTIFY_FIELDS = (
+    'start', 'end', 'layer', 'first_occurrence', 'date',
+    'pattern_id', 'original_pattern_id', 'original_occurrence_date',
+)
+
+@changes_bp.route('/changes', methods=['GET'])
+def get_changes():
+    """Get the writes made since ?since=<cursor>.
+
+    Without a cursor, or with one the log no longer covers, the response has
+    resync=true: reload everything, then continue from the returned cursor.
+    """
+    try:
+        limit = min(max(int(request.args.get('limit', 1000)), 1), 5000)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    return jsonify(change_feed.changes_since(request.args.get('since'), limit=limit))
+
+def _notification(change):
+    """Compact form of a change: what was touched, not the whole record"""
+    note = {'collection': change['collection'], 'op': change['op'], 'id': change['id']}
+    record = change.get('record') or {}
+    for field in NOTIFY_FIELDS:
+        if record.get(field) is not None:
+            note[field] = record[field]
+    return note
+
+def _sse(event, data, event_id=None):
+    head = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{head}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@changes_bp.route('/changes/stream', methods=['GET'])
+def stream_changes():
+    """Server-Sent Events stream of change notifications.
+
+    Each message id is a change-feed cursor, so a reconnecting EventSource
+    resumes from Last-Event-ID (or ?since=). 'resync' means the gap cannot
+    be replayed and the client should reload. Idle streams get a comment
+    line every HEARTBEAT_SECONDS.
+    """
+    cursor = request.headers.get('Last-Event-ID') or request.args.get('since')
+
+    @stream_with_context
+    def generate():
+        nonlocal cursor
+        yield "retry: 3000\n\n"
+        if not cursor:
+            cursor = change_feed.cursor
+            yield _sse('ready', {'cursor': cursor}, cursor)
+        while True:
+            batch = change_feed.changes_since(cursor, limit=500)
+            cursor = batch['cursor']
+            if batch['resync']:
+                yield _sse('resync', {'cursor': cursor}, cursor)
+            elif batch['changes']:
+                changes = [_notification(change) for change in batch['changes']]
+                yield _sse('change', {'cursor': cursor, 'changes': changes}, cursor)
+                if batch['has_more']:
+                    continue
+            if not change_feed.wait(cursor, HEARTBEAT_SECONDS):
+                yield ": heartbeat\n\n"
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no"  # friendly to some proxies
+    }
+    return Response(generate(), mimetype="text/event-stream", headers=headers)
@@ -1,15 +1,22 @@
 # api/events.py - Events API Blueprint
 from flask import Blueprint, request, jsonify
 from datetime import datetime
+import heapq
 import uuid
-from utils.data_manager import load_events, save_events, load_layers, load_recurring_patterns
-from utils.recurring_utils import generate_instances_from_pattern, get_recurrence_text
+from utils.data_manager import put_record, delete_record
+from utils.http_cache import conditional_get
+from utils.snapshot import get_snapshot
+from utils.streaming import ndjson_response, wants_ndjson
+from utils.recurring_utils import (
+    generate_instances_for_patterns, generate_instances_from_pattern, get_recurrence_text,
+)
 
 events_bp = Blueprint('events', __name__)
 
-def is_orphan_exception(event):
+def is_orphan_exception(event, patterns=None):
     """Check if event references a series that no longer exists"""
-    patterns = load_recurring_patterns()
+    if patterns is None:
+        patterns = get_snapshot().recurring_patterns
     pattern_id = event.get('pattern_id') or event.get('original_pattern_id')
     if not pattern_id:
         return False
@@ -23,87 +30,128 @@ def is_orphan_exception(event):
         event.get('is_recurring_instance')
     )
 
-@events_bp.route('/events', methods=['GET'])
-def get_events():
-    """Get all events (regular events + generated recurring instances) with layer filtering"""
-    events = load_events()
-    patterns = load_recurring_patterns()
-    layers = load_layers()
-
-    # 1) Start with regular events, drop deletion markers and orphaned exceptions
-    all_events = {}
-    for event_id, event in events.items():
-        if event.get('is_deletion_exception', False):
-            continue  # never show deletion markers
-        if is_orphan_exception(event):
-            continue  # safety-net: hide orphaned exceptions
-        all_events[event_id] = event
-
-    # 2) Generate instances from recurring patterns
-    for pattern in patterns.values():
-        instances = generate_instances_from_pattern(pattern)
-        for instance in instances:
-            inst = instance.copy()
-            inst['is_recurring_instance'] = True
-            inst['is_moved_exception'] = bool(inst.get('is_moved_exception', False))
-            inst['is_deletion_exception'] = False
-            all_events[inst['id']] = inst
-
-    # 3) Enrich with series info and normalize flags
-    enriched_events = []
-    for event in all_events.values():
-        event_out = event.copy()
-
-        # Normalize booleans
-        event_out['is_recurring_instance'] = bool(event_out.get('is_recurring_instance', False))
-        event_out['is_moved_exception'] = bool(event_out.get('is_moved_exception', False))
-        event_out['is_deletion_exception'] = bool(event_out.get('is_deletion_exception', False))
-
-        # Series enrichment
-        pattern_id = event_out.get('pattern_id') or event_out.get('original_pattern_id')
-        if pattern_id and pattern_id in patterns:
+def _start_key(event):
+    return event.get('start') or ''
+
+def display_event(event, patterns, layers, series_info=None):
+    """Copy of a stored or generated event with the flags, series and layer info the calendar shows.
+
+    `series_info` caches one series dict per pattern, so events of the same
+    series share it.
+    """
+    if series_info is None:
+        series_info = {}
+    layer_id = event.get('layer', 'personal')
+    event_out = dict(event)
+    # Normalize booleans (generated instances are never deletion markers)
+    event_out['is_recurring_instance'] = bool(event.get('is_recurring_instance', False))
+    event_out['is_moved_exception'] = bool(event.get('is_moved_exception', False))
+    event_out['is_deletion_exception'] = bool(event.get('is_deletion_exception', False))
+
+    # Series enrichment (one series dict per pattern, shared by its events)
+    pattern_id = event.get('pattern_id') or event.get('original_pattern_id')
+    if pattern_id and pattern_id in patterns:
+        series = series_info.get(pattern_id)
+        if series is None:
             pattern = patterns[pattern_id]
-            event_out['series'] = {
+            series = series_info[pattern_id] = {
                 'id': pattern['id'],
                 'title': pattern.get('title', ''),
                 'first_occurrence': pattern.get('first_occurrence'),
                 'start_time': pattern.get('start_time'),
                 'recurrence_text': get_recurrence_text(pattern),
             }
-            event_out['is_recurring_linked'] = True
-        else:
-            event_out['is_recurring_linked'] = False
-
-        enriched_events.append(event_out)
+        event_out['series'] = series
+        event_out['is_recurring_linked'] = True
+    else:
+        event_out['is_recurring_linked'] = False
+
+    # Layer metadata
+    if layer_id in layers:
+        event_out['layer_color'] = layers[layer_id]['color']
+        event_out['layer_name'] = layers[layer_id]['name']
+    return event_out
+
+def iter_calendar_events(events, patterns, layers, window_start=None, window_end=None, layer_ids=None):
+    """Yield display-ready events (stored + generated instances) in start order.
+
+    Stored events and each pattern's expansion are merged lazily with
+    heapq.merge. Deletion markers, orphaned exceptions and hidden layers are
+    dropped, and every surviving event is copied exactly once, when its
+    flags, series info and layer metadata are attached. `layer_ids`, if
+    given, further limits the output to those (visible) layers.
+    """
+    visible_layers = {layer_id for layer_id, layer in layers.items() if layer.get('visible', True)}
+    if layer_ids is not None:
+        visible_layers &= set(layer_ids)
+
+    stored = sorted(
+        (
+            event for event in events.values()
+            if not event.get('is_deletion_exception', False)  # never show deletion markers
+            and not is_orphan_exception(event, patterns)  # safety-net: hide orphaned exceptions
+        ),
+        key=_start_key,
+    )
+    streams = [stored]
+    if window_start is not None and window_end is not None:
+        # One batch expansion for every pattern not already cached
+        streams.extend(generate_instances_for_patterns(patterns.values(), window_start, window_end).values())
+    else:
+        for pattern in patterns.values():
+            streams.append(generate_instances_from_pattern(pattern))
 
-    # 4) Filter by visible layers and attach layer metadata
-    visible_layers = [layer_id for layer_id, layer in layers.items() if layer.get('visible', True)]
-    filtered_events = []
-    
-    for event in enriched_events:
-        layer_id = event.get('layer', 'personal')
-        if layer_id in visible_layers:
-            event_out = event.copy()
-            if layer_id in layers:
-                event_out['layer_color'] = layers[layer_id]['color']
-                event_out['layer_name'] = layers[layer_id]['name']
-            filtered_events.append(event_out)
+    series_info = {}
+    for event in heapq.merge(*streams, key=_start_key):
+        if event.get('layer', 'personal') not in visible_layers:
+            continue
+        yield display_event(event, patterns, layers, series_info)
 
-    return jsonify(filtered_events)
+@events_bp.route('/events', methods=['GET'])
+@conditional_get('events', 'recurring_patterns', 'layers')
+def get_events():
+    """Get all events (regular events + generated recurring instances) with layer filtering.
+
+    Optional ?start=&end= (ISO dates) limit the store query and recurring
+    expansion to that window; ?layers=a,b limits the output to those layers.
+    With Accept: application/x-ndjson or ?stream=1 the events are streamed
+    one per line as they come out of the pipeline.
+    """
+    window_start = request.args.get('start')
+    window_end = request.args.get('end')
+    if bool(window_start) != bool(window_end):
+        return jsonify({'error': 'start and end must be given together'}), 400
+    if window_start:
+        try:
+            datetime.fromisoformat(window_start.replace('Z', ''))
+            datetime.fromisoformat(window_end.replace('Z', ''))
+        except ValueError:
+            return jsonify({'error': 'start and end must be ISO dates'}), 400
+
+    layer_ids = request.args.get('layers')
+    if layer_ids is not None:
+        layer_ids = [layer_id for layer_id in layer_ids.split(',') if layer_id]
+
+    snapshot = get_snapshot()
+    stored = snapshot.events_in_range(window_start, window_end) if window_start else snapshot.events
+    events = iter_calendar_events(
+        stored, snapshot.recurring_patterns, snapshot.layers,
+        window_start=window_start or None, window_end=window_end or None,
+        layer_ids=layer_ids,
+    )
+    if wants_ndjson():
+        return ndjson_response(events)
+    return jsonify(list(events))
 
-@events_bp.route('/events', methods=['POST'])
-def create_event():
-    """Create a new event"""
-    from api.recurring_patterns import create_recurring_pattern
-    
-    data = request.json
+def add_event(data):
+    """Create a new event (or a recurring pattern if data asks for one); returns (body, status)"""
+    from api.recurring_patterns import add_recurring_pattern
     
     if data.get('is_recurring', False):
         # Create recurring pattern instead of regular event
-        return create_recurring_pattern()
+        return add_recurring_pattern(data)
     
     # Create regular event
-    events = load_events()
     event_id = str(uuid.uuid4())
     
     event = {
@@ -124,22 +172,18 @@ def create_event():
         'created_at': datetime.now().isoformat()
     }
     
-    events[event_id] = event
-    
-    if save_events(events):
-        return jsonify(event), 201
+    if put_record('events', event):
+        return event, 201
     else:
-        return jsonify({'error': 'Failed to save event'}), 500
+        return {'error': 'Failed to save event'}, 500
 
-@events_bp.route('/events/<event_id>', methods=['PUT'])
-def update_event(event_id):
-    """Update an event"""
-    events = load_events()
-    if event_id not in events:
-        return jsonify({'error': 'Event not found'}), 404
+def edit_event(event_id, data):
+    """Update an event; returns (body, status)"""
+    current = get_snapshot().record('events', event_id)
+    if current is None:
+        return {'error': 'Event not found'}, 404
 
-    data = request.json
-    event = events[event_id]
+    event = dict(current)
 
     def provided(key):
         # Help distinguish between "not provided" and "provided as null/false"
@@ -162,28 +206,41 @@ def update_event(event_id):
 
     event['updated_at'] = datetime.now().isoformat()
 
-    if save_events(events):
-        return jsonify(event)
-    return jsonify({'error': 'Failed to update event'}), 500
+    if put_record('events', event):
+        return event, 200
+    return {'error': 'Failed to update event'}, 500
 
-@events_bp.route('/events/<event_id>', methods=['DELETE'])
-def delete_event(event_id):
-    """Delete an event"""
-    from api.recurring_patterns import delete_recurring_pattern
+def remove_event(event_id, data=None):
+    """Delete an event (or the recurring pattern with that id); returns (body, status)"""
+    from api.recurring_patterns import remove_recurring_pattern
     
     # Check if it's a recurring pattern
-    patterns = load_recurring_patterns()
-    if event_id in patterns:
-        return delete_recurring_pattern(event_id)
+    if get_snapshot().record('recurring_patterns', event_id) is not None:
+        return remove_recurring_pattern(event_id)
     
     # Handle regular event
-    events = load_events()
-    if event_id not in events:
-        return jsonify({'error': 'Event not found'}), 404
-    
-    del events[event_id]
+    if get_snapshot().record('events', event_id) is None:
+        return {'error': 'Event not found'}, 404
     
-    if save_events(events):
-        return jsonify({'message': 'Event deleted'}), 200
+    if delete_record('events', event_id):
+        return {'message': 'Event deleted'}, 200
     else:
-        return jsonify({'error': 'Failed to delete event'}), 500
\ No newline at end of file
+        return {'error': 'Failed to delete event'}, 500
+
+@events_bp.route('/events', methods=['POST'])
+def create_event():
+    """Create a new event"""
+    body, status = add_event(request.json)
+    return jsonify(body), status
+
+@events_bp.route('/events/<event_id>', methods=['PUT'])
+def update_event(event_id):
+    """Update an event"""
+    body, status = edit_event(event_id, request.json)
+    return jsonify(body), status
+
+@events_bp.route('/events/<event_id>', methods=['DELETE'])
+def delete_event(event_id):
+    """Delete an event"""
+    body, status = remove_event(event_id)
+    return jsonify(body), status
@@ -2,33 +2,34 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 import uuid
-from utils.data_manager import load_layers, save_layers, load_events, save_events, load_recurring_patterns, save_recurring_patterns
+from utils.data_manager import put_record, write_many
+from utils.http_cache import conditional_get
+from utils.snapshot import get_snapshot
 
 layers_bp = Blueprint('layers', __name__)
 
 @layers_bp.route('/layers', methods=['GET'])
+@conditional_get('layers')
 def get_layers():
     """Get all layers"""
-    layers = load_layers()
+    layers = get_snapshot().layers
     return jsonify(list(layers.values()))
 
-@layers_bp.route('/layers', methods=['POST'])
-def create_layer():
-    """Create a new layer"""
-    layers = load_layers()
-    data = request.json
+def add_layer(data):
+    """Create a new layer; returns (body, status)"""
+    layers = get_snapshot().layers
     
     # Generate unique ID
     layer_id = str(uuid.uuid4())
     
     # Validate required fields
     if not data.get('name') or not data.get('color'):
-        return jsonify({'error': 'Name and color are required'}), 400
+        return {'error': 'Name and color are required'}, 400
     
     # Check for duplicate names
     existing_names = [layer['name'].lower() for layer in layers.values()]
     if data['name'].lower() in existing_names:
-        return jsonify({'error': 'Layer name already exists'}), 400
+        return {'error': 'Layer name already exists'}, 400
     
     new_layer = {
         'id': layer_id,
@@ -38,22 +39,18 @@ def create_layer():
         'created_at': datetime.now().isoformat()
     }
     
-    layers[layer_id] = new_layer
-    
-    if save_layers(layers):
-        return jsonify(new_layer), 201
+    if put_record('layers', new_layer):
+        return new_layer, 201
     else:
-        return jsonify({'error': 'Failed to save layer'}), 500
+        return {'error': 'Failed to save layer'}, 500
 
-@layers_bp.route('/layers/<layer_id>', methods=['PUT'])
-def update_layer(layer_id):
-    """Update a layer (visibility, name, color)"""
-    layers = load_layers()
+def edit_layer(layer_id, data):
+    """Update a layer (visibility, name, color); returns (body, status)"""
+    layers = get_snapshot().layers
     if layer_id not in layers:
-        return jsonify({'error': 'Layer not found'}), 404
+        return {'error': 'Layer not found'}, 404
     
-    data = request.json
-    layer = layers[layer_id]
+    layer = dict(layers[layer_id])
     
     # Update allowed fields
     if 'visible' in data:
@@ -62,33 +59,33 @@ def update_layer(layer_id):
         # Check for duplicate names (excluding current layer)
         existing_names = [l['name'].lower() for lid, l in layers.items() if lid != layer_id]
         if data['name'].lower() in existing_names:
-            return jsonify({'error': 'Layer name already exists'}), 400
+            return {'error': 'Layer name already exists'}, 400
         layer['name'] = data['name']
     if 'color' in data:
         layer['color'] = data['color']
     
     layer['updated_at'] = datetime.now().isoformat()
     
-    if save_layers(layers):
-        return jsonify(layer)
+    if put_record('layers', layer):
+        return layer, 200
     else:
-        return jsonify({'error': 'Failed to update layer'}), 500
+        return {'error': 'Failed to update layer'}, 500
 
-@layers_bp.route('/layers/<layer_id>', methods=['DELETE'])
-def delete_layer(layer_id):
-    """Delete a layer and handle event migration"""
-    layers = load_layers()
-    events = load_events()
-    patterns = load_recurring_patterns()
+def remove_layer(layer_id, data=None):
+    """Delete a layer and handle event migration; returns (body, status)"""
+    snapshot = get_snapshot()
+    layers = snapshot.layers
+    events = snapshot.events
+    patterns = snapshot.recurring_patterns
     
     if layer_id not in layers:
-        return jsonify({'error': 'Layer not found'}), 404
+        return {'error': 'Layer not found'}, 404
     
     # Prevent deleting the last layer
     if len(layers) <= 1:
-        return jsonify({'error': 'Cannot delete the last layer'}), 400
+        return {'error': 'Cannot delete the last layer'}, 400
     
-    data = request.json or {}
+    data = data or {}
     migration_option = data.get('migration_option', 'move')
     migration_layer = data.get('migration_layer', 'personal')
     
@@ -96,35 +93,49 @@ def delete_layer(layer_id):
     layer_events = [event for event in events.values() if event.get('layer') == layer_id]
     layer_patterns = [pattern for pattern in patterns.values() if pattern.get('layer') == layer_id]
     
+    event_puts, event_deletes = [], []
+    pattern_puts, pattern_deletes = [], []
     if layer_events or layer_patterns:
         if migration_option == 'move':
             # Move events and patterns to another layer
             if migration_layer not in layers:
-                return jsonify({'error': 'Migration layer not found'}), 400
+                return {'error': 'Migration layer not found'}, 400
             
             for event in layer_events:
-                event['layer'] = migration_layer
-                event['updated_at'] = datetime.now().isoformat()
+                event_puts.append({**event, 'layer': migration_layer, 'updated_at': datetime.now().isoformat()})
             
             for pattern in layer_patterns:
-                pattern['layer'] = migration_layer
-                pattern['updated_at'] = datetime.now().isoformat()
+                pattern_puts.append({**pattern, 'layer': migration_layer, 'updated_at': datetime.now().isoformat()})
                 
         elif migration_option == 'delete':
             # Delete all events and patterns in this layer
-            events_to_delete = [event['id'] for event in layer_events]
-            for event_id in events_to_delete:
-                del events[event_id]
-            
-            patterns_to_delete = [pattern['id'] for pattern in layer_patterns]
-            for pattern_id in patterns_to_delete:
-                del patterns[pattern_id]
-    
-    # Delete the layer
-    del layers[layer_id]
-    
-    # Save all files
-    if save_layers(layers) and save_events(events) and save_recurring_patterns(patterns):
-        return jsonify({'message': 'Layer deleted successfully'}), 200
+            event_deletes = [event['id'] for event in layer_events]
+            pattern_deletes = [pattern['id'] for pattern in layer_patterns]
+    
+    # Delete the layer and write only the touched records, all in one commit
+    if write_many({
+        'events': (event_puts, event_deletes),
+        'recurring_patterns': (pattern_puts, pattern_deletes),
+        'layers': ([], [layer_id]),
+    }):
+        return {'message': 'Layer deleted successfully'}, 200
     else:
-        return jsonify({'error': 'Failed to delete layer'}), 500
\ No newline at end of file
+        return {'error': 'Failed to delete layer'}, 500
+
+@layers_bp.route('/layers', methods=['POST'])
+def create_layer():
+    """Create a new layer"""
+    body, status = add_layer(request.json)
+    return jsonify(body), status
+
+@layers_bp.route('/layers/<layer_id>', methods=['PUT'])
+def update_layer(layer_id):
+    """Update a layer (visibility, name, color)"""
+    body, status = edit_layer(layer_id, request.json)
+    return jsonify(body), status
+
+@layers_bp.route('/layers/<layer_id>', methods=['DELETE'])
+def delete_layer(layer_id):
+    """Delete a layer and handle event migration"""
+    body, status = remove_layer(layer_id, request.get_json(silent=True))
+    return jsonify(body), status
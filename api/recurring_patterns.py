@@ -1,81 +1,109 @@
 # api/recurring_patterns.py - Recurring Patterns API Blueprint
 from flask import Blueprint, request, jsonify
-from datetime import datetime
+from datetime import date, datetime
 import uuid
-from utils.data_manager import (
-    load_recurring_patterns, save_recurring_patterns, 
-    load_layers, load_events, save_events
-)
-from utils.recurring_utils import get_recurrence_text
+from utils.data_manager import put_record, write_many
+from utils.exception_index import exception_index
+from utils.http_cache import conditional_get
+from utils.recurring_utils import find_occurrence, get_recurrence_text
+from utils.rrule import compile_rrule
+from utils.snapshot import get_snapshot
+from utils.streaming import ndjson_response, wants_ndjson
+from api.events import display_event
 
 patterns_bp = Blueprint('recurring_patterns', __name__)
 
-@patterns_bp.route('/recurring-patterns', methods=['GET'])
-def get_recurring_patterns():
-    """Get all recurring patterns with layer info and exceptions"""
-    patterns = load_recurring_patterns()
-    layers = load_layers()
-    events = load_events()
-
-    pattern_list = []
-    for pattern in patterns.values():
-        pattern_copy = pattern.copy()
-
-        # Add layer metadata
-        layer_id = pattern.get('layer', 'personal')
-        if layer_id in layers:
-            pattern_copy['layer_color'] = layers[layer_id]['color']
-            pattern_copy['layer_name'] = layers[layer_id]['name']
-
-        # Build exceptions for this pattern
-        pattern_id = pattern['id']
-        deletion_exceptions = []
-        moved_exceptions = []
-
-        for event in events.values():
-            if event.get('is_deletion_exception') and event.get('original_pattern_id') == pattern_id:
-                deletion_exceptions.append({
-                    'id': event['id'],
-                    'original_occurrence_date': event.get('original_occurrence_date'),
-                })
-            if event.get('is_moved_exception') and event.get('original_pattern_id') == pattern_id:
-                moved_exceptions.append({
-                    'id': event['id'],
-                    'original_occurrence_date': event.get('original_occurrence_date'),
-                    'new_start': event.get('start'),
-                    'new_end': event.get('end'),
-                    'title': event.get('title', pattern.get('title', '')),
-                    'layer': event.get('layer', layer_id),
-                })
-
-        pattern_copy['exceptions'] = {
-            'deletions': deletion_exceptions,
-            'moves': moved_exceptions,
-            'counts': {
-                'deletions': len(deletion_exceptions),
-                'moves': len(moved_exceptions),
-                'total': len(deletion_exceptions) + len(moved_exceptions),
-            }
+RECURRENCE_FIELDS = (
+    'recurrence_type', 'recurrence_interval', 'recurrence_end_type',
+    'recurrence_end_date', 'recurrence_end_count',
+)
+
+def apply_rrule(pattern, text):
+    """Store a validated RRULE on the pattern and mirror it into the classic fields.
+
+    The classic fields keep older clients able to display the series.
+    Raises ValueError if the rule is invalid.
+    """
+    rule = compile_rrule(text, pattern['first_occurrence'])
+    pattern['rrule'] = rule.to_string()
+    pattern['recurrence_type'] = rule.freq.lower()
+    pattern['recurrence_interval'] = rule.interval
+    if rule.count is not None:
+        pattern['recurrence_end_type'] = 'count'
+        pattern['recurrence_end_count'] = rule.count
+    elif rule.until is not None:
+        pattern['recurrence_end_type'] = 'date'
+        pattern['recurrence_end_date'] = rule.until.isoformat()
+    else:
+        pattern['recurrence_end_type'] = 'never'
+
+def describe_pattern(pattern, layers):
+    """API view of a pattern: the record plus recurrence text, layer info and exceptions"""
+    pattern_copy = pattern.copy()
+    pattern_copy['recurrence_text'] = get_recurrence_text(pattern)
+
+    # Add layer metadata
+    layer_id = pattern.get('layer', 'personal')
+    if layer_id in layers:
+        pattern_copy['layer_color'] = layers[layer_id]['color']
+        pattern_copy['layer_name'] = layers[layer_id]['name']
+
+    # Build exceptions for this pattern
+    pattern_id = pattern['id']
+    deletion_exceptions = []
+    moved_exceptions = []
+
+    for event in exception_index.exceptions(pattern_id):
+        if event.get('is_deletion_exception'):
+            deletion_exceptions.append({
+                'id': event['id'],
+                'original_occurrence_date': event.get('original_occurrence_date'),
+            })
+        if event.get('is_moved_exception'):
+            moved_exceptions.append({
+                'id': event['id'],
+                'original_occurrence_date': event.get('original_occurrence_date'),
+                'new_start': event.get('start'),
+                'new_end': event.get('end'),
+                'title': event.get('title', pattern.get('title', '')),
+                'layer': event.get('layer', layer_id),
+            })
+
+    pattern_copy['exceptions'] = {
+        'deletions': deletion_exceptions,
+        'moves': moved_exceptions,
+        'counts': {
+            'deletions': len(deletion_exceptions),
+            'moves': len(moved_exceptions),
+            'total': len(deletion_exceptions) + len(moved_exceptions),
         }
+    }
+
+    return pattern_copy
 
-        pattern_list.append(pattern_copy)
+@patterns_bp.route('/recurring-patterns', methods=['GET'])
+@conditional_get('recurring_patterns', 'layers', 'events')
+def get_recurring_patterns():
+    """Get all recurring patterns with layer info and exceptions (NDJSON if requested)"""
+    snapshot = get_snapshot()
+    patterns = snapshot.recurring_patterns
+    layers = snapshot.layers
 
-    return jsonify(pattern_list)
+    pattern_list = (describe_pattern(pattern, layers) for pattern in patterns.values())
+    if wants_ndjson():
+        return ndjson_response(pattern_list)
+    return jsonify(list(pattern_list))
 
 @patterns_bp.route('/recurring-patterns/<pattern_id>', methods=['GET'])
 def get_recurring_pattern(pattern_id):
     """Get a specific recurring pattern"""
-    patterns = load_recurring_patterns()
-    if pattern_id not in patterns:
+    pattern = get_snapshot().record('recurring_patterns', pattern_id)
+    if pattern is None:
         return jsonify({'error': 'Pattern not found'}), 404
-    return jsonify(patterns[pattern_id])
+    return jsonify(pattern)
 
-@patterns_bp.route('/recurring-patterns', methods=['POST'])
-def create_recurring_pattern():
-    """Create a new recurring pattern"""
-    patterns = load_recurring_patterns()
-    data = request.json
-    
+def add_recurring_pattern(data):
+    """Create a new recurring pattern; returns (body, status)"""
     pattern_id = str(uuid.uuid4())
     
     # Parse the start datetime to extract date and time components
@@ -100,22 +128,24 @@ def create_recurring_pattern():
         'created_at': datetime.now().isoformat()
     }
     
-    patterns[pattern_id] = pattern
+    if data.get('rrule'):
+        try:
+            apply_rrule(pattern, data['rrule'])
+        except ValueError as e:
+            return {'error': f'Invalid rrule: {e}'}, 400
     
-    if save_recurring_patterns(patterns):
-        return jsonify(pattern), 201
+    if put_record('recurring_patterns', pattern):
+        return pattern, 201
     else:
-        return jsonify({'error': 'Failed to save recurring pattern'}), 500
+        return {'error': 'Failed to save recurring pattern'}, 500
 
-@patterns_bp.route('/recurring-patterns/<pattern_id>', methods=['PUT'])
-def update_recurring_pattern(pattern_id):
-    """Update a recurring pattern"""
-    patterns = load_recurring_patterns()
-    if pattern_id not in patterns:
-        return jsonify({'error': 'Pattern not found'}), 404
+def edit_recurring_pattern(pattern_id, data):
+    """Update a recurring pattern; returns (body, status)"""
+    current = get_snapshot().record('recurring_patterns', pattern_id)
+    if current is None:
+        return {'error': 'Pattern not found'}, 404
     
-    data = request.json
-    pattern = patterns[pattern_id]
+    pattern = dict(current)
     
     # Update pattern fields
     if 'title' in data:
@@ -146,46 +176,198 @@ def update_recurring_pattern(pattern_id):
     if 'recurrence_end_count' in data:
         pattern['recurrence_end_count'] = data['recurrence_end_count']
     
+    if data.get('rrule'):
+        try:
+            apply_rrule(pattern, data['rrule'])
+        except ValueError as e:
+            return {'error': f'Invalid rrule: {e}'}, 400
+    elif 'rrule' in data or any(field in data for field in RECURRENCE_FIELDS):
+        # Cleared explicitly, or replaced by a classic rule
+        pattern.pop('rrule', None)
+    elif pattern.get('rrule') and 'start' in data:
+        # Re-anchor the rule on the new first occurrence
+        try:
+            apply_rrule(pattern, pattern['rrule'])
+        except ValueError as e:
+            return {'error': f'Invalid rrule: {e}'}, 400
+    
     pattern['updated_at'] = datetime.now().isoformat()
     
-    if save_recurring_patterns(patterns):
-        return jsonify(pattern)
+    if put_record('recurring_patterns', pattern):
+        return pattern, 200
     else:
-        return jsonify({'error': 'Failed to update pattern'}), 500
+        return {'error': 'Failed to update pattern'}, 500
 
-@patterns_bp.route('/recurring-patterns/<pattern_id>', methods=['DELETE'])
-def delete_recurring_pattern(pattern_id):
-    """Delete a recurring pattern and its associated exceptions"""
-    patterns = load_recurring_patterns()
-    events = load_events()
-
-    if pattern_id not in patterns:
-        return jsonify({'error': 'Pattern not found'}), 404
-    
-    # Remove the pattern itself
-    del patterns[pattern_id]
+def remove_recurring_pattern(pattern_id, data=None):
+    """Delete a recurring pattern and its associated exceptions; returns (body, status)"""
+    if get_snapshot().record('recurring_patterns', pattern_id) is None:
+        return {'error': 'Pattern not found'}, 404
     
-    # Remove any exception events linked to this pattern
-    events_to_delete = []
-    for event_id, event in events.items():
-        if event.get('original_pattern_id') == pattern_id:
-            events_to_delete.append(event_id)
-
-    for event_id in events_to_delete:
-        del events[event_id]
-
-    # Save both files
-    pattern_saved = save_recurring_patterns(patterns)
-    events_saved = save_events(events)
-    
-    if pattern_saved and events_saved:
-        return jsonify({
+    # Find any exception events linked to this pattern
+    events_to_delete = [event['id'] for event in exception_index.exceptions(pattern_id)]
+
+    # Remove the pattern itself and its exceptions in one commit
+    if write_many({'recurring_patterns': ([], [pattern_id]), 'events': ([], events_to_delete)}):
+        return {
             'message': 'Pattern deleted successfully',
             'deleted_pattern': pattern_id, 
             'deleted_exceptions': len(events_to_delete)
-        }), 200
+        }, 200
     else:
-        return jsonify({'error': 'Failed to delete pattern'}), 500
+        return {'error': 'Failed to delete pattern'}, 500
+
+# Fields of a single occurrence that a move may change
+OCCURRENCE_FIELDS = ('title', 'start', 'end', 'location', 'description', 'all_day', 'layer')
+
+def _parse_datetime(value):
+    """datetime for an ISO string (a trailing Z is ignored), or None"""
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', ''))
+    except ValueError:
+        return None
+
+def _load_occurrence(pattern_id, occurrence_date):
+    """(pattern, generated instance, existing exceptions for the date), or an error (body, status)"""
+    try:
+        occurrence_date = date.fromisoformat(occurrence_date).isoformat()
+    except ValueError:
+        return None, ({'error': 'Occurrence date must be YYYY-MM-DD'}, 400)
+    pattern = get_snapshot().record('recurring_patterns', pattern_id)
+    if pattern is None:
+        return None, ({'error': 'Pattern not found'}, 404)
+    instance = find_occurrence(pattern, occurrence_date)
+    if instance is None:
+        return None, ({'error': 'Occurrence not found'}, 404)
+    exceptions = [
+        event for event in exception_index.exceptions(pattern_id)
+        if event.get('original_occurrence_date') == occurrence_date
+    ]
+    return (pattern, instance, exceptions), None
+
+def _exception_record(pattern, instance, existing, **fields):
+    """Exception event for one occurrence, reusing the id of an existing exception of the same kind"""
+    kind = 'is_moved_exception' if fields.get('is_moved_exception') else 'is_deletion_exception'
+    same_kind = next((event for event in existing if event.get(kind)), None)
+    record = {
+        'id': same_kind['id'] if same_kind else str(uuid.uuid4()),
+        'title': instance['title'],
+        'start': instance['start'],
+        'end': instance['end'],
+        'location': instance.get('location', ''),
+        'description': instance.get('description', ''),
+        'all_day': instance.get('all_day', False),
+        'layer': instance.get('layer', 'personal'),
+        'is_recurring_instance': False,
+        'is_deletion_exception': False,
+        'is_moved_exception': False,
+        'original_pattern_id': pattern['id'],
+        'original_occurrence_date': instance['occurrence_date'],
+        'created_at': same_kind.get('created_at') if same_kind else datetime.now().isoformat(),
+    }
+    record.update(fields)
+    if same_kind:
+        record['updated_at'] = datetime.now().isoformat()
+    return record
+
+def move_pattern_occurrence(pattern_id, occurrence_date, data):
+    """Move or edit one occurrence of a series; returns (body, status).
+
+    Creates the moved exception for that date (or replaces the one already
+    there, along with any deletion marker) in a single write. Fields not
+    given keep the occurrence's current values, except that moving only the
+    start moves the end with it so the occurrence keeps its length. Returns
+    the moved event as GET /api/events shows it.
+    """
+    found, error = _load_occurrence(pattern_id, occurrence_date)
+    if error:
+        return error
+    pattern, instance, existing = found
+
+    data = data or {}
+    moved = next((event for event in existing if event.get('is_moved_exception')), None)
+    current = moved or instance
+    fields = {key: data.get(key, current.get(key)) for key in OCCURRENCE_FIELDS}
+    start, end = _parse_datetime(fields['start']), _parse_datetime(fields['end'])
+    for key, value in (('start', start), ('end', end)):
+        if value is None:
+            return {'error': f'{key} must be an ISO datetime'}, 400
+    if 'start' in data and 'end' not in data:
+        # Keep the occurrence's duration
+        current_start = _parse_datetime(current.get('start'))
+        if current_start is not None and (current_start.tzinfo is None) == (end.tzinfo is None):
+            end = start + (end - current_start)
+            fields['end'] = end.isoformat(timespec='seconds' if end.second else 'minutes')
+            if str(fields['start']).endswith('Z'):
+                fields['end'] += 'Z'
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        return {'error': 'start and end must both have a UTC offset or neither'}, 400
+    if end < start:
+        return {'error': 'end must not be before start'}, 400
+
+    record = _exception_record(pattern, instance, existing, is_moved_exception=True, **fields)
+    stale = [event['id'] for event in existing if event['id'] != record['id']]
+    if not write_many({'events': ([record], stale)}):
+        return {'error': 'Failed to move occurrence'}, 500
+
+    return display_event(record, {pattern_id: pattern}, get_snapshot().layers), 200
+
+def remove_pattern_occurrence(pattern_id, occurrence_date, data=None):
+    """Delete one occurrence of a series; returns (body, status).
+
+    Records a deletion exception for that date, replacing any moved
+    exception, in a single write. Returns the ids of the events that
+    disappeared from the calendar along with the deletion marker.
+    """
+    found, error = _load_occurrence(pattern_id, occurrence_date)
+    if error:
+        return error
+    pattern, instance, existing = found
+
+    record = _exception_record(
+        pattern, instance, existing,
+        title='[DELETED]', description='Deleted recurring instance', is_deletion_exception=True,
+    )
+    stale = [event['id'] for event in existing if event['id'] != record['id']]
+    if not write_many({'events': ([record], stale)}):
+        return {'error': 'Failed to delete occurrence'}, 500
+
+    return {
+        'message': 'Occurrence deleted',
+        'removed': [instance['id'], *stale],
+        'pattern_id': pattern_id,
+        'occurrence_date': instance['occurrence_date'],
+        'exception': record,
+    }, 200
+
+@patterns_bp.route('/recurring-patterns', methods=['POST'])
+def create_recurring_pattern():
+    """Create a new recurring pattern"""
+    body, status = add_recurring_pattern(request.json)
+    return jsonify(body), status
+
+@patterns_bp.route('/recurring-patterns/<pattern_id>', methods=['PUT'])
+def update_recurring_pattern(pattern_id):
+    """Update a recurring pattern"""
+    body, status = edit_recurring_pattern(pattern_id, request.json)
+    return jsonify(body), status
+
+@patterns_bp.route('/recurring-patterns/<pattern_id>', methods=['DELETE'])
+def delete_recurring_pattern(pattern_id):
+    """Delete a recurring pattern and its associated exceptions"""
+    body, status = remove_recurring_pattern(pattern_id)
+    return jsonify(body), status
+
+@patterns_bp.route('/recurring-patterns/<pattern_id>/occurrences/<occurrence_date>', methods=['PUT', 'PATCH'])
+def move_occurrence(pattern_id, occurrence_date):
+    """Move or edit one occurrence of a series"""
+    body, status = move_pattern_occurrence(pattern_id, occurrence_date, request.get_json(silent=True))
+    return jsonify(body), status
+
+@patterns_bp.route('/recurring-patterns/<pattern_id>/occurrences/<occurrence_date>', methods=['DELETE'])
+def delete_occurrence(pattern_id, occurrence_date):
+    """Delete one occurrence of a series"""
+    body, status = remove_pattern_occurrence(pattern_id, occurrence_date)
+    return jsonify(body), status
 
 # Legacy compatibility routes
 @patterns_bp.route('/recurring-events', methods=['GET'])
@@ -2,14 +2,17 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 import uuid
-from utils.data_manager import load_tasks, save_tasks
+from utils.data_manager import put_record, delete_record
+from utils.http_cache import conditional_get
+from utils.snapshot import get_snapshot
 
 tasks_bp = Blueprint('tasks', __name__)
 
 @tasks_bp.route('/tasks', methods=['GET'])
+@conditional_get('tasks')
 def get_tasks():
     """Get all tasks, optionally filtered by date"""
-    tasks = load_tasks()
+    tasks = get_snapshot().tasks
     ymd = request.args.get('date')
     
     if ymd:
@@ -19,11 +22,8 @@ def get_tasks():
     
     return jsonify(list(tasks.values()))
 
-@tasks_bp.route('/tasks', methods=['POST'])
-def create_task():
-    """Create a new task"""
-    tasks = load_tasks()
-    data = request.json
+def add_task(data):
+    """Create a new task; returns (body, status)"""
     task_id = str(uuid.uuid4())
     
     task = {
@@ -38,22 +38,18 @@ def create_task():
         'updated_at': datetime.now().isoformat()
     }
     
-    tasks[task_id] = task
-    
-    if save_tasks(tasks):
-        return jsonify(task), 201
+    if put_record('tasks', task):
+        return task, 201
     else:
-        return jsonify({'error': 'Failed to save task'}), 500
+        return {'error': 'Failed to save task'}, 500
 
-@tasks_bp.route('/tasks/<task_id>', methods=['PATCH', 'PUT'])
-def update_task(task_id):
-    """Update a task"""
-    tasks = load_tasks()
-    if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
+def edit_task(task_id, data):
+    """Update a task; returns (body, status)"""
+    current = get_snapshot().record('tasks', task_id)
+    if current is None:
+        return {'error': 'Task not found'}, 404
     
-    data = request.json
-    task = tasks[task_id]
+    task = dict(current)
     
     # Update allowed fields
     updatable_fields = ['title', 'details', 'status', 'date', 'due_at']
@@ -62,23 +58,36 @@ def update_task(task_id):
             task[key] = data[key]
     
     task['updated_at'] = datetime.now().isoformat()
-    tasks[task_id] = task
     
-    if save_tasks(tasks):
-        return jsonify(task)
+    if put_record('tasks', task):
+        return task, 200
     else:
-        return jsonify({'error': 'Failed to update task'}), 500
+        return {'error': 'Failed to update task'}, 500
+
+def remove_task(task_id, data=None):
+    """Delete a task; returns (body, status)"""
+    if get_snapshot().record('tasks', task_id) is None:
+        return {'error': 'Task not found'}, 404
+    
+    if delete_record('tasks', task_id):
+        return {'message': 'Task deleted successfully'}, 200
+    else:
+        return {'error': 'Failed to delete task'}, 500
+
+@tasks_bp.route('/tasks', methods=['POST'])
+def create_task():
+    """Create a new task"""
+    body, status = add_task(request.json)
+    return jsonify(body), status
+
+@tasks_bp.route('/tasks/<task_id>', methods=['PATCH', 'PUT'])
+def update_task(task_id):
+    """Update a task"""
+    body, status = edit_task(task_id, request.json)
+    return jsonify(body), status
 
 @tasks_bp.route('/tasks/<task_id>', methods=['DELETE'])
 def delete_task(task_id):
     """Delete a task"""
-    tasks = load_tasks()
-    if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
-    
-    del tasks[task_id]
-    
-    if save_tasks(tasks):
-        return jsonify({'message': 'Task deleted successfully'}), 200
-    else:
-        return jsonify({'error': 'Failed to delete task'}), 500
\ No newline at end of file
+    body, status = remove_task(task_id)
+    return jsonify(body), status
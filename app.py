@@ -4,6 +4,9 @@ from api.events import events_bp
 from api.layers import layers_bp
 from api.tasks import tasks_bp
 from api.recurring_patterns import patterns_bp
+from api.changes import changes_bp
+from api.calendar import calendar_bp
+from api.batch import batch_bp
 from utils.data_manager import ensure_data_directory
 
 def create_app():
@@ -17,6 +20,9 @@ def create_app():
     app.register_blueprint(layers_bp, url_prefix='/api')
     app.register_blueprint(tasks_bp, url_prefix='/api')
     app.register_blueprint(patterns_bp, url_prefix='/api')
+    app.register_blueprint(changes_bp, url_prefix='/api')
+    app.register_blueprint(calendar_bp, url_prefix='/api')
+    app.register_blueprint(batch_bp, url_prefix='/api')
     
     # Main route
     @app.route('/')
@@ -0,0 +1,82 @@
+# benchmarks/recurrence_expansion.py - Per-Pattern Loop vs Batch Expansion
+#
+#   python -m benchmarks.recurrence_expansion [patterns] [repeats]
+#
+# Expands synthetic daily/weekly/monthly patterns over one year with the
+# per-pattern loop (expand_pattern_in_window) and with expand_patterns_batch,
+# both with and without building the instance dicts.
+import random
+import sys
+import time
+
+from utils import recurring_utils
+from utils.recurring_utils import expand_pattern_in_window, expand_patterns_batch
+
+WINDOW_START = '2025-01-01'
+WINDOW_END = '2026-01-01'
+
+def make_patterns(count, seed=42):
+    rng = random.Random(seed)
+    patterns = []
+    for i in range(count):
+        recurrence_type = rng.choice(['daily', 'daily', 'weekly', 'weekly', 'monthly'])
+        patterns.append({
+            'id': f'bench-{i}',
+            'title': f'Pattern {i}',
+            'first_occurrence': f'{rng.randint(2020, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'start_time': '09:00',
+            'end_time': '10:00',
+            'recurrence_type': recurrence_type,
+            'recurrence_interval': rng.choice([1, 1, 2]),
+            'recurrence_end_type': 'never',
+            'layer': 'work',
+            'created_at': '2020-01-01T00:00:00',
+        })
+    return patterns
+
+def make_exceptions(patterns, seed=7):
+    rng = random.Random(seed)
+    return {
+        pattern['id']: {f'2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}' for _ in range(5)}
+        for pattern in patterns
+    }
+
+def best_of(repeats, fn):
+    best, result = None, None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main(count=1000, repeats=3):
+    patterns = make_patterns(count)
+    exceptions = make_exceptions(patterns)
+    exception_dates_for = exceptions.__getitem__
+
+    def loop():
+        return sum(
+            len(expand_pattern_in_window(pattern, WINDOW_START, WINDOW_END, exceptions[pattern['id']]))
+            for pattern in patterns
+        )
+
+    def batch_dates():
+        return sum(len(expanded) for expanded in
+                   expand_patterns_batch(patterns, WINDOW_START, WINDOW_END, exception_dates_for))
+
+    def batch_instances():
+        return sum(sum(1 for _ in expanded) for expanded in
+                   expand_patterns_batch(patterns, WINDOW_START, WINDOW_END, exception_dates_for))
+
+    print(f"{count} patterns x 1 year, best of {repeats} "
+          f"(numpy {'available' if recurring_utils.np is not None else 'not installed'})")
+    baseline = None
+    for name, fn in [('loop', loop), ('batch (dates)', batch_dates), ('batch (instances)', batch_instances)]:
+        elapsed, instances = best_of(repeats, fn)
+        baseline = baseline or elapsed
+        print(f"  {name:<18} {elapsed * 1000:9.1f} ms  {instances} instances  x{baseline / elapsed:.1f}")
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,155 @@
+# action_registry.py
+
+from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from calendarTools import (
+    fetch_events, get_free_slots, create_event, reschedule_event, delete_event,
+    summarize_day, block_time, shift_events_batch, find_event_by_keyword,
+    list_holding, create_holding_item, move_event_to_holding, promote_holding_to_event,
+    plan_snapshot,
+)
+
+READ = "read"
+WRITE = "write"
+
+# Upper bound on the reads of one plan running at the same time
+READ_WORKERS = int(os.environ.get("L4_READ_WORKERS", 4))
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """
+    One plan action type: how to run it and whether it reads or writes.
+
+    Reads may run concurrently against one snapshot. Writes always run one
+    at a time, in plan order, after the reads.
+    """
+    name: str
+    kind: str
+    run: Callable[[Dict[str, Any]], Any]
+
+
+ACTIONS: Dict[str, ActionSpec] = {}
+
+
+def register(name: str, kind: str, run: Callable[[Dict[str, Any]], Any]) -> ActionSpec:
+    spec = ACTIONS[name] = ActionSpec(name, kind, run)
+    return spec
+
+
+# READS
+register("fetch_events", READ, lambda p: fetch_events(
+    date=p.get("date"),
+    start_date=p.get("start_date"),
+    end_date=p.get("end_date"),
+    filters=p.get("filters"),
+))
+register("get_free_slots", READ, lambda p: get_free_slots(
+    date=p["date"],
+    min_duration=int(p.get("min_duration") or 30),
+    start_range=p.get("start_range") or "09:00",
+    end_range=p.get("end_range") or "18:00",
+))
+register("summarize_day", READ, lambda p: summarize_day(p["date"]))
+register("find_event_by_keyword", READ, lambda p: find_event_by_keyword(
+    query=p["query"],
+    date_range=tuple(p["date_range"]) if p.get("date_range") else None,
+))
+register("list_holding", READ, lambda p: list_holding())
+
+# WRITES
+register("create_event", WRITE, lambda p: create_event(
+    title=p["title"],
+    start_time=p["start_time"],
+    end_time=p["end_time"],
+    attendees=p.get("attendees"),
+    location=p.get("location"),
+    description=p.get("description"),
+    layer=p.get("layer", "work"),
+    all_day=p.get("all_day", False),
+))
+register("reschedule_event", WRITE, lambda p: reschedule_event(
+    event_id=p["event_id"],
+    new_start=p["new_start"],
+    new_end=p["new_end"],
+    notify_attendees=p.get("notify_attendees", False),
+))
+register("delete_event", WRITE, lambda p: delete_event(
+    event_id=p["event_id"],
+    reason=p.get("reason"),
+))
+register("block_time", WRITE, lambda p: block_time(
+    start_time=p["start_time"],
+    end_time=p["end_time"],
+    reason=p.get("reason", "Blocked time"),
+))
+register("shift_events_batch", WRITE, lambda p: shift_events_batch(
+    source_date=p["source_date"],
+    target_date=p["target_date"],
+))
+
+# Holding writes
+register("create_holding", WRITE, lambda p: create_holding_item(
+    title=p["title"],
+    notes=p.get("notes"),
+    layer=p.get("layer", "work"),
+))
+register("move_to_holding", WRITE, lambda p: move_event_to_holding(
+    event_id=p["event_id"],
+    reason=p.get("reason"),
+))
+# plans name the holding item "item_id" (see the L3 prompt)
+register("promote_holding", WRITE, lambda p: promote_holding_to_event(
+    event_id=p["item_id"],
+    start_time=p["start_time"],
+    end_time=p["end_time"],
+    location=p.get("location"),
+    attendees=p.get("attendees"),
+))
+
+READ_ACTIONS = frozenset(name for name, spec in ACTIONS.items() if spec.kind == READ)
+WRITE_ACTIONS = frozenset(name for name, spec in ACTIONS.items() if spec.kind == WRITE)
+
+
+def run_action(act_type: str, params: Dict[str, Any], kind: Optional[str] = None) -> Any:
+    """Run one action; with `kind`, refuse action types of the other class."""
+    spec = ACTIONS.get(act_type)
+    if spec is None:
+        raise ValueError(f"Unknown action type {act_type}")
+    if kind is not None and spec.kind != kind:
+        raise ValueError(f"{act_type} is not a {kind} action")
+    return spec.run(params)
+
+
+def _run_read(snapshot: Any, act_type: str, params: Dict[str, Any]) -> Any:
+    with plan_snapshot(snapshot):
+        return run_action(act_type, params, kind=READ)
+
+
+def run_reads(steps: List[Tuple[str, Dict[str, Any]]],
+              max_workers: int = READ_WORKERS) -> Iterator[Tuple[int, Any, Optional[Exception]]]:
+    """
+    Run a plan's reads on a bounded thread pool, all against one plan_snapshot().
+
+    `steps` is [(action type, params), ...] in plan order. Yields
+    (index, output, error) as each read finishes, so callers can stream
+    progress; sort by index to rebuild plan order. A step that is not a read
+    yields a ValueError and is not run.
+    """
+    if not steps:
+        return
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(steps))),
+                              thread_name_prefix="l4-read")
+    try:
+        with plan_snapshot() as snapshot:
+            running = {pool.submit(_run_read, snapshot, act_type, params): i
+                       for i, (act_type, params) in enumerate(steps)}
+            for future in as_completed(running):
+                error = future.exception()
+                yield running[future], (None if error else future.result()), error
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -16,22 +16,9 @@ import calendar
 from typing import Any, Dict, Optional
 from zoneinfo import ZoneInfo  # Python 3.9+
 
-from calendarTools import (
-    fetch_events, get_free_slots, create_event, reschedule_event, delete_event,
-    summarize_day, block_time, shift_events_batch, find_event_by_keyword,
-    # Holding helpers
-    list_holding,
-    create_holding_item as create_holding,
-    move_event_to_holding as move_to_holding,
-    promote_holding_to_event as promote_holding,
-)
-
-from calendarTools import handle_action
-
-# AFTER
-READ_ACTIONS  = {"fetch_events","summarize_day","find_event_by_keyword","get_free_slots","list_holding"}
-WRITE_ACTIONS = {"create_event","reschedule_event","delete_event","block_time","shift_events_batch",
-                 "move_to_holding","promote_holding"}
+from calendarTools import handle_action, store_transaction, StoreTransactionError
+
+from action_registry import READ_ACTIONS, WRITE_ACTIONS, WRITE, run_action, run_reads
 
 _TIME_ONLY_RE = re.compile(r'^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$', re.I)
 
@@ -58,6 +45,10 @@ load_dotenv()
 from routes_policy_orchestrator import policy_bp
 app.register_blueprint(policy_bp)
 
+# Change notifications for calendarTools writes: the calendar app's feed and SSE stream
+from api.changes import changes_bp
+app.register_blueprint(changes_bp, url_prefix="/api")
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
@@ -404,6 +395,8 @@ def layer4_execute(plan: dict, session_id: str | None = None, allow_writes: bool
 
     - Reads in plan["required_actions"] are always executed.
     - Writes in plan["proposed_writes"] are only executed when allow_writes=True.
+    - Reads run under one plan_snapshot() (see run_reads), so they all see the same state;
+      writes run after it is released and each starts from the store as it is then.
     - Updates/persists a focus_set in the context tracker for continuity.
     - Returns:
         {
@@ -435,63 +428,22 @@ def layer4_execute(plan: dict, session_id: str | None = None, allow_writes: bool
         fs = context_tracker.get_focus_set(session_id) or {}
         print(f"[L4] Retrieved focus_set for session {session_id}: {json.dumps(fs, indent=2)}")
 
-    READ_ACTIONS  = {"fetch_events","summarize_day","find_event_by_keyword","get_free_slots","list_holding"}
-    WRITE_ACTIONS = {"create_event","reschedule_event","delete_event","block_time","shift_events_batch",
-                    "move_to_holding","promote_holding"}
-
-    def _dispatch(act_type: str, params: dict):
-        # READS
-        if act_type == "fetch_events":
-            return fetch_events(
-                date=params.get("date"),
-                start_date=params.get("start_date"),
-                end_date=params.get("end_date"),
-                filters=params.get("filters"),
-            )
-        if act_type == "get_free_slots":
-            return get_free_slots(
-                date=params["date"],
-                min_duration=params.get("min_duration", 30),
-                start_range=params.get("start_range"),
-                end_range=params.get("end_range"),
-            )
-        if act_type == "summarize_day":
-            return summarize_day(params["date"])
-        if act_type == "find_event_by_keyword":
-            return find_event_by_keyword(**params)
-        if act_type == "list_holding":                 # ← add
-            return list_holding()
-
-        # WRITES
-        if act_type == "create_event":
-            return create_event(**params)
-        if act_type == "reschedule_event":
-            return reschedule_event(**params)
-        if act_type == "delete_event":
-            return delete_event(**params)
-        if act_type == "block_time":
-            return block_time(**params)
-        if act_type == "shift_events_batch":
-            return shift_events_batch(**params)
-
-        # Holding writes
-        if act_type == "create_holding":
-            return create_holding(**params)            # alias to create_holding_item
-        if act_type == "move_to_holding":
-            return move_to_holding(**params)           # alias to move_event_to_holding
-        if act_type == "promote_holding":
-            return promote_holding(**params)           # alias to promote_holding_to_event
-
-        raise ValueError(f"Unknown action type {act_type}")
-
     # ===== 1) RUN READS =====
+    # Independent reads run concurrently; their outcomes are then handled in plan order
+    steps = []
     for idx, act in enumerate(actions, start=1):
-        act_type = act.get("type")
         raw_params = act.get("parameters", {}) or {}
         params, warns = normalize_datetime_params(raw_params)
         if warns:
             print(f"[L4] Normalization warnings (read {idx}):", warns)
+        steps.append((act.get("type"), params))
 
+    read_positions = [i for i, (act_type, _) in enumerate(steps) if act_type in READ_ACTIONS]
+    outcomes = {}
+    for n, out, error in run_reads([steps[i] for i in read_positions]):
+        outcomes[read_positions[n]] = (out, error)
+
+    for idx, (act_type, params) in enumerate(steps, start=1):
         print(f"\n--- [L4] READ {idx} --- {act_type} :: {params}")
 
         trace_entry = {
@@ -508,7 +460,9 @@ def layer4_execute(plan: dict, session_id: str | None = None, allow_writes: bool
                 trace_entry["status"] = "error"
                 status = "error"
             else:
-                out = _dispatch(act_type, params)
+                out, error = outcomes[idx - 1]
+                if error is not None:
+                    raise error
                 results.append({"action": act_type, "status": "success", "output": out})
                 trace_entry["status"] = "completed"
                 trace_entry["output"] = out
@@ -541,7 +495,7 @@ def layer4_execute(plan: dict, session_id: str | None = None, allow_writes: bool
                     )
                     final_text = msg
         except Exception as e:
-            results.append({"action": act.get("type"), "status": "exception", "error": str(e)})
+            results.append({"action": act_type, "status": "exception", "error": str(e)})
             trace_entry["status"] = "error"
             trace_entry["output"] = {"error": str(e)}
             status = "error"
@@ -578,7 +532,7 @@ def layer4_execute(plan: dict, session_id: str | None = None, allow_writes: bool
                         trace_entry["status"] = "error"
                         status = "error"
                     else:
-                        out = _dispatch(act_type, params)
+                        out = run_action(act_type, params)
                         results.append({"action": act_type, "status": "success", "output": out})
                         trace_entry["status"] = "completed"
                 except Exception as e:
@@ -714,63 +668,14 @@ def execute_plan_stream():
     if not plan:
         return Response("No pending plan", status=404)
 
-    READ_ACTIONS  = {"fetch_events", "get_free_slots", "summarize_day",
-                 "find_event_by_keyword", "list_holding"}
-    WRITE_ACTIONS = {"create_event", "reschedule_event", "delete_event",
-                    "block_time", "shift_events_batch",
-                    "create_holding", "move_to_holding", "promote_holding"}
-
-    def _dispatch(act_type: str, params: dict):
-        # READS
-        if act_type == "fetch_events":
-            return fetch_events(
-                date=params.get("date"),
-                start_date=params.get("start_date"),
-                end_date=params.get("end_date"),
-                filters=params.get("filters"),
-            )
-        if act_type == "get_free_slots":
-            return get_free_slots(
-                date=params["date"],
-                min_duration=params.get("min_duration", 30),
-                start_range=params.get("start_range"),
-                end_range=params.get("end_range"),
-            )
-        if act_type == "summarize_day":
-            return summarize_day(params["date"])
-        if act_type == "find_event_by_keyword":
-            return find_event_by_keyword(**params)
-        if act_type == "list_holding":
-            return list_holding()
-
-        # WRITES
-        if act_type == "create_event":
-            return create_event(**params)
-        if act_type == "reschedule_event":
-            return reschedule_event(**params)
-        if act_type == "delete_event":
-            return delete_event(**params)
-        if act_type == "block_time":
-            return block_time(**params)
-        if act_type == "shift_events_batch":
-            return shift_events_batch(**params)
-
-        # Holding writes
-        if act_type == "create_holding":
-            return create_holding(**params)          # alias to create_holding_item
-        if act_type == "move_to_holding":
-            return move_to_holding(**params)         # alias to move_event_to_holding
-        if act_type == "promote_holding":
-            return promote_holding(**params)         # alias to promote_holding_to_event
-
-        raise ValueError(f"Unknown action type {act_type}")
-
     @stream_with_context
     def generate():
         # 1) signal start
         yield "event: start\ndata: {}\n\n"
 
-        # 2) run READS
+        # 2) run READS concurrently against one snapshot of the store;
+        #    every step is announced first, then completed as it finishes
+        steps = []
         for idx, act in enumerate(plan.get("required_actions") or [], start=1):
             act_type = act.get("type")
             raw_params = act.get("parameters", {}) or {}
@@ -782,17 +687,17 @@ def execute_plan_stream():
                 "type": "read",
                 "status": "in_progress"
             }
+            steps.append((step, act_type, params))
             yield f"data: {json.dumps(step)}\n\n"
 
-            try:
-                if act_type not in READ_ACTIONS:
-                    raise ValueError(f"{act_type} is not a read action")
-                out = _dispatch(act_type, params)
+        for n, out, error in run_reads([(act_type, params) for _, act_type, params in steps]):
+            step = steps[n][0]
+            if error is None:
                 step["status"] = "completed"
                 step["output"] = out
-            except Exception as e:
+            else:
                 step["status"] = "error"
-                step["output"] = {"error": str(e)}
+                step["output"] = {"error": str(error)}
             yield f"data: {json.dumps(step)}\n\n"
 
         # 3) run WRITES
@@ -810,9 +715,7 @@ def execute_plan_stream():
             yield f"data: {json.dumps(step)}\n\n"
 
             try:
-                if act_type not in WRITE_ACTIONS:
-                    raise ValueError(f"{act_type} is not a write action")
-                out = _dispatch(act_type, params)
+                out = run_action(act_type, params, kind=WRITE)
                 step["status"] = "completed"
                 step["output"] = out
             except Exception as e:
@@ -1675,47 +1578,37 @@ def confirm_actions():
     status    = "ok"
     final_msg = "All changes applied."
 
-    for idx, act in enumerate(writes, start=1):
-        act_type   = (act or {}).get("type")
-        raw_params = (act or {}).get("parameters", {}) or {}
-        try:
-            # Make sure your normalizer ignores non-datetime fields and None.
-            params, warns = normalize_datetime_params(raw_params)
-            if warns:
-                print(f"[/confirm_actions] normalize warnings for {act_type}:", warns)
-
-            if act_type == "block_time":
-                out = block_time(**params)
-            elif act_type == "create_event":
-                out = create_event(**params)
-            elif act_type == "reschedule_event":
-                out = reschedule_event(**params)
-            elif act_type == "delete_event":
-                out = delete_event(**params)
-            elif act_type == "shift_events_batch":
-                out = shift_events_batch(**params)
-
-            # NEW holding writes
-            elif act_type == "move_to_holding":
-                # expects: {"event_id":"...", "reason"?: "..."}
-                out = move_event_to_holding(**params)
-            elif act_type == "promote_holding":
-                # expects: {"event_id":"...","start_time":"YYYY-MM-DDTHH:MM:SS","end_time":"YYYY-MM-DDTHH:MM:SS"}
-                out = promote_holding_to_event(**params)
-
-            else:
-                out = {"status": "error", "error": f"Unknown write action {act_type}"}
+    # All confirmed writes share one store transaction: one load, one save,
+    # and nothing is applied if any of them fails
+    try:
+        with store_transaction():
+            for idx, act in enumerate(writes, start=1):
+                act_type   = (act or {}).get("type")
+                raw_params = (act or {}).get("parameters", {}) or {}
+                try:
+                    # Make sure your normalizer ignores non-datetime fields and None.
+                    params, warns = normalize_datetime_params(raw_params)
+                    if warns:
+                        print(f"[/confirm_actions] normalize warnings for {act_type}:", warns)
 
-            results.append({"action": act_type, "status": "success", "output": out})
-            if isinstance(out, dict) and out.get("status") == "error":
-                status = "error"
+                    out = run_action(act_type, params, kind=WRITE)
+                except Exception as e:
+                    results.append({"action": act_type, "status": "error", "error": str(e)})
+                    raise StoreTransactionError(f"{act_type} failed: {e}")
 
-        except Exception as e:
-            status = "error"
-            results.append({"action": act_type, "status": "error", "error": str(e)})
+                results.append({"action": act_type, "status": "success", "output": out})
+                if isinstance(out, dict) and out.get("status") == "error":
+                    results[-1]["status"] = "error"
+                    raise StoreTransactionError(f"{act_type} failed: {out.get('message') or out.get('error')}")
+    except StoreTransactionError as e:
+        print("[/confirm_actions] rolled back:", e)
+        status = "error"
+        for r in results:
+            if r["status"] == "success":
+                r["status"] = "rolled_back"
 
     if status != "ok":
-        final_msg = "Some changes failed. Check logs."
+        final_msg = "Some changes failed, so none were applied. Check logs."
 
     # OPTIONAL: kick L5 to generate a human-y success sentence
     # (only if you already have layer5_synthesis in this module)
@@ -10,6 +10,9 @@ Public API is unchanged:
   fetch_events, get_free_slots, create_event, reschedule_event,
   delete_event, summarize_day, block_time, shift_events_batch,
   find_event_by_keyword, resolve_relative_date, resolve_relative_datetime, etc.
+
+Several writes can be grouped with `store_transaction()`: one load, one
+validated save, and nothing written if any step fails.
 """
 
 from __future__ import annotations
@@ -19,9 +22,22 @@ import os
 import re
 import uuid
 from datetime import date as _date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import functools
 import itertools
 import random
+import sys
+import threading
+from contextlib import contextmanager
+
+from utility.interval_index import IntervalIndex
+
+# The calendar app's packages (utils/, api/) live one directory up
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_ROOT not in sys.path:
+    sys.path.append(_APP_ROOT)
+
+from utils.change_feed import change_feed
 
 # -------- Mode toggle --------
 USE_JSON_STORE = True
@@ -137,19 +153,319 @@ def _load_store() -> Dict[str, Dict[str, Any]]:
         print(f"[calendarTools] Failed to load store: {e}")
         return {}
 
-def _save_store(store: Dict[str, Dict[str, Any]]) -> None:
+def _save_store(store: Dict[str, Dict[str, Any]]) -> bool:
+    """Write the store via a temp file + rename, so readers never see a half-written file."""
     if not USE_JSON_STORE:
-        return
+        return True
+    tmp_path = EVENT_STORE_PATH + ".tmp"
     try:
         os.makedirs(os.path.dirname(EVENT_STORE_PATH) or ".", exist_ok=True)
-        with open(EVENT_STORE_PATH, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(store, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, EVENT_STORE_PATH)
+        return True
     except Exception as e:
         print(f"[calendarTools] Failed to save store: {e}")
+        return False
 
 def _new_id() -> str:
     return str(uuid.uuid4())
 
+# ------------------------------
+# Interval Index over the store
+# ------------------------------
+
+class _StoreIndex:
+    """
+    Read-only copy of the store plus an interval index over its scheduled events.
+
+    `records` holds every event (holding items included); `events` is the
+    scheduled subset the interval index covers. Once published as _INDEX it
+    is never changed in place, so readers need no lock: writes apply their
+    changes to a copy() and swap that in.
+    """
+
+    def __init__(self, stamp: Any, store: Dict[str, Dict[str, Any]]):
+        self.stamp = stamp
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.events: Dict[str, Dict[str, Any]] = {}
+        entries = []
+        for ev in store.values():
+            rec = self.records[ev["id"]] = dict(ev)
+            span = _event_span(ev)
+            if span:
+                self.events[ev["id"]] = rec
+                entries.append((span[0], span[1], ev["id"]))
+        self.index = IntervalIndex(entries)
+
+    def put(self, ev: Dict[str, Any]) -> None:
+        rec = self.records[ev["id"]] = dict(ev)
+        span = _event_span(ev)
+        if span:
+            self.events[ev["id"]] = rec
+            self.index.add(ev["id"], span[0], span[1])
+        else:
+            self.events.pop(ev["id"], None)
+            self.index.discard(ev["id"])
+
+    def remove(self, ev_id: str) -> None:
+        self.records.pop(ev_id, None)
+        self.events.pop(ev_id, None)
+        self.index.discard(ev_id)
+
+    def copy(self, stamp: Any) -> "_StoreIndex":
+        """Unpublished copy to apply writes to; records are shared, containers are not."""
+        other = _StoreIndex.__new__(_StoreIndex)
+        other.stamp = stamp
+        other.records = dict(self.records)
+        other.events = dict(self.events)
+        other.index = self.index.copy()
+        return other
+
+    def store_copy(self) -> Dict[str, Dict[str, Any]]:
+        """The store as _load_store() would return it, without re-reading the file."""
+        return {ev_id: dict(ev) for ev_id, ev in self.records.items()}
+
+_INDEX: Optional[_StoreIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+def _event_span(ev: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """(start, end) for indexable events; holding items and unscheduled events are skipped."""
+    if ev.get("status") == "holding":
+        return None
+    s = ev.get("start"); e = ev.get("end")
+    if not s or not e:
+        return None
+    return _ensure_seconds(s), _ensure_seconds(e)
+
+def _store_stamp() -> Any:
+    try:
+        st = os.stat(EVENT_STORE_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _get_index() -> _StoreIndex:
+    """Interval index for the current store, rebuilt only when the file changed underneath us."""
+    global _INDEX
+    with _INDEX_LOCK:
+        stamp = _store_stamp()
+        if _INDEX is None or _INDEX.stamp != stamp:
+            _INDEX = _StoreIndex(stamp, _load_store())
+        return _INDEX
+
+def _read_index() -> _StoreIndex:
+    """
+    What reads see: inside a store_transaction() its own index (the store
+    with the transaction's pending writes), else the running plan's
+    snapshot if there is one, else the current index.
+    """
+    uow = getattr(_ACTIVE, "uow", None)
+    if uow is not None:
+        return uow.index
+    pinned = getattr(_ACTIVE, "snapshot", None)
+    return pinned if pinned is not None else _get_index()
+
+def _save_store_indexed(store: Dict[str, Dict[str, Any]],
+                        changed: Tuple[str, ...] = (),
+                        removed: Tuple[str, ...] = ()) -> bool:
+    """_save_store, then apply the same changes to a copy of the interval index and swap it in."""
+    global _INDEX
+    with _INDEX_LOCK:
+        before = _store_stamp()
+        if not _save_store(store):
+            return False
+        # Same feed (and /api/changes/stream) as the calendar blueprints' writes
+        change_feed.record("events", [store[ev_id] for ev_id in changed], removed)
+        if _INDEX is None or _INDEX.stamp != before:
+            _INDEX = None
+            return True
+        # Readers (and pinned plans) may still be iterating the current one
+        index = _INDEX.copy(_store_stamp())
+        for ev_id in removed:
+            index.remove(ev_id)
+        for ev_id in changed:
+            index.put(store[ev_id])
+        _INDEX = index
+        return True
+
+# ------------------------------
+# Unit of work
+# ------------------------------
+
+class StoreTransactionError(Exception):
+    """A store transaction was rolled back; nothing it changed was written."""
+
+class _UnitOfWork:
+    """
+    Pending changes against one in-memory copy of the store (loaded on first use).
+
+    `index` indexes that copy, pending changes included, so reads made inside
+    the transaction see its earlier writes.
+    """
+
+    def __init__(self):
+        self._store: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index: Optional[_StoreIndex] = None
+        # published index the store was copied from, reused to build `index`
+        self._source: Optional[_StoreIndex] = None
+        # insertion-ordered id sets
+        self.changed: Dict[str, None] = {}
+        self.removed: Dict[str, None] = {}
+        self.failed = False
+
+    @property
+    def store(self) -> Dict[str, Dict[str, Any]]:
+        if self._store is None:
+            pinned = getattr(_ACTIVE, "snapshot", None)
+            if pinned is not None and pinned.stamp == _store_stamp():
+                self._source = pinned
+                self._store = pinned.store_copy()
+            else:
+                self._store = _load_store()
+        return self._store
+
+    @property
+    def index(self) -> _StoreIndex:
+        if self._index is None:
+            store = self.store
+            if self._source is None:
+                self._index = _StoreIndex(None, store)
+            else:
+                self._index = self._source.copy(None)
+                for ev_id in self.removed:
+                    self._index.remove(ev_id)
+                for ev_id in self.changed:
+                    self._index.put(store[ev_id])
+        return self._index
+
+    def get(self, ev_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(ev_id)
+
+    def put(self, ev: Dict[str, Any]) -> None:
+        self.store[ev["id"]] = ev
+        _ACTIVE.snapshot = None
+        self.removed.pop(ev["id"], None)
+        self.changed[ev["id"]] = None
+        if self._index is not None:
+            self._index.put(ev)
+
+    def remove(self, ev_id: str) -> None:
+        self.store.pop(ev_id, None)
+        _ACTIVE.snapshot = None
+        self.changed.pop(ev_id, None)
+        self.removed[ev_id] = None
+        if self._index is not None:
+            self._index.remove(ev_id)
+
+    def validate(self) -> List[str]:
+        """Problems with the changed events (scheduled events need a valid start <= end)."""
+        errors = []
+        for ev_id in self.changed:
+            ev = self.store[ev_id]
+            if ev.get("status") == "holding":
+                continue
+            s, e = ev.get("start"), ev.get("end")
+            if not s or not e:
+                errors.append(f"Event '{ev_id}' needs both start and end.")
+                continue
+            try:
+                if _parse_iso_dt(e) < _parse_iso_dt(s):
+                    errors.append(f"Event '{ev_id}' ends before it starts.")
+            except ValueError:
+                errors.append(f"Event '{ev_id}' has an invalid start/end.")
+        return errors
+
+_STORE_LOCK = threading.RLock()
+_ACTIVE = threading.local()
+
+@contextmanager
+def store_transaction():
+    """
+    Load the store once, apply any number of writes, validate, save once.
+
+    Inside the block every write helper here (create_event, reschedule_event,
+    delete_event, holding moves, ...) changes one in-memory copy of the store
+    instead of loading and saving the file itself. On exit the changed events
+    are validated and written in a single save. If the block raises, a nested
+    transaction failed, or validation fails, nothing is written and the
+    outermost block raises StoreTransactionError (or the original exception).
+    Nested blocks join the outermost one. Reads made inside the block
+    (fetch_events and everything built on it, list_holding) see the
+    block's pending writes.
+    """
+    current = getattr(_ACTIVE, "uow", None)
+    if current is not None:
+        try:
+            yield current
+        except BaseException:
+            current.failed = True
+            raise
+        return
+
+    with _STORE_LOCK:
+        uow = _UnitOfWork()
+        _ACTIVE.uow = uow
+        try:
+            yield uow
+        finally:
+            _ACTIVE.uow = None
+        if uow.failed:
+            raise StoreTransactionError("A step of the transaction failed; nothing was saved.")
+        if not (uow.changed or uow.removed):
+            return
+        errors = uow.validate()
+        if errors:
+            raise StoreTransactionError(" ".join(errors))
+        if not _save_store_indexed(uow.store, changed=tuple(uow.changed), removed=tuple(uow.removed)):
+            raise StoreTransactionError("Failed to save the event store.")
+
+def _transaction_result(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Run a write helper that uses store_transaction(); called on its own, a
+    rolled-back transaction comes back as an error result like any other
+    failure. Inside an outer transaction the error propagates so the
+    outermost block rolls back everything.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if getattr(_ACTIVE, "uow", None) is not None:
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        except StoreTransactionError as exc:
+            return {"status": "error", "message": f"{exc} Nothing was saved."}
+    return wrapper
+
+@contextmanager
+def plan_snapshot(snapshot: Optional[_StoreIndex] = None):
+    """
+    Pin one read-only view of the store for every read in the block.
+
+    fetch_events, get_free_slots, summarize_day, find_event_by_keyword and
+    list_holding all read the pinned snapshot (store plus interval index)
+    instead of checking the file again, so a plan parses the store at most
+    once and all of its reads agree with each other even if another request
+    writes meanwhile. A transaction opened inside the block starts from the
+    snapshot too, as long as the file has not changed since it was taken.
+    The first write staged in the block drops the pin, so later reads and
+    writes see the store as written rather than the stale snapshot.
+    Nested blocks share the outermost snapshot. Works as a decorator as well.
+    Pass the snapshot a block yielded to share it with another thread.
+    """
+    current = getattr(_ACTIVE, "snapshot", None)
+    if current is not None:
+        yield current
+        return
+
+    if snapshot is None:
+        snapshot = _get_index()
+    _ACTIVE.snapshot = snapshot
+    try:
+        yield snapshot
+    finally:
+        _ACTIVE.snapshot = None
+
 # ------------------------------
 # Legacy Mock Data (fallback)
 # ------------------------------
@@ -194,46 +510,42 @@ def fetch_events(date: Optional[str] = None,
     """
     Fetch events for a single date or an inclusive date range.
     If USE_JSON_STORE=True, pull from JSON store; otherwise, legacy mock.
+    Store events are returned if they overlap the range (not only if they
+    start in it), via the interval index.
     """
     if not date and not (start_date and end_date):
         return {"status": "error", "message": "Provide `date` or `start_date`+`end_date`."}
 
-    if date:
-        days = [date]
-    else:
-        start_dt = _parse_iso_date(start_date)  # type: ignore[arg-type]
-        end_dt = _parse_iso_date(end_date)      # type: ignore[arg-type]
-        if end_dt < start_dt:
-            return {"status": "error", "message": "end_date cannot be before start_date."}
-        days = [(start_dt + timedelta(days=i)).date().isoformat()
-                for i in range((end_dt - start_dt).days + 1)]
+    start_dt = _parse_iso_date(date or start_date)  # type: ignore[arg-type]
+    end_dt = _parse_iso_date(date or end_date)      # type: ignore[arg-type]
+    if end_dt < start_dt:
+        return {"status": "error", "message": "end_date cannot be before start_date."}
 
     out_events: List[Dict[str, Any]] = []
 
     if USE_JSON_STORE:
-        store = _load_store()
-        # Store is a dict keyed by ID; filter by date
-        for ev in store.values():
-            if ev.get("status") == "holding":
-                continue  # skip holding items in normal calendar fetches
-            # ignore deleted exception entries if you choose
-            s = ev.get("start"); e = ev.get("end")
-            if not s or not e: 
-                continue
-            ev_date = s.split("T")[0]
-            if ev_date in days:
-                # adapt to L4/L5 expected fields (event_id, start, end, title)
-                out_events.append({
-                    "event_id": ev["id"],
-                    "title": ev.get("title", ""),
-                    "start": _ensure_seconds(ev["start"]),
-                    "end": _ensure_seconds(ev["end"]),
-                    "attendees": ev.get("attendees", []),
-                    "location": ev.get("location", ""),
-                    "description": ev.get("description"),
-                    "layer": ev.get("layer", "work"),
-                })
+        # Range query over the interval index: every event overlapping the
+        # window, including multi-day events that started earlier.
+        # Holding items are never indexed.
+        idx = _read_index()
+        window_start = start_dt.strftime("%Y-%m-%dT00:00:00")
+        window_end = (end_dt + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
+        for ev_id in idx.index.overlapping(window_start, window_end):
+            ev = idx.events[ev_id]
+            # adapt to L4/L5 expected fields (event_id, start, end, title)
+            out_events.append({
+                "event_id": ev["id"],
+                "title": ev.get("title", ""),
+                "start": _ensure_seconds(ev["start"]),
+                "end": _ensure_seconds(ev["end"]),
+                "attendees": list(ev.get("attendees", [])),
+                "location": ev.get("location", ""),
+                "description": ev.get("description"),
+                "layer": ev.get("layer", "work"),
+            })
     else:
+        days = [(start_dt + timedelta(days=i)).date().isoformat()
+                for i in range((end_dt - start_dt).days + 1)]
         out_events = list(itertools.chain.from_iterable(_mock_events_for_date(d) for d in days))
 
     # Minimal filter support
@@ -286,28 +598,27 @@ def get_free_slots(date: str,
     return {"status": "success", "free_slots": out}
 
 def _store_event(obj: Dict[str, Any]) -> Dict[str, Any]:
-    store = _load_store()
-    store[obj["id"]] = obj
-    _save_store(store)
+    with store_transaction() as uow:
+        uow.put(obj)
     return obj
 
 def _update_event(ev_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
-    store = _load_store()
-    if ev_id not in store:
-        return {"status": "error", "message": f"Event '{ev_id}' not found."}
-    store[ev_id].update(patch)
-    store[ev_id]["updated_at"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-    _save_store(store)
-    return {"status": "success", "event": store[ev_id]}
+    with store_transaction() as uow:
+        current = uow.get(ev_id)
+        if current is None:
+            return {"status": "error", "message": f"Event '{ev_id}' not found."}
+        ev = {**current, **patch, "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")}
+        uow.put(ev)
+    return {"status": "success", "event": ev}
 
 def _remove_event(ev_id: str) -> Dict[str, Any]:
-    store = _load_store()
-    if ev_id not in store:
-        return {"status": "error", "message": f"Event '{ev_id}' not found."}
-    del store[ev_id]
-    _save_store(store)
+    with store_transaction() as uow:
+        if uow.get(ev_id) is None:
+            return {"status": "error", "message": f"Event '{ev_id}' not found."}
+        uow.remove(ev_id)
     return {"status": "success"}
 
+@_transaction_result
 def create_event(title: str,
                  start_time: str,
                  end_time: str,
@@ -355,6 +666,7 @@ def create_event(title: str,
     _store_event(obj)
     return {"status": "success", "event_id": ev_id, "message": f"Event '{title}' created.", "event": obj}
 
+@_transaction_result
 def reschedule_event(event_id: str, new_start: str, new_end: str, notify_attendees: bool = False) -> Dict[str, Any]:
     new_start = _ensure_seconds(new_start)
     new_end   = _ensure_seconds(new_end)
@@ -376,6 +688,7 @@ def reschedule_event(event_id: str, new_start: str, new_end: str, notify_attende
         "event": res["event"]
     }
 
+@_transaction_result
 def delete_event(event_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
     if not USE_JSON_STORE:
         return {"status": "success", "message": f"Event '{event_id}' deleted." + (f" Reason: {reason}" if reason else "")}
@@ -411,17 +724,28 @@ def block_time(start_time: str, end_time: str, reason: str = "Blocked time") ->
     return create_event(title=reason, start_time=start_time, end_time=end_time, layer="work", description="Auto block")
 
 def shift_events_batch(source_date: str, target_date: str) -> Dict[str, Any]:
-    resp = fetch_events(date=source_date)
-    if resp["status"] != "success":
-        return resp
     shifted_ids = []
-    for e in resp["events"]:
-        dur = _parse_iso_dt(e["end"]) - _parse_iso_dt(e["start"])
-        new_start = _ensure_seconds(_combine(target_date, e["start"].split("T")[1][:5]))
-        new_end = (_parse_iso_dt(new_start) + dur).strftime("%Y-%m-%dT%H:%M:%S")
-        r = reschedule_event(e["event_id"], new_start, new_end)
-        if r.get("status") == "success":
-            shifted_ids.append(e["event_id"])
+    # One load and one save for the whole day; any failure shifts nothing.
+    # The day is read inside the transaction, so earlier writes of an
+    # enclosing transaction are shifted too.
+    try:
+        with store_transaction():
+            resp = fetch_events(date=source_date)
+            if resp["status"] != "success":
+                return resp
+            # fetch_events also returns events that merely overlap the day (e.g. an
+            # overnight event from the day before); only move the ones starting on it
+            to_shift = [e for e in resp["events"] if e["start"].split("T")[0] == source_date]
+            for e in to_shift:
+                dur = _parse_iso_dt(e["end"]) - _parse_iso_dt(e["start"])
+                new_start = _ensure_seconds(_combine(target_date, e["start"].split("T")[1][:5]))
+                new_end = (_parse_iso_dt(new_start) + dur).strftime("%Y-%m-%dT%H:%M:%S")
+                r = reschedule_event(e["event_id"], new_start, new_end)
+                if r.get("status") != "success":
+                    raise StoreTransactionError(f"Could not shift '{e['event_id']}': {r.get('message')}")
+                shifted_ids.append(e["event_id"])
+    except StoreTransactionError as exc:
+        return {"status": "error", "message": f"{exc} No events were shifted."}
     return {"status": "success", "message": f"Shifted {len(shifted_ids)} event(s) from {source_date} to {target_date}.", "shifted_event_ids": shifted_ids}
 
 def find_event_by_keyword(query: str, date_range: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
@@ -477,91 +801,14 @@ def resolve_relative_datetime(expr: str, base: datetime | None = None) -> str:
 # ------------------------------
 
 def handle_action(action_type: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
-    try:
-        if action_type == "fetch_events":
-            return fetch_events(
-                date=parameters.get("date"),
-                start_date=parameters.get("start_date"),
-                end_date=parameters.get("end_date"),
-                filters=parameters.get("filters"),
-            )
-        if action_type == "get_free_slots":
-            return get_free_slots(
-                date=parameters["date"],
-                min_duration=int(parameters["min_duration"]),
-                start_range=parameters.get("start_range", "09:00"),
-                end_range=parameters.get("end_range", "18:00"),
-            )
-        if action_type == "create_event":
-            return create_event(
-                title=parameters["title"],
-                start_time=parameters["start_time"],
-                end_time=parameters["end_time"],
-                attendees=parameters.get("attendees"),
-                location=parameters.get("location"),
-                description=parameters.get("description"),
-                layer=parameters.get("layer", "work"),
-                all_day=parameters.get("all_day", False),
-            )
-        if action_type == "reschedule_event":
-            return reschedule_event(
-                event_id=parameters["event_id"],
-                new_start=parameters["new_start"],
-                new_end=parameters["new_end"],
-                notify_attendees=parameters.get("notify_attendees", False),
-            )
-        if action_type == "delete_event":
-            return delete_event(
-                event_id=parameters["event_id"],
-                reason=parameters.get("reason"),
-            )
-        if action_type == "summarize_day":
-            return summarize_day(date=parameters["date"])
-        if action_type == "block_time":
-            return block_time(
-                start_time=parameters["start_time"],
-                end_time=parameters["end_time"],
-                reason=parameters.get("reason", "Blocked time"),
-            )
-        if action_type == "shift_events_batch":
-            return shift_events_batch(
-                source_date=parameters["source_date"],
-                target_date=parameters["target_date"],
-            )
-        if action_type == "find_event_by_keyword":
-            return find_event_by_keyword(
-                query=parameters["query"],
-                date_range=tuple(parameters["date_range"]) if parameters.get("date_range") else None,
-            )
-
-        # ---------- NEW: holding-area ----------
-        if action_type == "list_holding":
-            return list_holding()
-
-        if action_type == "create_holding":
-            return create_holding_item(
-                title=parameters["title"],
-                notes=parameters.get("notes"),
-                layer=parameters.get("layer", "work"),
-            )
-
-        if action_type == "move_to_holding":
-            return move_event_to_holding(
-                event_id=parameters["event_id"],
-                reason=parameters.get("reason"),
-            )
-
-        if action_type == "promote_holding":
-            return promote_holding_to_event(
-                item_id=parameters["item_id"],
-                start_time=parameters["start_time"],
-                end_time=parameters["end_time"],
-                location=parameters.get("location"),
-                attendees=parameters.get("attendees"),
-            )
-        # --------------------------------------
+    """Run one plan action through the action registry; failures come back as error results."""
+    from action_registry import ACTIONS  # imports this module
 
+    spec = ACTIONS.get(action_type)
+    if spec is None:
         return {"status": "error", "message": f"Unknown action_type: {action_type}"}
+    try:
+        return spec.run(parameters)
     except KeyError as ke:
         return {"status": "error", "message": f"Missing parameter: {ke}"}
     except Exception as e:
@@ -569,12 +816,22 @@ def handle_action(action_type: str, parameters: Dict[str, Any]) -> Dict[str, Any
 
 
 def handle_actions(required_actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run a plan's actions as one store transaction: all writes land together or not at all.
+    Each action sees the writes staged by the actions before it.
+    """
     results = []
-    for idx, action in enumerate(required_actions, start=1):
-        a_type = action.get("type")
-        params = action.get("parameters", {})
-        res = handle_action(a_type, params)
-        results.append({"index": idx, "type": a_type, "result": res})
+    try:
+        with store_transaction():
+            for idx, action in enumerate(required_actions, start=1):
+                a_type = action.get("type")
+                params = action.get("parameters", {})
+                res = handle_action(a_type, params)
+                results.append({"index": idx, "type": a_type, "result": res})
+                if res.get("status") == "error":
+                    raise StoreTransactionError(f"Action {idx} ({a_type}) failed: {res.get('message')}")
+    except StoreTransactionError as exc:
+        return {"status": "error", "message": f"{exc} No changes were saved.", "results": results}
     return {"status": "success", "results": results}
 
 
@@ -584,8 +841,7 @@ def handle_actions(required_actions: List[Dict[str, Any]]) -> Dict[str, Any]:
 def list_holding() -> Dict[str, Any]:
     if not USE_JSON_STORE:
         return {"status": "success", "items": []}
-    store = _load_store()
-    items = [ev for ev in store.values() if ev.get("status") == "holding"]
+    items = [ev for ev in _read_index().records.values() if ev.get("status") == "holding"]
     items = [{
         "id": ev["id"],
         "title": ev.get("title",""),
@@ -596,6 +852,7 @@ def list_holding() -> Dict[str, Any]:
     } for ev in items]
     return {"status": "success", "items": items}
 
+@_transaction_result
 def create_holding_item(title: str, notes: Optional[str] = None, layer: str = "work") -> Dict[str, Any]:
     if not USE_JSON_STORE:
         return {"status": "success", "id": _new_id(), "message": f"Holding item '{title}' captured."}
@@ -614,41 +871,44 @@ def create_holding_item(title: str, notes: Optional[str] = None, layer: str = "w
     _store_event(obj)
     return {"status": "success", "id": hid, "message": f"Holding item '{title}' captured.", "item": obj}
 
+@_transaction_result
 def promote_holding_to_event(event_id: str, start_time: str, end_time: str,
                              location: Optional[str] = None, attendees: Optional[List[str]] = None) -> Dict[str, Any]:
     if not USE_JSON_STORE:
         return {"status": "success", "message": f"Held item promoted to event {start_time}–{end_time}."}
-    store = _load_store()
-    ev = store.get(event_id)
-    if not ev or ev.get("status") != "holding":
-        return {"status": "error", "message": f"Holding item '{event_id}' not found."}
-    start_time = _ensure_seconds(start_time)
-    end_time   = _ensure_seconds(end_time)
-    ev.update({
-        "status": None,                          # no longer holding
-        "start": start_time,
-        "end": end_time,
-        "location": location if location is not None else ev.get("location",""),
-        "attendees": attendees if attendees is not None else ev.get("attendees", []),
-        "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S"),
-    })
-    _save_store(store)
+    with store_transaction() as uow:
+        current = uow.get(event_id)
+        if not current or current.get("status") != "holding":
+            return {"status": "error", "message": f"Holding item '{event_id}' not found."}
+        start_time = _ensure_seconds(start_time)
+        end_time   = _ensure_seconds(end_time)
+        ev = {
+            **current,
+            "status": None,                          # no longer holding
+            "start": start_time,
+            "end": end_time,
+            "location": location if location is not None else current.get("location",""),
+            "attendees": attendees if attendees is not None else current.get("attendees", []),
+            "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        uow.put(ev)
     return {"status": "success", "event": ev}
 
+@_transaction_result
 def move_event_to_holding(event_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
     if not USE_JSON_STORE:
         return {"status": "success", "message": f"Event '{event_id}' moved to holding."}
-    store = _load_store()
-    ev = store.get(event_id)
-    if not ev:
-        return {"status": "error", "message": f"Event '{event_id}' not found."}
-    ev.update({
-        "status": "holding",
-        "start": None, "end": None,              # unschedule it
-        "description": (ev.get("description") or "") + (f" (Moved to holding: {reason})" if reason else ""),
-        "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S"),
-    })
-    _save_store(store)
+    with store_transaction() as uow:
+        current = uow.get(event_id)
+        if not current:
+            return {"status": "error", "message": f"Event '{event_id}' not found."}
+        uow.put({
+            **current,
+            "status": "holding",
+            "start": None, "end": None,              # unschedule it
+            "description": (current.get("description") or "") + (f" (Moved to holding: {reason})" if reason else ""),
+            "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S"),
+        })
     return {"status": "success", "message": f"Event '{event_id}' moved to holding."}
 
 # ------------------------------
@@ -673,4 +933,5 @@ __all__ = [
     "get_week_dates", "resolve_week", "resolve_dates_for_phrase",
     "handle_action", "handle_actions", "event_duration_minutes", "pick_first_slot",
     "list_holding","move_event_to_holding","promote_holding_to_event","create_holding_item",
+    "store_transaction", "StoreTransactionError", "plan_snapshot",
 ]
@@ -0,0 +1,149 @@
+# interval_index.py
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Hashable, List, Optional, Tuple
+
+Entry = Tuple[str, str, Hashable]   # (start, end, key), ISO strings compare chronologically
+
+
+class _MaxTree:
+    """Segment tree of per-chunk max end values ('' is the neutral minimum)."""
+
+    def __init__(self, values: List[str]):
+        self.size = 1
+        while self.size < max(len(values), 1):
+            self.size *= 2
+        self.tree = [""] * (2 * self.size)
+        self.tree[self.size:self.size + len(values)] = values
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def copy(self) -> "_MaxTree":
+        tree = _MaxTree.__new__(_MaxTree)
+        tree.size = self.size
+        tree.tree = list(self.tree)
+        return tree
+
+    def update(self, i: int, value: str) -> None:
+        i += self.size
+        self.tree[i] = value
+        i //= 2
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def leaves_at_least(self, hi: int, bound: str) -> List[int]:
+        """Indices < hi whose value is >= bound, ascending."""
+        out: List[int] = []
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, lo, width = stack.pop()
+            if lo >= hi or self.tree[node] < bound:
+                continue
+            if node >= self.size:
+                out.append(node - self.size)
+                continue
+            half = width // 2
+            stack.append((2 * node + 1, lo + half, half))
+            stack.append((2 * node, lo, half))
+        return out
+
+
+class IntervalIndex:
+    """
+    Incremental index of [start, end] intervals keyed by id.
+
+    Entries are kept sorted by start in fixed-size chunks; a max-end segment
+    tree over the chunks lets an overlap query skip every chunk that ends
+    before the window, so queries cost O(log n + k) chunk visits. Inserts and
+    removals touch one chunk (plus an O(n / chunk_size) rebuild when a chunk
+    splits or empties). Chunks are replaced rather than edited in place, so
+    copy() can share them between the copy and the original.
+    """
+
+    def __init__(self, items: Optional[List[Entry]] = None, chunk_size: int = 64):
+        self.chunk_size = chunk_size
+        self._spans: Dict[Hashable, Tuple[str, str]] = {}
+        self._chunks: List[List[Entry]] = []
+        self._firsts: List[Entry] = []
+        self._tree = _MaxTree([])
+        if items:
+            entries = sorted((s, max(s, e or s), k) for s, e, k in items)
+            for s, e, k in entries:
+                self._spans[k] = (s, e)
+            self._chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+            self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._spans
+
+    def copy(self) -> "IntervalIndex":
+        """Independent index with the same entries; changing one never affects the other."""
+        other = IntervalIndex(chunk_size=self.chunk_size)
+        other._spans = dict(self._spans)
+        other._chunks = list(self._chunks)
+        other._firsts = list(self._firsts)
+        other._tree = self._tree.copy()
+        return other
+
+    def _rebuild(self) -> None:
+        self._firsts = [c[0] for c in self._chunks]
+        self._tree = _MaxTree([max(e for _, e, _ in c) for c in self._chunks])
+
+    def _chunk_for(self, entry: Entry) -> int:
+        return max(bisect_right(self._firsts, entry) - 1, 0)
+
+    def add(self, key: Hashable, start: str, end: Optional[str]) -> None:
+        """Insert or replace the interval for `key`."""
+        if key in self._spans:
+            self.discard(key)
+        entry = (start, max(start, end or start), key)
+        self._spans[key] = (entry[0], entry[1])
+        if not self._chunks:
+            self._chunks = [[entry]]
+            self._rebuild()
+            return
+        i = self._chunk_for(entry)
+        chunk = self._chunks[i] = list(self._chunks[i])
+        insort(chunk, entry)
+        if len(chunk) > 2 * self.chunk_size:
+            half = len(chunk) // 2
+            self._chunks[i:i + 1] = [chunk[:half], chunk[half:]]
+            self._rebuild()
+        else:
+            self._firsts[i] = chunk[0]
+            self._tree.update(i, max(self._tree.tree[self._tree.size + i], entry[1]))
+
+    def discard(self, key: Hashable) -> None:
+        """Remove `key` if present."""
+        span = self._spans.pop(key, None)
+        if span is None:
+            return
+        entry = (span[0], span[1], key)
+        i = self._chunk_for(entry)
+        chunk = self._chunks[i] = list(self._chunks[i])
+        j = bisect_left(chunk, entry)
+        if j < len(chunk) and chunk[j] == entry:
+            del chunk[j]
+        if not chunk:
+            del self._chunks[i]
+            self._rebuild()
+        else:
+            self._firsts[i] = chunk[0]
+            self._tree.update(i, max(e for _, e, _ in chunk))
+
+    def overlapping(self, start: str, end: str) -> List[Hashable]:
+        """Keys whose interval intersects [start, end), ordered by start."""
+        hi = bisect_left(self._firsts, (end,))
+        out: List[Hashable] = []
+        for i in self._tree.leaves_at_least(hi, start):
+            for s, e, k in self._chunks[i]:
+                if s >= end:
+                    break
+                if e > start or s >= start:
+                    out.append(k)
+        return out
@@ -12,6 +12,8 @@ class Calendar {
     this.layerToDelete = null;
     this.dayZoom = 0.6;
     this.kanbanZoom = 1;
+    this.loadedRange = null;     // { start, end } of the events currently held
+    this.loadSequence = 0;       // discards responses from superseded loads
     
     // Initialize modules
     this.dragDrop = new DragDropHandler(this);
@@ -25,13 +27,41 @@ class Calendar {
   }
 
   async init() {
-    await this.loadLayers();
-    await this.loadEvents();
+    await this.loadBootstrap();
     this.bindEvents();
+    this.subscribeToChanges();
     this.render();
   }
 
   // API Methods
+  // Layers, visible events, patterns and today's tasks in one round trip
+  async loadBootstrap() {
+    const range = this.getFetchRange();
+    const sequence = ++this.loadSequence;
+    try {
+      const params = new URLSearchParams({
+        start: range.start, end: range.end, date: this.toLocalYMD(new Date())
+      });
+      const response = await fetch(`/api/calendar/bootstrap?${params}`);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const data = await response.json();
+      this.layers = data.layers;
+      this.layerManager.renderLayersControls();
+      this.layerManager.populateLayerSelect();
+      this.recurringPatterns = data.recurring_patterns;
+      this.taskManager.tasks = data.tasks;
+      if (sequence === this.loadSequence) {
+        this.events = data.events;
+        this.loadedRange = range;
+      }
+      this.render();
+    } catch (error) {
+      console.error('Error loading calendar, falling back to separate requests:', error);
+      await this.loadLayers();
+      await this.loadEvents();
+    }
+  }
+
   async loadLayers() {
     try {
       const response = await fetch('/api/layers');
@@ -44,15 +74,158 @@ class Calendar {
   }
 
   async loadEvents() {
+    const range = this.getFetchRange();
+    const sequence = ++this.loadSequence;
     try {
-      const response = await fetch('/api/events');
-      this.events = await response.json();
-      this.render();
+      const params = new URLSearchParams({ start: range.start, end: range.end });
+      const response = await fetch(`/api/events?${params}`, {
+        headers: { Accept: 'application/x-ndjson' }
+      });
+      // Events arrive in start order; paint each chunk as soon as it lands
+      const events = [];
+      await this.readNdjson(response, (batch) => {
+        if (sequence !== this.loadSequence) return false; // a newer load is in flight
+        events.push(...batch);
+        this.events = events;
+        this.loadedRange = range;
+        this.render();
+      });
     } catch (error) {
       console.error('Error loading events:', error);
     }
   }
 
+  // Feed NDJSON items to onItems(batch) per network chunk; return false from it to stop reading
+  async readNdjson(response, onItems) {
+    const type = response.headers.get('Content-Type') || '';
+    if (!response.body || !type.includes('ndjson')) {
+      onItems(await response.json());
+      return;
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffered += decoder.decode(value, { stream: true });
+      const lines = buffered.split('\n');
+      buffered = lines.pop();
+      const items = lines.filter(line => line.trim()).map(line => JSON.parse(line));
+      if (items.length && onItems(items) === false) {
+        reader.cancel();
+        return;
+      }
+    }
+    buffered += decoder.decode();
+    if (buffered.trim()) onItems([JSON.parse(buffered)]);
+  }
+
+  // Run several API writes in one request; the server commits all of them or none
+  async runBatch(operations) {
+    const response = await fetch('/api/batch', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ operations })
+    });
+    const result = await response.json();
+    if (!response.ok) {
+      const failed = result.results && result.results[result.failed];
+      throw new Error((failed && failed.body && failed.body.error) || result.error || 'Batch failed');
+    }
+    return result.results;
+  }
+
+  // Reload only when the visible range is no longer covered by what we hold
+  async ensureEventsLoaded() {
+    const visible = this.getVisibleRange();
+    const loaded = this.loadedRange;
+    if (!loaded || visible.start < loaded.start || visible.end > loaded.end) {
+      await this.loadEvents();
+    }
+  }
+
+  // [start, end) dates (YYYY-MM-DD) shown by the current view
+  getVisibleRange() {
+    const d = this.currentDate;
+    let start, days;
+    switch (this.currentView) {
+      case 'week':
+        start = this.getWeekStart(d);
+        days = 7;
+        break;
+      case 'day':
+        start = new Date(d.getFullYear(), d.getMonth(), d.getDate());
+        days = 1;
+        break;
+      default: {
+        // Month grid: six weeks starting on the Sunday before the 1st
+        const firstDay = new Date(d.getFullYear(), d.getMonth(), 1);
+        start = new Date(firstDay);
+        start.setDate(start.getDate() - firstDay.getDay());
+        days = 42;
+      }
+    }
+    start = new Date(start.getFullYear(), start.getMonth(), start.getDate());
+    const end = new Date(start);
+    end.setDate(end.getDate() + days);
+    return { start: this.toLocalYMD(start), end: this.toLocalYMD(end) };
+  }
+
+  // Visible range widened by a prefetch margin so nearby navigation needs no request
+  getFetchRange() {
+    const visible = this.getVisibleRange();
+    const start = new Date(`${visible.start}T00:00`);
+    const end = new Date(`${visible.end}T00:00`);
+    start.setDate(start.getDate() - Calendar.PREFETCH_DAYS);
+    end.setDate(end.getDate() + Calendar.PREFETCH_DAYS);
+    return { start: this.toLocalYMD(start), end: this.toLocalYMD(end) };
+  }
+
+  // Live updates from other tabs and the assistant: refetch only what a change touched
+  subscribeToChanges() {
+    if (!window.EventSource) return;
+    this.changeSource = new EventSource('/api/changes/stream');
+    this.changeSource.addEventListener('change', (e) => {
+      this.applyChangeNotifications(JSON.parse(e.data).changes || []);
+    });
+    this.changeSource.addEventListener('resync', () => {
+      this.loadLayers();
+      this.loadEvents();
+    });
+  }
+
+  applyChangeNotifications(changes) {
+    let reloadLayers = false;
+    let reloadEvents = false;
+    for (const change of changes) {
+      if (change.collection === 'layers') {
+        reloadLayers = reloadEvents = true;
+      } else if (change.collection === 'recurring_patterns') {
+        reloadEvents = true;
+      } else if (change.collection === 'events' && this.changeTouchesLoadedRange(change)) {
+        reloadEvents = true;
+      }
+    }
+    if (reloadLayers) this.loadLayers();
+    if (reloadEvents) {
+      // Coalesce bursts (and our own writes, which reload anyway) into one fetch
+      clearTimeout(this.changeReloadTimer);
+      this.changeReloadTimer = setTimeout(() => this.loadEvents(), 250);
+    }
+  }
+
+  changeTouchesLoadedRange(change) {
+    const range = this.loadedRange;
+    // Tombstones carry no dates; the deleted record may also be an exception marker
+    if (!range || change.op === 'delete') return true;
+    if (this.events.some(e => e.id === change.id)) return true;
+    const start = change.start || change.original_occurrence_date;
+    if (!start) return true;
+    const end = change.end || start;
+    return start < range.end && end >= range.start;
+  }
+
   async loadRecurringPatterns() {
     try {
       const response = await fetch('/api/recurring-patterns');
@@ -78,11 +251,13 @@ class Calendar {
         return; // No navigation for recurring view
     }
     this.render();
+    this.ensureEventsLoaded();
   }
 
   switchView(view) {
     this.currentView = view;
     this.render();
+    this.ensureEventsLoaded();
   }
 
   // Render Methods
@@ -106,6 +281,7 @@ class Calendar {
     document.getElementById('todayBtn').addEventListener('click', () => {
       this.currentDate = new Date();
       this.render();
+      this.ensureEventsLoaded();
     });
 
     // View switching
@@ -188,4 +364,7 @@ class Calendar {
       .replace(/"/g, "&quot;")
       .replace(/'/g, "&#039;");
   }
-}
\ No newline at end of file
+}
+
+// Days fetched on each side of the visible range
+Calendar.PREFETCH_DAYS = 14;
\ No newline at end of file
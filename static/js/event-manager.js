@@ -526,48 +526,21 @@ class EventManager {
     const { newStart, newEnd } = this.calculateNewTimes(event);
 
     try {
-      // Create deletion exception for original date
-      const deletionException = {
-        title: '[DELETED]',
-        start: event.start,
-        end: event.end,
-        location: '',
-        description: 'Deleted recurring instance',
-        all_day: event.all_day || false,
-        layer: event.layer || 'personal',
-        is_deletion_exception: true,
-        original_pattern_id: event.pattern_id,
-        original_occurrence_date: event.occurrence_date
-      };
-
-      await fetch('/api/events', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(deletionException)
-      });
-
-      // Create moved event
-      const newEvent = {
-        title: event.title,
-        start: this.toLocalInput(newStart),
-        end: this.toLocalInput(newEnd),
-        location: event.location || '',
-        description: event.description || '',
-        all_day: event.all_day || false,
-        layer: event.layer || 'personal',
-        is_moved_exception: true,
-        original_pattern_id: event.pattern_id,
-        original_occurrence_date: event.occurrence_date
-      };
-
-      const response = await fetch('/api/events', {
-        method: 'POST',
+      // One request records the moved exception (replacing any earlier one for that date)
+      const url = `/api/recurring-patterns/${event.pattern_id}/occurrences/${event.occurrence_date}`;
+      const response = await fetch(url, {
+        method: 'PUT',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(newEvent)
+        body: JSON.stringify({ start: this.toLocalInput(newStart), end: this.toLocalInput(newEnd) })
       });
 
       if (response.ok) {
-        await this.calendar.loadEvents();
+        // The response is the moved event, ready to show; no reload needed
+        const moved = await response.json();
+        this.calendar.events = this.calendar.events
+          .filter(e => e.id !== event.id && e.id !== moved.id)
+          .concat(moved);
+        this.calendar.render();
         bootstrap.Modal.getInstance(document.getElementById('moveConfirmModal')).hide();
       } else {
         const errorData = await response.json();
@@ -49,6 +49,8 @@ class Calendar {
         this.currentEditingEvent = null;
         this.currentEditType = null;
         this.layerToDelete = null;
+        this.loadedRange = null;     // { start, end } of the events currently held
+        this.loadSequence = 0;       // discards responses from superseded loads
         
         this.init();
     }
@@ -56,9 +58,9 @@ class Calendar {
     dayZoom = 0.6; // default: 0.6px per minute (~36px per hour)
 
     init() {
-        this.loadLayers();
-        this.loadEvents();
+        this.loadBootstrap();
         this.bindEvents();
+        this.subscribeToChanges();
         this.render();
     }
 
@@ -147,6 +149,34 @@ cardHTML(t) {
     }
 
 
+    // Layers, visible events, patterns and today's tasks in one round trip
+    async loadBootstrap() {
+        const range = this.getFetchRange();
+        const sequence = ++this.loadSequence;
+        try {
+            const params = new URLSearchParams({
+                start: range.start, end: range.end, date: this.toLocalYMD(new Date())
+            });
+            const response = await fetch(`/api/calendar/bootstrap?${params}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const data = await response.json();
+            this.layers = data.layers;
+            this.renderLayersControls();
+            this.populateLayerSelect();
+            this.recurringPatterns = data.recurring_patterns;
+            this.tasks = data.tasks;
+            if (sequence === this.loadSequence) {
+                this.events = data.events;
+                this.loadedRange = range;
+            }
+            this.render();
+        } catch (error) {
+            console.error('Error loading calendar, falling back to separate requests:', error);
+            await this.loadLayers();
+            await this.loadEvents();
+        }
+    }
+
     async loadLayers() {
         try {
             const response = await fetch('/api/layers');
@@ -159,15 +189,158 @@ cardHTML(t) {
     }
 
     async loadEvents() {
+        const range = this.getFetchRange();
+        const sequence = ++this.loadSequence;
         try {
-            const response = await fetch('/api/events');
-            this.events = await response.json();
-            this.render();
+            const params = new URLSearchParams({ start: range.start, end: range.end });
+            const response = await fetch(`/api/events?${params}`, {
+                headers: { Accept: 'application/x-ndjson' }
+            });
+            // Events arrive in start order; paint each chunk as soon as it lands
+            const events = [];
+            await this.readNdjson(response, (batch) => {
+                if (sequence !== this.loadSequence) return false; // a newer load is in flight
+                events.push(...batch);
+                this.events = events;
+                this.loadedRange = range;
+                this.render();
+            });
         } catch (error) {
             console.error('Error loading events:', error);
         }
     }
 
+    // Feed NDJSON items to onItems(batch) per network chunk; return false from it to stop reading
+    async readNdjson(response, onItems) {
+        const type = response.headers.get('Content-Type') || '';
+        if (!response.body || !type.includes('ndjson')) {
+            onItems(await response.json());
+            return;
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffered = '';
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            const items = lines.filter(line => line.trim()).map(line => JSON.parse(line));
+            if (items.length && onItems(items) === false) {
+                reader.cancel();
+                return;
+            }
+        }
+        buffered += decoder.decode();
+        if (buffered.trim()) onItems([JSON.parse(buffered)]);
+    }
+
+    // Run several API writes in one request; the server commits all of them or none
+    async runBatch(operations) {
+        const response = await fetch('/api/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ operations })
+        });
+        const result = await response.json();
+        if (!response.ok) {
+            const failed = result.results && result.results[result.failed];
+            throw new Error((failed && failed.body && failed.body.error) || result.error || 'Batch failed');
+        }
+        return result.results;
+    }
+
+    // Reload only when the visible range is no longer covered by what we hold
+    async ensureEventsLoaded() {
+        const visible = this.getVisibleRange();
+        const loaded = this.loadedRange;
+        if (!loaded || visible.start < loaded.start || visible.end > loaded.end) {
+            await this.loadEvents();
+        }
+    }
+
+    // [start, end) dates (YYYY-MM-DD) shown by the current view
+    getVisibleRange() {
+        const d = this.currentDate;
+        let start, days;
+        switch (this.currentView) {
+            case 'week':
+                start = this.getWeekStart(d);
+                days = 7;
+                break;
+            case 'day':
+                start = new Date(d.getFullYear(), d.getMonth(), d.getDate());
+                days = 1;
+                break;
+            default: {
+                // Month grid: six weeks starting on the Sunday before the 1st
+                const firstDay = new Date(d.getFullYear(), d.getMonth(), 1);
+                start = new Date(firstDay);
+                start.setDate(start.getDate() - firstDay.getDay());
+                days = 42;
+            }
+        }
+        start = new Date(start.getFullYear(), start.getMonth(), start.getDate());
+        const end = new Date(start);
+        end.setDate(end.getDate() + days);
+        return { start: this.toLocalYMD(start), end: this.toLocalYMD(end) };
+    }
+
+    // Visible range widened by a prefetch margin so nearby navigation needs no request
+    getFetchRange() {
+        const visible = this.getVisibleRange();
+        const start = new Date(`${visible.start}T00:00`);
+        const end = new Date(`${visible.end}T00:00`);
+        start.setDate(start.getDate() - Calendar.PREFETCH_DAYS);
+        end.setDate(end.getDate() + Calendar.PREFETCH_DAYS);
+        return { start: this.toLocalYMD(start), end: this.toLocalYMD(end) };
+    }
+
+    // Live updates from other tabs and the assistant: refetch only what a change touched
+    subscribeToChanges() {
+        if (!window.EventSource) return;
+        this.changeSource = new EventSource('/api/changes/stream');
+        this.changeSource.addEventListener('change', (e) => {
+            this.applyChangeNotifications(JSON.parse(e.data).changes || []);
+        });
+        this.changeSource.addEventListener('resync', () => {
+            this.loadLayers();
+            this.loadEvents();
+        });
+    }
+
+    applyChangeNotifications(changes) {
+        let reloadLayers = false;
+        let reloadEvents = false;
+        for (const change of changes) {
+            if (change.collection === 'layers') {
+                reloadLayers = reloadEvents = true;
+            } else if (change.collection === 'recurring_patterns') {
+                reloadEvents = true;
+            } else if (change.collection === 'events' && this.changeTouchesLoadedRange(change)) {
+                reloadEvents = true;
+            }
+        }
+        if (reloadLayers) this.loadLayers();
+        if (reloadEvents) {
+            // Coalesce bursts (and our own writes, which reload anyway) into one fetch
+            clearTimeout(this.changeReloadTimer);
+            this.changeReloadTimer = setTimeout(() => this.loadEvents(), 250);
+        }
+    }
+
+    changeTouchesLoadedRange(change) {
+        const range = this.loadedRange;
+        // Tombstones carry no dates; the deleted record may also be an exception marker
+        if (!range || change.op === 'delete') return true;
+        if (this.events.some(e => e.id === change.id)) return true;
+        const start = change.start || change.original_occurrence_date;
+        if (!start) return true;
+        const end = change.end || start;
+        return start < range.end && end >= range.start;
+    }
+
     async loadRecurringPatterns() {
         try {
             const response = await fetch('/api/recurring-patterns');
@@ -232,6 +405,7 @@ cardHTML(t) {
         document.getElementById('todayBtn').addEventListener('click', () => {
             this.currentDate = new Date();
             this.render();
+            this.ensureEventsLoaded();
         });
 
         // View switching
@@ -395,11 +569,13 @@ cardHTML(t) {
                 return;
         }
         this.render();
+        this.ensureEventsLoaded();
     }
 
     switchView(view) {
         this.currentView = view;
         this.render();
+        this.ensureEventsLoaded();
     }
 
     updateViewButtons() {
@@ -1492,9 +1668,8 @@ cardHTML(t) {
 
         // Check if this is a recurring instance
         if (event.is_recurring_instance) {
-            // For recurring instances, we need to:
-            // 1. Create a new regular event (exception) for the new date/time
-            // 2. Create a deletion exception for the original date to prevent duplicate
+            // For recurring instances the server records a moved exception for
+            // the original date, which also keeps the series from generating it
             
             // Calculate new start and end times
             const originalStart = new Date(event.start);
@@ -1511,52 +1686,25 @@ cardHTML(t) {
             const newEnd = new Date(newStart.getTime() + duration);
 
             try {
-                // First, create a deletion exception for the original date
-                const deletionException = {
-                    title: '[DELETED]',
-                    start: event.start,
-                    end: event.end,
-                    location: '',
-                    description: 'Deleted recurring instance',
-                    all_day: event.all_day || false,
-                    layer: event.layer || 'personal',
-                    is_deletion_exception: true,
-                    original_pattern_id: event.pattern_id,
-                    original_occurrence_date: event.occurrence_date
-                };
-
-                await fetch('/api/events', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify(deletionException)
-                });
-
-                // Then create the moved event as a new exception
-                const newEvent = {
-                    title: event.title,
-                    start: this.toLocalInput(newStart),
-                    end:   this.toLocalInput(newEnd),
-                    location: event.location || '',
-                    description: event.description || '',
-                    all_day: event.all_day || false,
-                    layer: event.layer || 'personal',
-                    is_moved_exception: true,
-                    original_pattern_id: event.pattern_id,
-                    original_occurrence_date: event.occurrence_date
-                };
-
-                const response = await fetch('/api/events', {
-                    method: 'POST',
+                const url = `/api/recurring-patterns/${event.pattern_id}/occurrences/${event.occurrence_date}`;
+                const response = await fetch(url, {
+                    method: 'PUT',
                     headers: {
                         'Content-Type': 'application/json',
                     },
-                    body: JSON.stringify(newEvent)
+                    body: JSON.stringify({
+                        start: this.toLocalInput(newStart),
+                        end:   this.toLocalInput(newEnd)
+                    })
                 });
 
                 if (response.ok) {
-                    await this.loadEvents();
+                    // The response is the moved event, ready to show; no reload needed
+                    const moved = await response.json();
+                    this.events = this.events
+                        .filter(e => e.id !== event.id && e.id !== moved.id)
+                        .concat(moved);
+                    this.render();
                     bootstrap.Modal.getInstance(document.getElementById('moveConfirmModal')).hide();
                 } else {
                     const errorData = await response.json();
@@ -1764,17 +1912,11 @@ cardHTML(t) {
 
     async toggleAllLayers(visible) {
         try {
-            const promises = this.layers.map(layer => 
-                fetch(`/api/layers/${layer.id}`, {
-                    method: 'PUT',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ visible })
-                })
-            );
-
-            await Promise.all(promises);
+            await this.runBatch(this.layers.map(layer => ({
+                method: 'PUT',
+                path: `/api/layers/${layer.id}`,
+                body: { visible }
+            })));
             
             // Update local state
             this.layers.forEach(layer => {
@@ -2580,6 +2722,9 @@ getTasksForDate(ymd) {
 
 }
 
+// Days fetched on each side of the visible range
+Calendar.PREFETCH_DAYS = 14;
+
 // Initialize calendar when page loads
 let calendar;
 document.addEventListener('DOMContentLoaded', () => {
@@ -116,15 +116,11 @@ class LayerManager {
 
   async toggleAllLayers(visible) {
     try {
-      const promises = this.calendar.layers.map(layer => 
-        fetch(`/api/layers/${layer.id}`, {
-          method: 'PUT',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ visible })
-        })
-      );
-
-      await Promise.all(promises);
+      await this.calendar.runBatch(this.calendar.layers.map(layer => ({
+        method: 'PUT',
+        path: `/api/layers/${layer.id}`,
+        body: { visible }
+      })));
 
       // Update local state
       this.calendar.layers.forEach(layer => {
@@ -0,0 +1,26 @@
+# tests/conftest.py - Shared fixtures
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+@pytest.fixture
+def empty_store(tmp_path, monkeypatch):
+    """Run against an empty JSON store in a temporary directory"""
+    from utils import data_manager
+    monkeypatch.chdir(tmp_path)
+    data_manager.invalidate_cache()
+    yield
+    data_manager.invalidate_cache()
+
+@pytest.fixture
+def calendar_tools(tmp_path, monkeypatch):
+    """calendarTools against an empty event store in a temporary directory"""
+    monkeypatch.syspath_prepend(os.path.join(ROOT, 'calendarAI'))
+    import calendarTools
+    monkeypatch.setattr(calendarTools, 'EVENT_STORE_PATH', str(tmp_path / 'events.json'))
+    monkeypatch.setattr(calendarTools, '_INDEX', None)
+    return calendarTools
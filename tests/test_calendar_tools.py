@@ -0,0 +1,84 @@
+# tests/test_calendar_tools.py - calendarTools Transactions
+def test_shift_in_transaction_moves_rescheduled_event(calendar_tools):
+    ct = calendar_tools
+    event_id = ct.create_event('a', '2026-10-19T09:00', '2026-10-19T10:00')['event_id']
+
+    result = ct.handle_actions([
+        {'type': 'reschedule_event', 'parameters': {
+            'event_id': event_id, 'new_start': '2026-10-19T15:00', 'new_end': '2026-10-19T16:00'}},
+        {'type': 'shift_events_batch', 'parameters': {'source_date': '2026-10-19', 'target_date': '2026-10-20'}},
+    ])
+
+    assert result['status'] == 'success'
+    stored = ct._load_store()[event_id]
+    assert (stored['start'], stored['end']) == ('2026-10-20T15:00:00', '2026-10-20T16:00:00')
+
+def test_reads_in_transaction_see_earlier_writes(calendar_tools):
+    ct = calendar_tools
+    result = ct.handle_actions([
+        {'type': 'create_event', 'parameters': {
+            'title': 'X', 'start_time': '2026-10-19T09:00', 'end_time': '2026-10-19T10:00'}},
+        {'type': 'shift_events_batch', 'parameters': {'source_date': '2026-10-19', 'target_date': '2026-10-20'}},
+        {'type': 'fetch_events', 'parameters': {'date': '2026-10-20'}},
+    ])
+
+    assert result['status'] == 'success'
+    shifted, fetched = result['results'][1]['result'], result['results'][2]['result']
+    assert len(shifted['shifted_event_ids']) == 1
+    assert [event['title'] for event in fetched['events']] == ['X']
+    assert [event['start'] for event in ct.fetch_events(date='2026-10-20')['events']] == ['2026-10-20T09:00:00']
+
+def test_failed_transaction_leaves_store_and_index_unchanged(calendar_tools):
+    ct = calendar_tools
+    event_id = ct.create_event('a', '2026-10-19T09:00', '2026-10-19T10:00')['event_id']
+
+    result = ct.handle_actions([
+        {'type': 'delete_event', 'parameters': {'event_id': event_id}},
+        {'type': 'fetch_events', 'parameters': {'date': '2026-10-19'}},
+        {'type': 'delete_event', 'parameters': {'event_id': 'missing'}},
+    ])
+
+    assert result['status'] == 'error'
+    assert result['results'][1]['result']['events'] == []
+    assert [event['event_id'] for event in ct.fetch_events(date='2026-10-19')['events']] == [event_id]
+
+def test_plan_writes_build_on_earlier_writes(calendar_tools):
+    ct = calendar_tools
+    with ct.plan_snapshot():
+        assert ct.fetch_events(date='2026-10-19')['events'] == []
+        created = ct.create_event('X', '2026-10-19T09:00', '2026-10-19T10:00')
+        ct.reschedule_event(created['event_id'], '2026-10-19T11:00', '2026-10-19T12:00')
+        shifted = ct.shift_events_batch(source_date='2026-10-19', target_date='2026-10-21')
+        fetched = ct.fetch_events(date='2026-10-21')['events']
+
+    assert shifted['shifted_event_ids'] == [created['event_id']]
+    assert [(event['start'], event['end']) for event in fetched] == [('2026-10-21T11:00:00', '2026-10-21T12:00:00')]
+
+def test_plan_actions_build_on_earlier_writes(calendar_tools):
+    ct = calendar_tools
+    result = ct.handle_actions([
+        {'type': 'create_event', 'parameters': {
+            'title': 'X', 'start_time': '2026-10-19T09:00', 'end_time': '2026-10-19T10:00'}},
+        {'type': 'shift_events_batch', 'parameters': {'source_date': '2026-10-19', 'target_date': '2026-10-21'}},
+        {'type': 'shift_events_batch', 'parameters': {'source_date': '2026-10-21', 'target_date': '2026-10-22'}},
+    ])
+
+    assert result['status'] == 'success'
+    assert [event['title'] for event in ct.fetch_events(date='2026-10-22')['events']] == ['X']
+    assert ct.fetch_events(date='2026-10-19')['events'] == []
+
+def test_handle_action_routes_through_registry(calendar_tools):
+    ct = calendar_tools
+    from action_registry import ACTIONS
+
+    held = ct.handle_action('create_holding', {'title': 'H'})
+    promoted = ct.handle_action('promote_holding', {
+        'item_id': held['id'], 'start_time': '2026-10-19T09:00', 'end_time': '2026-10-19T10:00'})
+
+    assert promoted['status'] == 'success'
+    assert [event['title'] for event in ct.fetch_events(date='2026-10-19')['events']] == ['H']
+    assert ct.handle_action('get_free_slots', {'date': '2026-10-19', 'min_duration': '60'}) == \
+        ACTIONS['get_free_slots'].run({'date': '2026-10-19', 'min_duration': 60})
+    assert ct.handle_action('create_event', {'title': 'X'}) == \
+        {'status': 'error', 'message': "Missing parameter: 'start_time'"}
+    assert ct.handle_action('bogus', {})['status'] == 'error'
@@ -0,0 +1,84 @@
+# tests/test_recurring_utils.py - Recurrence Expansion
+import pytest
+
+from utils import recurring_utils
+from utils.recurring_utils import (
+    expand_patterns_batch, generate_instances_for_patterns, generate_instances_from_pattern,
+)
+
+def monthly_pattern(first_occurrence, **fields):
+    return {
+        'id': f'monthly-{first_occurrence}',
+        'title': 'Month end',
+        'first_occurrence': first_occurrence,
+        'start_time': '09:00',
+        'end_time': '10:00',
+        'recurrence_type': 'monthly',
+        'recurrence_interval': 1,
+        'recurrence_end_type': 'never',
+        'created_at': '2025-01-01T00:00:00',
+        **fields,
+    }
+
+def occurrence_dates(instances):
+    return [instance['occurrence_date'] for instance in instances]
+
+def test_monthly_day_31_same_dates_with_and_without_window(empty_store):
+    pattern = monthly_pattern('2025-01-31')
+    legacy = occurrence_dates(generate_instances_from_pattern(pattern))
+    windowed = occurrence_dates(generate_instances_from_pattern(
+        pattern, window_start='2025-01-01', window_end='2026-02-01',
+    ))
+    assert legacy[:4] == ['2025-01-31', '2025-02-28', '2025-03-31', '2025-04-30']
+    assert windowed == legacy
+
+def test_monthly_days_29_to_31_match_across_leap_year(empty_store):
+    for day in ('29', '30', '31'):
+        pattern = monthly_pattern(f'2027-12-{day}', recurrence_end_type='count', recurrence_end_count=6)
+        legacy = occurrence_dates(generate_instances_from_pattern(pattern))
+        windowed = occurrence_dates(generate_instances_from_pattern(
+            pattern, window_start='2027-12-01', window_end='2028-07-01',
+        ))
+        assert legacy[2] == '2028-02-29'
+        assert windowed == legacy
+
+BATCH_PATTERNS = [
+    monthly_pattern('2025-01-29'),
+    monthly_pattern('2025-01-30'),
+    monthly_pattern('2025-01-31'),
+    monthly_pattern('2024-12-31', recurrence_interval=2),
+    monthly_pattern('2025-03-31', recurrence_end_type='count', recurrence_end_count=4),
+    {**monthly_pattern('2025-01-06'), 'id': 'weekly', 'recurrence_type': 'weekly'},
+    {**monthly_pattern('2025-02-01'), 'id': 'daily-overnight', 'recurrence_type': 'daily',
+     'recurrence_interval': 3, 'start_time': '23:00', 'end_time': '01:00'},
+    {**monthly_pattern('2025-01-31'), 'id': 'rrule', 'rrule': 'FREQ=MONTHLY;BYMONTHDAY=-1;COUNT=8'},
+]
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_batch_expansion_matches_per_pattern_expansion(empty_store, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(recurring_utils, 'np', None)
+    elif recurring_utils.np is None:
+        pytest.skip('numpy not installed')
+    window = ('2025-01-15', '2025-12-01')
+    exceptions = {pattern['id']: set() for pattern in BATCH_PATTERNS}
+    exceptions['monthly-2025-01-31'] = {'2025-04-30'}
+    exceptions['weekly'] = {'2025-02-03'}
+
+    batch = expand_patterns_batch(BATCH_PATTERNS, *window, exceptions.__getitem__)
+    assert [expanded.pattern['id'] for expanded in batch] == [pattern['id'] for pattern in BATCH_PATTERNS]
+    for pattern, expanded in zip(BATCH_PATTERNS, batch):
+        expected = recurring_utils.expand_pattern_in_window(pattern, *window, exceptions[pattern['id']])
+        assert list(expanded) == expected, pattern['id']
+        assert expected
+
+def test_generate_instances_for_patterns_matches_generate_instances(empty_store):
+    window = ('2025-01-15', '2025-12-01')
+    expected = {
+        pattern['id']: generate_instances_from_pattern(pattern, window_start=window[0], window_end=window[1])
+        for pattern in BATCH_PATTERNS
+    }
+    recurring_utils.expansion_cache.clear()
+    assert generate_instances_for_patterns(BATCH_PATTERNS, *window) == expected
+    # Second call is served from the cache
+    assert generate_instances_for_patterns(BATCH_PATTERNS, *window) == expected
@@ -0,0 +1,118 @@
+# utils/change_feed.py - Sequenced Log of Calendar Writes
+import os
+import threading
+import uuid
+
+from .data_manager import COLLECTION_FILES, ReadOnlyRecord, add_write_listener, collection_version, store_epoch
+
+# How many changes are kept for clients to catch up from
+CHANGE_LOG_SIZE = int(os.environ.get('CALENDAR_CHANGE_LOG_SIZE', 5000))
+
+class ChangeFeed:
+    """In-memory log of every write, numbered with a monotonic sequence.
+
+    Cursors look like '<epoch>:<seq>'. The epoch changes when the process
+    restarts or when data_manager's store_epoch() moves: a journal was
+    compacted or replaced, another process wrote, the backend was swapped.
+    The log cannot describe those changes. A cursor from another epoch, or
+    one older than the retained log, is answered with a full-resync marker.
+    """
+
+    def __init__(self, max_entries=CHANGE_LOG_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Condition()
+        self._entries = []
+        self._seq = 0
+        self._epoch = uuid.uuid4().hex[:12]
+        # Oldest seq a client can resume from without a resync
+        self._floor = 0
+        self._store_epoch = None
+
+    def _check_store(self):
+        """Start a new epoch if the store's data was replaced rather than written"""
+        # Reading the versions is what lets the backend notice outside changes
+        for collection in COLLECTION_FILES:
+            collection_version(collection)
+        epoch = store_epoch()
+        if self._store_epoch is not None and epoch != self._store_epoch:
+            self._epoch = uuid.uuid4().hex[:12]
+            self._entries = []
+            self._floor = self._seq
+        self._store_epoch = epoch
+
+    @property
+    def cursor(self):
+        with self._lock:
+            return f"{self._epoch}:{self._seq}"
+
+    def record(self, collection, puts=(), deletes=()):
+        """Append one write to the log and wake anyone waiting for changes"""
+        with self._lock:
+            for record in puts:
+                self._seq += 1
+                frozen = record if isinstance(record, ReadOnlyRecord) else ReadOnlyRecord(record)
+                self._entries.append((self._seq, collection, 'upsert', record['id'], frozen))
+            for record_id in deletes:
+                self._seq += 1
+                self._entries.append((self._seq, collection, 'delete', record_id, None))
+            overflow = len(self._entries) - self.max_entries
+            if overflow > 0:
+                self._floor = self._entries[overflow - 1][0]
+                del self._entries[:overflow]
+            self._lock.notify_all()
+
+    def _parse(self, cursor):
+        epoch, sep, seq = (cursor or '').partition(':')
+        if not sep or epoch != self._epoch:
+            return None
+        try:
+            seq = int(seq)
+        except ValueError:
+            return None
+        return seq if self._floor <= seq <= self._seq else None
+
+    def changes_since(self, cursor, limit=1000):
+        """{'cursor', 'resync', 'changes', 'has_more'} for everything after `cursor`.
+
+        Each record appears once, with its latest state: an upsert carrying
+        the record, or a delete tombstone. Pass the returned cursor back to
+        continue from there.
+        """
+        with self._lock:
+            self._check_store()
+            since = self._parse(cursor)
+            if since is None:
+                return {'cursor': f"{self._epoch}:{self._seq}", 'resync': True, 'changes': [], 'has_more': False}
+
+            latest = {}
+            last_seq = since
+            has_more = False
+            for seq, collection, op, record_id, record in self._entries:
+                if seq <= since:
+                    continue
+                key = (collection, record_id)
+                if key not in latest and len(latest) >= limit:
+                    has_more = True
+                    break
+                latest[key] = (seq, collection, op, record_id, record)
+                last_seq = seq
+
+        changes = []
+        for seq, collection, op, record_id, record in sorted(latest.values(), key=lambda entry: entry[0]):
+            change = {'seq': seq, 'collection': collection, 'op': op, 'id': record_id}
+            if record is not None:
+                change['record'] = record
+            changes.append(change)
+        return {'cursor': f"{self._epoch}:{last_seq}", 'resync': False, 'changes': changes, 'has_more': has_more}
+
+    def wait(self, cursor, timeout):
+        """Block until the log moves past `cursor` (or timeout); True if it did"""
+        with self._lock:
+            return self._lock.wait_for(lambda: self._parse(cursor) != self._seq, timeout)
+
+change_feed = ChangeFeed()
+
+def _on_write(collection, puts, deletes):
+    change_feed.record(collection, puts, deletes)
+
+add_write_listener(_on_write)
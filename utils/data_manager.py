@@ -1,14 +1,35 @@
 # utils/data_manager.py - Data Storage Management
+import contextvars
+import itertools
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+from .group_commit import GroupCommitter
+
 # File paths
 DATA_DIR = 'data'
 EVENTS_FILE = os.path.join(DATA_DIR, 'events.json')
 PATTERNS_FILE = os.path.join(DATA_DIR, 'recurring_patterns.json')
 LAYERS_FILE = os.path.join(DATA_DIR, 'layers.json')
 TASKS_FILE = os.path.join(DATA_DIR, 'tasks.json')
+SQLITE_FILE = os.path.join(DATA_DIR, 'calendar.db')
+# Redo log for writes that span several files (see commit_transaction)
+TRANSACTION_FILE = os.path.join(DATA_DIR, 'transaction.journal')
+
+# Storage backend: 'json' (one file per collection), 'json-sharded' (events
+# split into per-month files under data/events/) or 'sqlite'
+STORAGE_BACKEND = os.environ.get('CALENDAR_STORAGE', 'json')
+
+# Collection name -> JSON file
+COLLECTION_FILES = {
+    'events': EVENTS_FILE,
+    'recurring_patterns': PATTERNS_FILE,
+    'layers': LAYERS_FILE,
+    'tasks': TASKS_FILE,
+}
 
 # Default layers configuration
 DEFAULT_LAYERS = {
@@ -42,53 +63,664 @@ DEFAULT_LAYERS = {
     }
 }
 
+class ReadOnlyRecord(dict):
+    """A record shared through the load cache.
+
+    Loaders hand out fresh top-level dicts, but the records inside them are
+    shared with the cache, so they refuse in-place changes. Copy one with
+    dict(record) (or record.copy()) before modifying it.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached records are read-only; copy with dict(record) before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class CollectionView(dict):
+    """A loaded collection, private to the caller.
+
+    Remembers the cached mapping it was copied from, so saving it back only
+    writes the records this caller actually added, replaced or removed.
+    """
+    __slots__ = ('base',)
+
+    def __init__(self, base):
+        super().__init__(base)
+        self.base = base
+
+# Mutations are appended to "<file>.journal" next to each data file; the
+# journal is folded back into the snapshot once it holds this many entries.
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_COMPACT_THRESHOLD = int(os.environ.get('CALENDAR_JOURNAL_COMPACT_AT', 500))
+
+_generations = itertools.count(1)
+
+class _FileState:
+    """Cached contents of one data file (snapshot + replayed journal).
+
+    `generation` is unique per distinct content seen by this process.
+    """
+    __slots__ = ('stamp', 'data', 'journal_entries', 'generation')
+
+    def __init__(self, stamp, data, journal_entries):
+        self.stamp = stamp
+        self.data = data
+        self.journal_entries = journal_entries
+        self.generation = next(_generations)
+
+# Parsed file contents keyed by path: {filepath: _FileState}
+_cache = {}
+_cache_lock = threading.Lock()
+_file_locks = {}
+# Writes queued for the group commit but not yet fsynced, per file
+_inflight = {}
+
+# Changes whenever stored data may have moved without the write listeners
+# hearing about it; see store_epoch()
+_store_epochs = itertools.count(1)
+_store_epoch = next(_store_epochs)
+
+# Journal appends arriving within this many milliseconds share one fsync
+WRITE_COALESCE_MS = float(os.environ.get('CALENDAR_WRITE_COALESCE_MS', 20))
+_committer = None
+
+def get_committer():
+    """Return the shared GroupCommitter used for journal appends"""
+    global _committer
+    if _committer is None:
+        with _cache_lock:
+            if _committer is None:
+                _committer = GroupCommitter(WRITE_COALESCE_MS)
+    return _committer
+
+def store_epoch():
+    """Token that changes when stored data was replaced rather than written.
+
+    Moves when a journal is compacted, when a data file changed on disk
+    behind the cache (another process), when a cache is discarded after a
+    failed write, and when the backend is swapped. Anything that mirrors
+    writes from the listeners has to start over when it changes.
+    """
+    return _store_epoch
+
+def _bump_store_epoch():
+    global _store_epoch
+    _store_epoch = next(_store_epochs)
+
+def _file_lock(filepath):
+    with _cache_lock:
+        lock = _file_locks.get(filepath)
+        if lock is None:
+            lock = _file_locks[filepath] = threading.RLock()
+        return lock
+
+def journal_path(filepath):
+    """Path of the mutation journal that sits next to a data file"""
+    return filepath + JOURNAL_SUFFIX
+
+def _file_stamp(filepath):
+    """Cheap change detector for a data file: (mtime_ns, size), or None if missing"""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _stamp(filepath):
+    return (_file_stamp(filepath), _file_stamp(journal_path(filepath)))
+
+def _freeze(data):
+    """Wrap each top-level record so the cached copy cannot be changed by callers"""
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: value if isinstance(value, ReadOnlyRecord) or not isinstance(value, dict) else ReadOnlyRecord(value)
+        for key, value in data.items()
+    }
+
+def _read_journal(path):
+    """Read journal entries, ignoring a torn final line left by a crash"""
+    try:
+        with open(path, 'r') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            if lineno < len(lines):
+                print(f"Skipping corrupt journal line {lineno} in {path}")
+    return entries
+
+def _apply_entries(data, entries):
+    for entry in entries:
+        if entry.get('op') == 'put':
+            data[entry['id']] = entry['record']
+        elif entry.get('op') == 'del':
+            data.pop(entry['id'], None)
+
+def _fsync_directory(path):
+    try:
+        fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _read_state(filepath):
+    """Return the cached state for a file, re-reading it only if it changed on disk"""
+    with _cache_lock:
+        state = _cache.get(filepath)
+        busy = _inflight.get(filepath)
+    if state and busy:
+        # Queued writes are not on disk yet; the cached copy is newer than the files
+        return state
+    stamp = _stamp(filepath)
+    if state and state.stamp == stamp:
+        return state
+    data = {}
+    if stamp[0] is not None:
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+    entries = _read_journal(journal_path(filepath))
+    if isinstance(data, dict):
+        _apply_entries(data, entries)
+    fresh = _FileState(stamp, _freeze(data), len(entries))
+    with _cache_lock:
+        current = _cache.get(filepath)
+        if (current is not None and current is not state) or _inflight.get(filepath):
+            # A write from this process got in while we were reading; its state is newer
+            return current or fresh
+        _cache[filepath] = fresh
+    if state is not None:
+        # Changed on disk without going through this process
+        _bump_store_epoch()
+    return fresh
+
+def _diff_entries(base, data):
+    """Journal entries that turn `base` into `data`"""
+    entries = []
+    for key, value in data.items():
+        old = base.get(key)
+        if old is not value and old != value:
+            entries.append({'op': 'put', 'id': key, 'record': value})
+    for key in base:
+        if key not in data:
+            entries.append({'op': 'del', 'id': key})
+    return entries
+
+def _commit_files(changes):
+    """Durably append entries to one or more journals and fold them into the cache.
+
+    `changes` maps filepath -> entries, where entries is a list or a callable
+    that builds the list from the file's current cached state (it runs under
+    the file lock). The cache is updated as soon as entries are queued, so
+    later reads and writes in this process see them in order. Returns once
+    the group commit has fsynced every file's entries.
+    """
+    committer = get_committer()
+    queued = []
+    for filepath, entries in changes.items():
+        with _file_lock(filepath):
+            state = _read_state(filepath)
+            if callable(entries):
+                entries = entries(state)
+            if not entries:
+                continue
+            lines = ''.join(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries)
+            pending = committer.enqueue(journal_path(filepath), lines)
+
+            data = dict(state.data)
+            for entry in entries:
+                if entry['op'] == 'put':
+                    record = entry['record']
+                    data[entry['id']] = record if isinstance(record, ReadOnlyRecord) or not isinstance(record, dict) else ReadOnlyRecord(record)
+                else:
+                    data.pop(entry['id'], None)
+            with _cache_lock:
+                _cache[filepath] = _FileState(state.stamp, data, state.journal_entries + len(entries))
+                _inflight[filepath] = _inflight.get(filepath, 0) + 1
+            queued.append((filepath, pending))
+
+    error = None
+    to_compact = []
+    for filepath, pending in queued:
+        try:
+            committer.wait(pending)
+        except Exception as e:
+            error = error or e
+        with _file_lock(filepath):
+            with _cache_lock:
+                state = _cache.get(filepath)
+                if pending.error is None and state is not None and _inflight[filepath] == 1:
+                    # Everything queued for this file is on disk: adopt the new
+                    # stamp before readers go back to checking it
+                    state.stamp = _stamp(filepath)
+                _inflight[filepath] -= 1
+            if pending.error is not None:
+                invalidate_cache(filepath)
+            elif state is not None and state.journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+                to_compact.append(filepath)
+    if error is not None:
+        raise error
+    for filepath in to_compact:
+        compact_json_file(filepath)
+
+def _commit_entries(filepath, entries):
+    """Durably append entries to a single file's journal"""
+    _commit_files({filepath: entries})
+
+_transaction_lock = threading.Lock()
+
+def commit_transaction(changes):
+    """Like _commit_files, but all-or-nothing across files even if the process dies.
+
+    The full set of entries is first written and fsynced to TRANSACTION_FILE,
+    then appended to each journal, then the transaction file is removed.
+    recover_transaction() replays a transaction file left behind by a crash;
+    replaying puts and deletes is idempotent, so entries that already made
+    it into a journal are harmless.
+    """
+    changes = {filepath: entries for filepath, entries in changes.items() if entries}
+    if len(changes) <= 1:
+        _commit_files(changes)
+        return
+    ensure_data_directory()
+    with _transaction_lock:
+        tmp_path = TRANSACTION_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(changes, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, TRANSACTION_FILE)
+        _fsync_directory(TRANSACTION_FILE)
+        _commit_files(changes)
+        os.remove(TRANSACTION_FILE)
+        _fsync_directory(TRANSACTION_FILE)
+
+def recover_transaction():
+    """Finish a multi-file transaction interrupted by a crash; True if one was replayed"""
+    try:
+        with open(TRANSACTION_FILE, 'r') as f:
+            changes = json.load(f)
+    except FileNotFoundError:
+        return False
+    except ValueError:
+        # Written via rename, so this file never made it to disk in full
+        # and no journal was touched yet
+        print(f"Discarding unreadable {TRANSACTION_FILE}")
+        os.remove(TRANSACTION_FILE)
+        return False
+    with _transaction_lock:
+        _commit_files(changes)
+        os.remove(TRANSACTION_FILE)
+        _fsync_directory(TRANSACTION_FILE)
+    return True
+
+def compact_json_file(filepath):
+    """Fold a file's journal into a fresh snapshot and truncate the journal.
+
+    The snapshot is written to a temporary file and renamed into place, so a
+    crash leaves either the old snapshot + journal or the new snapshot (the
+    journal replays idempotently on top of either).
+    """
+    with _file_lock(filepath), get_committer().exclusive():
+        state = _read_state(filepath)
+        if not state.journal_entries:
+            return
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state.data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        _fsync_directory(filepath)
+        try:
+            os.remove(journal_path(filepath))
+        except FileNotFoundError:
+            pass
+        with _cache_lock:
+            compacted = _FileState(_stamp(filepath), state.data, 0)
+            compacted.generation = state.generation
+            _cache[filepath] = compacted
+        _bump_store_epoch()
+
+def invalidate_cache(filepath=None):
+    """Drop cached contents for one file (or all files) so the next load re-reads disk"""
+    with _cache_lock:
+        if filepath is None:
+            _cache.clear()
+        else:
+            _cache.pop(filepath, None)
+    _bump_store_epoch()
+
 def ensure_data_directory():
     """Ensure the data directory exists"""
     os.makedirs(DATA_DIR, exist_ok=True)
 
 def load_json_file(filepath, default_data=None):
-    """Generic function to load JSON files"""
+    """Generic function to load JSON files.
+
+    The file is read as its last snapshot plus any journaled mutations. The
+    result is cached in memory and reused while the snapshot and journal
+    mtime/size are unchanged. Each call returns a new CollectionView whose
+    records are read-only views shared with the cache.
+    """
     ensure_data_directory()
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        return default_data or {}
+        state = _read_state(filepath)
+        if state.stamp == (None, None):
+            return default_data or {}
+        if isinstance(state.data, dict):
+            return CollectionView(state.data)
+        return state.data
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return default_data or {}
 
 def save_json_file(filepath, data):
-    """Generic function to save JSON files"""
+    """Generic function to save JSON files.
+
+    Only the records that differ from what the caller loaded are appended to
+    the file's journal; the full file is rewritten only by compaction. Returns
+    once the change is fsynced (possibly together with concurrent writes).
+    """
     ensure_data_directory()
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        base = data.base if isinstance(data, CollectionView) else None
+        _commit_entries(filepath, lambda state: _diff_entries(state.data if base is None else base, data))
+        return True
+    except Exception as e:
+        invalidate_cache(filepath)
+        print(f"Error saving {filepath}: {e}")
+        return False
+
+def write_json_records(filepath, puts=(), deletes=()):
+    """Append record-level puts/deletes to a file's journal"""
+    entries = [{'op': 'put', 'id': record['id'], 'record': record} for record in puts]
+    entries += [{'op': 'del', 'id': record_id} for record_id in deletes]
+    try:
+        _commit_entries(filepath, entries)
         return True
     except Exception as e:
+        invalidate_cache(filepath)
         print(f"Error saving {filepath}: {e}")
         return False
 
+class JsonFileBackend:
+    """Stores each collection as a JSON snapshot plus a mutation journal under DATA_DIR"""
+
+    def __init__(self):
+        recover_transaction()
+
+    def load(self, collection):
+        return load_json_file(COLLECTION_FILES[collection])
+
+    def load_record(self, collection, record_id):
+        return self.load(collection).get(record_id)
+
+    def load_range(self, collection, start, end):
+        return {
+            record_id: record for record_id, record in self.load(collection).items()
+            if event_overlaps(record, start, end)
+        }
+
+    def write(self, collection, puts=(), deletes=()):
+        return write_json_records(COLLECTION_FILES[collection], puts=puts, deletes=deletes)
+
+    def file_entries(self, collection, puts=(), deletes=()):
+        """{filepath: journal entries} that apply a write to one collection"""
+        entries = [{'op': 'put', 'id': record['id'], 'record': record} for record in puts]
+        entries += [{'op': 'del', 'id': record_id} for record_id in deletes]
+        return {COLLECTION_FILES[collection]: entries}
+
+    def write_many(self, changes):
+        """Apply {collection: (puts, deletes)} as one transaction across files"""
+        files = {}
+        for collection, (puts, deletes) in changes.items():
+            for filepath, entries in self.file_entries(collection, puts, deletes).items():
+                files.setdefault(filepath, []).extend(entries)
+        try:
+            commit_transaction(files)
+            return True
+        except Exception as e:
+            for filepath in files:
+                invalidate_cache(filepath)
+            print(f"Error saving {', '.join(changes)}: {e}")
+            return False
+
+    def version(self, collection):
+        return _read_state(COLLECTION_FILES[collection]).generation
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+    """Return the storage backend selected by STORAGE_BACKEND"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if STORAGE_BACKEND == 'sqlite':
+                    from .sqlite_store import SqliteBackend
+                    _backend = SqliteBackend(SQLITE_FILE)
+                elif STORAGE_BACKEND == 'json-sharded':
+                    from .event_shards import ShardedJsonBackend
+                    _backend = ShardedJsonBackend()
+                elif STORAGE_BACKEND == 'json':
+                    _backend = JsonFileBackend()
+                else:
+                    raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND}")
+    return _backend
+
+def set_backend(backend):
+    """Swap the active storage backend (e.g. for a migration or a test run)"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+    _bump_store_epoch()
+
+def event_overlaps(event, start, end):
+    """True if an event's [start, end] intersects the window [start, end).
+
+    All values are ISO date/datetime strings, compared as text; an event with
+    no end is treated as an instant at its start.
+    """
+    event_start = event.get('start')
+    if not event_start or event_start >= end:
+        return False
+    event_end = event.get('end') or event_start
+    return event_end > start or event_start >= start
+
+# Callbacks run after every successful write: fn(collection, puts, deletes)
+_write_listeners = []
+
+def add_write_listener(listener):
+    """Register fn(collection, puts, deletes), called after each successful write"""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+def collection_version(collection):
+    """Cheap token that changes whenever a collection's contents change"""
+    return get_backend().version(collection)
+
+class PendingWrites:
+    """Writes held back by deferred_writes(), folded to each record's final state"""
+
+    def __init__(self):
+        # collection -> {record_id: record, or None once deleted}, in write order
+        self.records = {}
+
+    def add(self, collection, puts=(), deletes=()):
+        staged = self.records.setdefault(collection, {})
+        for record in puts:
+            staged.pop(record['id'], None)
+            staged[record['id']] = record if isinstance(record, ReadOnlyRecord) else ReadOnlyRecord(record)
+        for record_id in deletes:
+            staged.pop(record_id, None)
+            staged[record_id] = None
+
+    def staged(self, collection):
+        """{record_id: record or None} pending for one collection"""
+        return self.records.get(collection, {})
+
+    def changes(self):
+        """{collection: (puts, deletes)}, ready for write_many"""
+        return {
+            collection: (
+                [record for record in staged.values() if record is not None],
+                [record_id for record_id, record in staged.items() if record is None],
+            )
+            for collection, staged in self.records.items()
+        }
+
+# Set while deferred_writes() is collecting writes in this context
+_pending_writes = contextvars.ContextVar('pending_writes', default=None)
+
+def pending_writes():
+    """The PendingWrites being collected in this context, or None"""
+    return _pending_writes.get()
+
+@contextmanager
+def deferred_writes():
+    """Collect every write made in this context instead of applying it.
+
+    Inside the block write_records/put_record/delete_record only record the
+    change and report success. Pass the yielded PendingWrites' changes() to
+    write_many to commit them atomically, or drop it to discard them.
+    """
+    pending = PendingWrites()
+    token = _pending_writes.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_writes.reset(token)
+
+# Record-level access
+def load_record(collection, record_id):
+    """Load a single record by id, or None if it does not exist"""
+    return get_backend().load_record(collection, record_id)
+
+def write_records(collection, puts=(), deletes=()):
+    """Insert/replace the records in `puts` and delete the ids in `deletes`"""
+    puts, deletes = list(puts), list(deletes)
+    if not puts and not deletes:
+        return True
+    pending = _pending_writes.get()
+    if pending is not None:
+        pending.add(collection, puts, deletes)
+        return True
+    ensure_data_directory()
+    try:
+        if not get_backend().write(collection, puts=puts, deletes=deletes):
+            return False
+    except Exception as e:
+        print(f"Error writing {collection}: {e}")
+        return False
+    _notify_listeners(collection, puts, deletes)
+    return True
+
+def _notify_listeners(collection, puts, deletes):
+    for listener in list(_write_listeners):
+        try:
+            listener(collection, puts, deletes)
+        except Exception as e:
+            print(f"Write listener failed for {collection}: {e}")
+
+def write_many(changes):
+    """Apply writes to several collections at once: either all land or none do.
+
+    `changes` maps collection -> (puts, deletes). Listeners are told about
+    each collection only after the whole set is committed.
+    """
+    changes = {
+        collection: (list(puts), list(deletes))
+        for collection, (puts, deletes) in changes.items() if puts or deletes
+    }
+    if not changes:
+        return True
+    pending = _pending_writes.get()
+    if pending is not None:
+        for collection, (puts, deletes) in changes.items():
+            pending.add(collection, puts, deletes)
+        return True
+    ensure_data_directory()
+    try:
+        if not get_backend().write_many(changes):
+            return False
+    except Exception as e:
+        print(f"Error writing {', '.join(changes)}: {e}")
+        return False
+    for collection, (puts, deletes) in changes.items():
+        _notify_listeners(collection, puts, deletes)
+    return True
+
+def put_record(collection, record):
+    """Insert or replace a single record (keyed by record['id'])"""
+    return write_records(collection, puts=[record])
+
+def delete_record(collection, record_id):
+    """Delete a single record by id"""
+    return write_records(collection, deletes=[record_id])
+
+def _save_collection(collection, data):
+    """Save a whole collection by writing only what differs from what the caller loaded"""
+    base = data.base if isinstance(data, CollectionView) else get_backend().load(collection)
+    puts = []
+    for record_id, record in data.items():
+        old = base.get(record_id)
+        if old is not record and old != record:
+            puts.append(record if record.get('id') == record_id else {**record, 'id': record_id})
+    deletes = [record_id for record_id in base if record_id not in data]
+    return write_records(collection, puts=puts, deletes=deletes)
+
 # Specific data loaders and savers
 def load_events():
-    """Load event instances from JSON file"""
-    return load_json_file(EVENTS_FILE)
+    """Load event instances"""
+    return get_backend().load('events')
+
+def load_events_in_range(start, end):
+    """Load only the events that overlap [start, end) (ISO date/datetime strings)"""
+    return get_backend().load_range('events', start, end)
 
 def save_events(events_dict):
-    """Save event instances to JSON file"""
-    return save_json_file(EVENTS_FILE, events_dict)
+    """Save event instances"""
+    return _save_collection('events', events_dict)
 
 def load_recurring_patterns():
-    """Load recurring patterns from JSON file"""
-    return load_json_file(PATTERNS_FILE)
+    """Load recurring patterns"""
+    return get_backend().load('recurring_patterns')
 
 def save_recurring_patterns(patterns_dict):
-    """Save recurring patterns to JSON file"""
-    return save_json_file(PATTERNS_FILE, patterns_dict)
+    """Save recurring patterns"""
+    return _save_collection('recurring_patterns', patterns_dict)
 
 def load_layers():
-    """Load layers from JSON file"""
-    layers = load_json_file(LAYERS_FILE)
+    """Load layers"""
+    layers = get_backend().load('layers')
     if not layers:
         # Initialize with default layers
         save_layers(DEFAULT_LAYERS)
@@ -96,13 +728,13 @@ def load_layers():
     return layers
 
 def save_layers(layers_dict):
-    """Save layers to JSON file"""
-    return save_json_file(LAYERS_FILE, layers_dict)
+    """Save layers"""
+    return _save_collection('layers', layers_dict)
 
 def load_tasks():
-    """Load tasks from JSON file"""
-    return load_json_file(TASKS_FILE)
+    """Load tasks"""
+    return get_backend().load('tasks')
 
 def save_tasks(tasks_dict):
-    """Save tasks to JSON file"""
-    return save_json_file(TASKS_FILE, tasks_dict)
\ No newline at end of file
+    """Save tasks"""
+    return _save_collection('tasks', tasks_dict)
@@ -0,0 +1,182 @@
+# utils/event_shards.py - Month-Partitioned Event Storage
+import os
+import re
+
+from .data_manager import (
+    DATA_DIR, EVENTS_FILE, CollectionView, JsonFileBackend,
+    _commit_files, _file_lock, _read_state, event_overlaps, load_json_file
+)
+
+# data/events/2025-03.json, data/events/undated.json, ... (each with its own journal)
+EVENT_SHARD_DIR = os.path.join(DATA_DIR, 'events')
+MANIFEST_NAME = 'manifest.json'
+UNDATED_SHARD = 'undated'
+
+_MONTH_RE = re.compile(r'^(\d{4})-(\d{2})')
+
+def _month(value):
+    match = _MONTH_RE.match(value or '')
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+def months_between(start, end):
+    """Shard keys ('YYYY-MM') from the month of `start` through the month of `end`"""
+    first, last = _month(start), _month(end)
+    if first is None:
+        return []
+    if last is None or last < first:
+        last = first
+    keys = []
+    year, month = first
+    while (year, month) <= last:
+        keys.append(f'{year:04d}-{month:02d}')
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return keys
+
+def event_shards(event):
+    """Shards an event is listed in: every month it covers, or the undated shard"""
+    return months_between(event.get('start'), event.get('end')) or [UNDATED_SHARD]
+
+class ShardedJsonBackend(JsonFileBackend):
+    """JSON backend that partitions events into one journaled file per month.
+
+    An event is listed in every month shard it covers. A journaled manifest
+    maps each event id to its shards so record-level writes can find the
+    files to touch without opening the rest. Other collections are stored as
+    plain JSON files, exactly like JsonFileBackend.
+
+    Anything that reads the manifest to decide which shards to touch holds
+    the manifest's file lock until it is done, so it never acts on a manifest
+    that a concurrent event write has already moved past.
+    """
+
+    def __init__(self, shard_dir=EVENT_SHARD_DIR):
+        super().__init__()
+        self.shard_dir = shard_dir
+        self.manifest_path = os.path.join(shard_dir, MANIFEST_NAME)
+        self._merged = None
+        os.makedirs(shard_dir, exist_ok=True)
+        if not self._shard_keys() and os.path.exists(EVENTS_FILE):
+            self.import_events_file(EVENTS_FILE)
+
+    def import_events_file(self, filepath=EVENTS_FILE):
+        """One-shot split of an unsharded events file into month shards.
+
+        Runs automatically the first time the shard directory is empty; the
+        source file is left in place. Returns the number of events imported.
+        """
+        events = load_json_file(filepath)
+        records = [
+            record if record.get('id') == record_id else {**record, 'id': record_id}
+            for record_id, record in events.items()
+        ]
+        if records:
+            self.write('events', puts=records)
+        return len(records)
+
+    def shard_path(self, key):
+        return os.path.join(self.shard_dir, f'{key}.json')
+
+    def _shard_keys(self):
+        keys = set()
+        for name in os.listdir(self.shard_dir):
+            if name.endswith('.journal'):
+                name = name[:-len('.journal')]
+            if name.endswith('.json') and name != MANIFEST_NAME:
+                keys.add(name[:-len('.json')])
+        return sorted(keys)
+
+    def _merge(self, keys):
+        merged = {}
+        for key in keys:
+            merged.update(load_json_file(self.shard_path(key)))
+        return merged
+
+    def load(self, collection):
+        if collection != 'events':
+            return super().load(collection)
+        keys = self._shard_keys()
+        # Reuse the merged view while every shard's cached contents are unchanged
+        sources = tuple(_read_state(self.shard_path(key)).data for key in keys)
+        cached = self._merged
+        if cached and len(cached[0]) == len(sources) and all(a is b for a, b in zip(cached[0], sources)):
+            return CollectionView(cached[1])
+        merged = {}
+        for data in sources:
+            merged.update(data)
+        self._merged = (sources, merged)
+        return CollectionView(merged)
+
+    def load_range(self, collection, start, end):
+        if collection != 'events':
+            return super().load_range(collection, start, end)
+        keys = set(self._shard_keys())
+        wanted = [key for key in months_between(start, end) if key in keys]
+        if UNDATED_SHARD in keys:
+            wanted.append(UNDATED_SHARD)
+        return {
+            record_id: record for record_id, record in self._merge(wanted).items()
+            if event_overlaps(record, start, end)
+        }
+
+    def load_record(self, collection, record_id):
+        if collection != 'events':
+            return super().load_record(collection, record_id)
+        with _file_lock(self.manifest_path):
+            for key in load_json_file(self.manifest_path).get(record_id) or []:
+                record = load_json_file(self.shard_path(key)).get(record_id)
+                if record is not None:
+                    return record
+        return None
+
+    def version(self, collection):
+        if collection != 'events':
+            return super().version(collection)
+        return tuple(_read_state(self.shard_path(key)).generation for key in self._shard_keys())
+
+    def write(self, collection, puts=(), deletes=()):
+        if collection != 'events':
+            return super().write(collection, puts=puts, deletes=deletes)
+        try:
+            with _file_lock(self.manifest_path):
+                _commit_files(self.file_entries(collection, puts, deletes))
+            return True
+        except Exception as e:
+            print(f"Error saving event shards: {e}")
+            return False
+
+    def write_many(self, changes):
+        if 'events' not in changes:
+            return super().write_many(changes)
+        with _file_lock(self.manifest_path):
+            return super().write_many(changes)
+
+    def file_entries(self, collection, puts=(), deletes=()):
+        if collection != 'events':
+            return super().file_entries(collection, puts, deletes)
+        manifest = load_json_file(self.manifest_path)
+        shard_entries = {}
+        manifest_entries = []
+
+        def add(key, entry):
+            shard_entries.setdefault(self.shard_path(key), []).append(entry)
+
+        for record in puts:
+            record_id = record['id']
+            keys = event_shards(record)
+            for key in keys:
+                add(key, {'op': 'put', 'id': record_id, 'record': record})
+            for key in manifest.get(record_id) or []:
+                if key not in keys:
+                    add(key, {'op': 'del', 'id': record_id})
+            if manifest.get(record_id) != keys:
+                manifest_entries.append({'op': 'put', 'id': record_id, 'record': keys})
+        for record_id in deletes:
+            for key in manifest.get(record_id) or []:
+                add(key, {'op': 'del', 'id': record_id})
+            if record_id in manifest:
+                manifest_entries.append({'op': 'del', 'id': record_id})
+
+        changes = dict(shard_entries)
+        if manifest_entries:
+            changes[self.manifest_path] = manifest_entries
+        return changes
@@ -0,0 +1,108 @@
+# utils/exception_index.py - Recurring Pattern -> Exception Event Index
+import threading
+
+from .data_manager import (
+    ReadOnlyRecord, add_write_listener, collection_version, load_events, pending_writes,
+)
+
+class PatternExceptionIndex:
+    """Maps each recurring pattern id to the exception events that reference it.
+
+    Built once from the events collection, then kept current by the
+    data_manager write listener, so lookups never scan the event store. If
+    the events change behind our back (another process, a cache reload) the
+    collection version moves and the index rebuilds on next use. Events
+    still held by deferred_writes() are laid over each lookup, the same way
+    StoreSnapshot lays them over its reads, and never enter the index.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._version = None
+        # pattern_id -> {event_id: event}
+        self._linked = {}
+        # event_id -> pattern_id
+        self._owner = {}
+
+    def _ensure_current(self):
+        version = collection_version('events')
+        if version != self._version:
+            # Committed events only: writes held by deferred_writes() may
+            # still be discarded and must never reach the shared index
+            self._rebuild(load_events())
+            self._version = version
+
+    def _rebuild(self, events):
+        self._linked = {}
+        self._owner = {}
+        for event in events.values():
+            self._add(event)
+
+    def _add(self, event):
+        pattern_id = event.get('original_pattern_id')
+        if pattern_id:
+            self._linked.setdefault(pattern_id, {})[event['id']] = event
+            self._owner[event['id']] = pattern_id
+
+    def _remove(self, event_id):
+        pattern_id = self._owner.pop(event_id, None)
+        if pattern_id is not None:
+            linked = self._linked.get(pattern_id)
+            if linked is not None:
+                linked.pop(event_id, None)
+                if not linked:
+                    del self._linked[pattern_id]
+
+    def apply(self, puts=(), deletes=()):
+        """Fold a write into the index (no-op if the index was never built)"""
+        with self._lock:
+            if self._version is None:
+                return
+            for event_id in deletes:
+                self._remove(event_id)
+            for event in puts:
+                self._remove(event['id'])
+                self._add(event if isinstance(event, ReadOnlyRecord) else ReadOnlyRecord(event))
+            self._version = collection_version('events')
+
+    def exceptions(self, pattern_id):
+        """All events linked to a pattern via original_pattern_id"""
+        with self._lock:
+            self._ensure_current()
+            linked = dict(self._linked.get(pattern_id, {}))
+        pending = pending_writes()
+        staged = pending.staged('events') if pending is not None else {}
+        for event_id, event in staged.items():
+            linked.pop(event_id, None)
+            if event is not None and event.get('original_pattern_id') == pattern_id:
+                linked[event_id] = event
+        return list(linked.values())
+
+    def exception_dates(self, pattern_id):
+        """Occurrence dates (YYYY-MM-DD) that a pattern must not generate"""
+        return {
+            event['original_occurrence_date'] for event in self.exceptions(pattern_id)
+            if event.get('original_occurrence_date')
+        }
+
+    def deletions(self, pattern_id):
+        """{occurrence_date: deletion exception event} for a pattern"""
+        return {
+            event.get('original_occurrence_date'): event for event in self.exceptions(pattern_id)
+            if event.get('is_deletion_exception')
+        }
+
+    def moves(self, pattern_id):
+        """{occurrence_date: moved exception event} for a pattern"""
+        return {
+            event.get('original_occurrence_date'): event for event in self.exceptions(pattern_id)
+            if event.get('is_moved_exception')
+        }
+
+exception_index = PatternExceptionIndex()
+
+def _on_write(collection, puts, deletes):
+    if collection == 'events':
+        exception_index.apply(puts, deletes)
+
+add_write_listener(_on_write)
@@ -0,0 +1,129 @@
+# utils/expansion_cache.py - LRU Cache of Expanded Recurring Patterns
+import os
+import threading
+from collections import OrderedDict
+
+from .data_manager import ReadOnlyRecord, add_write_listener
+
+# Upper bound on the number of generated instances held across all entries
+EXPANSION_CACHE_MAX_INSTANCES = int(os.environ.get('CALENDAR_EXPANSION_CACHE_MAX_INSTANCES', 50000))
+
+# Pattern fields that affect the generated instances
+_RULE_FIELDS = (
+    'title', 'first_occurrence', 'start_time', 'end_time', 'recurrence_type',
+    'recurrence_interval', 'recurrence_end_type', 'recurrence_end_date',
+    'recurrence_end_count', 'rrule', 'location', 'description', 'all_day', 'layer', 'created_at',
+)
+
+def pattern_version(pattern):
+    """Token that changes whenever a pattern is edited, even outside the API"""
+    return (
+        pattern.get('updated_at') or pattern.get('created_at'),
+        hash(tuple(repr(pattern.get(field)) for field in _RULE_FIELDS)),
+    )
+
+class ExpansionCache:
+    """LRU cache of pattern expansions.
+
+    Keyed by (pattern id, pattern version, exception-set fingerprint,
+    window), so an entry can never be served for a pattern or exception set
+    that has since changed. The write listener also drops a pattern's
+    entries as soon as the pattern or one of its exception events is
+    written, and caching a new expansion evicts the pattern's older
+    versions. Size is capped by the total number of cached instances.
+    """
+
+    def __init__(self, max_instances=EXPANSION_CACHE_MAX_INSTANCES):
+        self.max_instances = max_instances
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # pattern_id -> set of keys cached for it
+        self._keys = {}
+        self._size = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def key(self, pattern, exception_dates, window):
+        return (pattern['id'], pattern_version(pattern), hash(frozenset(exception_dates)), window)
+
+    def get(self, key):
+        """Cached instances for `key` (a fresh list), or None"""
+        with self._lock:
+            instances = self._entries.get(key)
+            if instances is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return list(instances)
+
+    def put(self, key, instances):
+        """Cache `instances` under `key` and return them as read-only records"""
+        frozen = tuple(ReadOnlyRecord(instance) for instance in instances)
+        if len(frozen) > self.max_instances:
+            return list(frozen)
+        with self._lock:
+            pattern_id = key[0]
+            for old in list(self._keys.get(pattern_id, ())):
+                if old[1:3] != key[1:3] or old == key:
+                    self._drop(old)
+            self._entries[key] = frozen
+            self._keys.setdefault(pattern_id, set()).add(key)
+            self._size += len(frozen)
+            while self._size > self.max_instances and self._entries:
+                self._drop(next(iter(self._entries)))
+                self.stats['evictions'] += 1
+        return list(frozen)
+
+    def _drop(self, key):
+        instances = self._entries.pop(key, None)
+        if instances is None:
+            return
+        self._size -= len(instances)
+        keys = self._keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[key[0]]
+
+    def invalidate(self, pattern_id):
+        """Forget every expansion of one pattern"""
+        with self._lock:
+            keys = self._keys.get(pattern_id)
+            if keys:
+                self.stats['invalidations'] += 1
+                for key in list(keys):
+                    self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._size = 0
+
+    def info(self):
+        """Counters plus current size, for sizing the cap"""
+        with self._lock:
+            return {
+                **self.stats,
+                'entries': len(self._entries),
+                'instances': self._size,
+                'max_instances': self.max_instances,
+            }
+
+expansion_cache = ExpansionCache()
+
+def _on_write(collection, puts, deletes):
+    if collection == 'recurring_patterns':
+        for record in puts:
+            expansion_cache.invalidate(record['id'])
+        for record_id in deletes:
+            expansion_cache.invalidate(record_id)
+    elif collection == 'events':
+        # Deleted exceptions change the exception fingerprint, so their
+        # pattern's old entries can no longer be hit; they age out or are
+        # replaced on the next expansion.
+        for record in puts:
+            if record.get('original_pattern_id'):
+                expansion_cache.invalidate(record['original_pattern_id'])
+
+add_write_listener(_on_write)
@@ -0,0 +1,94 @@
+# utils/group_commit.py - Group Commit for Journal Appends
+import os
+import threading
+import time
+
+class PendingWrite:
+    """One queued append; `done` is set once it is on disk (or failed)"""
+    __slots__ = ('path', 'payload', 'done', 'error')
+
+    def __init__(self, path, payload):
+        self.path = path
+        self.payload = payload
+        self.done = threading.Event()
+        self.error = None
+
+class GroupCommitter:
+    """Coalesces appends from concurrent writers into one fsync per file.
+
+    Writers enqueue() their payload and then wait() for it. The first waiter
+    with nothing ahead of it becomes the leader: it sleeps for the coalescing
+    window so that other writers can queue up behind it, then appends every
+    queued payload in arrival order and fsyncs each touched file once. wait()
+    returns only after the caller's own payload is durable.
+    """
+
+    def __init__(self, window_ms=20):
+        self.window = max(window_ms, 0) / 1000.0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._queue = []
+        self._leader_waiting = False
+        self.stats = {'writes': 0, 'flushes': 0, 'fsyncs': 0}
+
+    def enqueue(self, path, payload):
+        """Queue `payload` (str) to be appended to `path`"""
+        item = PendingWrite(path, payload)
+        with self._lock:
+            self._queue.append(item)
+            self.stats['writes'] += 1
+        return item
+
+    def wait(self, item):
+        """Block until `item` is durable; raises if its append failed"""
+        with self._lock:
+            lead = not self._leader_waiting and not item.done.is_set()
+            if lead:
+                self._leader_waiting = True
+        if lead:
+            if self.window:
+                time.sleep(self.window)
+            with self._flush_lock:
+                with self._lock:
+                    batch, self._queue = self._queue, []
+                    self._leader_waiting = False
+                self._flush(batch)
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+
+    def submit(self, path, payload):
+        """Append `payload` to `path` and return once it has been fsynced"""
+        self.wait(self.enqueue(path, payload))
+
+    def exclusive(self):
+        """Lock that keeps flushes out, e.g. while a journal is being replaced"""
+        return self._flush_lock
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        by_path = {}
+        for item in batch:
+            by_path.setdefault(item.path, []).append(item)
+        for path, items in by_path.items():
+            try:
+                _append_durably(path, ''.join(item.payload for item in items))
+                self.stats['fsyncs'] += 1
+            except Exception as e:
+                for item in items:
+                    item.error = e
+        self.stats['flushes'] += 1
+        for item in batch:
+            item.done.set()
+
+def _append_durably(path, text):
+    with open(path, 'a+b') as f:
+        # Terminate a torn line left by a crash so it can't swallow this write
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                text = '\n' + text
+        f.write(text.encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
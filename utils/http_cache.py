@@ -0,0 +1,122 @@
+# utils/http_cache.py - Conditional GET Support for API Endpoints
+import gzip
+import hashlib
+import threading
+import time
+import uuid
+from functools import wraps
+
+from flask import Response, make_response, request
+
+from .data_manager import collection_version
+
+# Generations restart with the process, so tags from a previous run must never match
+_BOOT_TOKEN = uuid.uuid4().hex
+
+# Bodies smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+# collection -> (version, unix time the version was first seen)
+_first_seen = {}
+_first_seen_lock = threading.Lock()
+
+def _last_modified(collection, version):
+    with _first_seen_lock:
+        seen = _first_seen.get(collection)
+        if seen is None:
+            seen = _first_seen[collection] = (version, int(time.time()))
+        elif seen[0] != version:
+            # Strictly later than before, or a change within the same second
+            # would still satisfy an If-Modified-Since from that second
+            seen = _first_seen[collection] = (version, max(int(time.time()), seen[1] + 1))
+        return seen[1]
+
+def compute_validators(collections, extra=None):
+    """(etag, last_modified) for the current request over the given collections.
+
+    Only the collections' version tokens are read, nothing is loaded. The
+    tag also covers the path, the query string and the Accept and
+    Accept-Encoding headers, since each of those changes the body, plus
+    `extra` for anything else it depends on.
+    """
+    versions = [(collection, collection_version(collection)) for collection in collections]
+    fingerprint = repr((
+        _BOOT_TOKEN, request.path, sorted(request.args.items(multi=True)),
+        request.headers.get('Accept', ''), request.headers.get('Accept-Encoding', ''), versions, extra,
+    ))
+    etag = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:24]
+    last_modified = max(_last_modified(collection, version) for collection, version in versions)
+    return etag, last_modified
+
+def _not_modified(etag, last_modified, use_since=True):
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return use_since and since is not None and last_modified <= since.timestamp()
+
+class _NotModified(Response):
+    """A 304 that keeps its Last-Modified header (Werkzeug drops it from 304s)"""
+
+    def __init__(self):
+        super().__init__(status=304)
+
+    def get_wsgi_headers(self, environ):
+        headers = super().get_wsgi_headers(environ)
+        if 'Last-Modified' in self.headers and 'Last-Modified' not in headers:
+            headers['Last-Modified'] = self.headers['Last-Modified']
+        return headers
+
+def conditional_get(*collections, key=None):
+    """Decorate a GET view whose body depends only on `collections` and the request.
+
+    Adds ETag/Last-Modified to 200 responses and answers a matching
+    If-None-Match (or, without one, If-Modified-Since) with 304 before the
+    view runs. Both carry the same validators and Vary headers.
+
+    `key`, if given, is called per request for anything else the body
+    depends on, such as a default taken from the clock. Its result is part
+    of the ETag; Last-Modified cannot express it, so only If-None-Match can
+    then produce a 304.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Versions are read before the view loads anything, so a write
+            # racing with it can only make the tag older than the body
+            extra = key() if key is not None else None
+            etag, last_modified = compute_validators(collections, extra)
+            if _not_modified(etag, last_modified, use_since=key is None):
+                response = _NotModified()
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'
+            # The tag covers these headers, so caches must key on them too
+            response.vary.update(('Accept', 'Accept-Encoding'))
+            return response
+        return wrapper
+    return decorator
+
+def gzipped(view):
+    """Decorate a view to gzip its 200 response when the client accepts it.
+
+    Streamed responses are left alone, as are bodies under GZIP_MIN_BYTES.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        response.vary.add('Accept-Encoding')
+        if (response.status_code != 200 or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or 'gzip' not in request.accept_encodings):
+            return response
+        body = response.get_data()
+        if len(body) < GZIP_MIN_BYTES:
+            return response
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
+    return wrapper
@@ -2,25 +2,108 @@
 from datetime import datetime, timedelta
 import calendar
 import uuid
-from .data_manager import load_events
+try:
+    import numpy as np
+except ImportError:  # optional: batch expansion falls back to the per-pattern loop
+    np = None
+from .exception_index import exception_index
+from .expansion_cache import expansion_cache
+from .rrule import compile_rrule
 
-def generate_instances_from_pattern(pattern, max_occurrences=52):
-    """Generate event instances from a recurring pattern, excluding exceptions"""
-    instances = []
-    
+# Namespace for recurring instance ids: uuid5(namespace, "<pattern_id>/<YYYY-MM-DD>")
+INSTANCE_ID_NAMESPACE = uuid.UUID('6f1c3a52-8d4e-5b7a-9c0f-2e41d7b8a915')
+
+def instance_id(pattern_id, occurrence_date):
+    """Stable id of one occurrence of a pattern, the same on every load"""
+    return str(uuid.uuid5(INSTANCE_ID_NAMESPACE, f"{pattern_id}/{occurrence_date}"))
+
+def generate_instances_from_pattern(pattern, max_occurrences=52, window_start=None, window_end=None):
+    """Generate event instances from a recurring pattern, excluding exceptions.
+
+    With window_start/window_end, only the occurrences in that window are
+    generated (see expand_pattern_in_window). Without them, the legacy
+    behaviour applies: walk from the first occurrence, capped at
+    max_occurrences and one year.
+
+    Results are served from the expansion cache when the pattern, its
+    exceptions and the window are unchanged; instances are read-only
+    records, so copy one before modifying it.
+    """
     # Get any exceptions for this pattern
-    events = load_events()
-    exceptions = [
-        event for event in events.values() 
-        if event.get('original_pattern_id') == pattern['id']
-    ]
-    exception_dates = [event.get('original_occurrence_date') for event in exceptions if event.get('original_occurrence_date')]
+    exception_dates = exception_index.exception_dates(pattern['id'])
+
+    windowed = window_start is not None and window_end is not None
+    window = (str(window_start), str(window_end)) if windowed else max_occurrences
+    key = expansion_cache.key(pattern, exception_dates, window)
+    instances = expansion_cache.get(key)
+    if instances is None:
+        if windowed:
+            instances = expand_pattern_in_window(pattern, window_start, window_end, exception_dates)
+        else:
+            instances = _expand_pattern(pattern, max_occurrences, exception_dates)
+        instances = expansion_cache.put(key, instances)
+    return instances
+
+def pattern_rule(pattern):
+    """Compiled RecurrenceRule for a pattern's 'rrule' field, or None for classic patterns.
+
+    Raises ValueError if the rule cannot be parsed.
+    """
+    text = pattern.get('rrule')
+    if not text:
+        return None
+    return compile_rrule(text, pattern['first_occurrence'])
+
+def _rrule_occurrences(pattern, window_start, window_end, exception_dates):
+    """(start_time, end_time, dates) of an RRULE pattern overlapping a window, or None.
+
+    Exceptions are removed after the rule is evaluated, so (as in RFC 5545)
+    they still count towards COUNT.
+    """
+    try:
+        rule = pattern_rule(pattern)
+        start_time = datetime.strptime(pattern['start_time'], '%H:%M').time()
+        end_time = datetime.strptime(pattern['end_time'], '%H:%M').time()
+        window_first = _to_date(window_start)
+        window_stop = _to_date(window_end, round_up=True)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Error parsing rrule pattern {pattern.get('id')}: {e}")
+        return None
+    if end_time < start_time:
+        window_first -= timedelta(days=1)
+    dates = [day for day in rule.between(window_first, window_stop) if day.isoformat() not in exception_dates]
+    return start_time, end_time, dates
+
+def _expand_rrule_pattern(pattern, window_start, window_end, exception_dates, max_occurrences=None):
+    occurrences = _rrule_occurrences(pattern, window_start, window_end, exception_dates)
+    if occurrences is None:
+        return []
+    start_time, end_time, dates = occurrences
+    if max_occurrences is not None:
+        dates = dates[:max_occurrences]
+    return [create_instance_from_pattern(pattern, day, start_time, end_time) for day in dates]
+
+def _expand_pattern(pattern, max_occurrences, exception_dates):
+    """Legacy expansion: walk forward from the first occurrence"""
+    if pattern.get('rrule'):
+        # Same first-year horizon; an RRULE with COUNT/UNTIL ends itself
+        try:
+            first_occurrence = datetime.strptime(pattern['first_occurrence'], '%Y-%m-%d').date()
+            limit = None if pattern_rule(pattern).count else max_occurrences
+        except (ValueError, KeyError) as e:
+            print(f"Error parsing rrule pattern {pattern.get('id')}: {e}")
+            return []
+        return _expand_rrule_pattern(
+            pattern, first_occurrence, first_occurrence + timedelta(days=366), exception_dates, limit
+        )
+
+    instances = []
     
     print(f"Pattern {pattern['id']} has exception dates: {exception_dates}")  # Debug line
     
     # Parse pattern data
     recurrence_type = pattern.get('recurrence_type', 'weekly')
-    recurrence_interval = pattern.get('recurrence_interval', 1)
+    recurrence_interval = max(int(pattern.get('recurrence_interval', 1) or 1), 1)
     recurrence_end_type = pattern.get('recurrence_end_type', 'never')
     recurrence_end_date = pattern.get('recurrence_end_date')
     recurrence_end_count = pattern.get('recurrence_end_count', max_occurrences)
@@ -46,8 +129,13 @@ def generate_instances_from_pattern(pattern, max_occurrences=52):
     if recurrence_end_type == 'count':
         max_occurrences = recurrence_end_count
     
-    current_date = first_occurrence
+    # Unknown rules only ever produce the first occurrence
+    last_index = None if recurrence_type in ('daily', 'weekly', 'monthly') else 0
+    
+    # Dates come from occurrence_on, the same rule the windowed expansion uses
+    index = 0
     count = 0
+    current_date = first_occurrence
     
     while count < max_occurrences and current_date <= max_end_date:
         current_date_str = current_date.isoformat()
@@ -55,22 +143,16 @@ def generate_instances_from_pattern(pattern, max_occurrences=52):
         # Skip this occurrence if there's an exception for this date
         if current_date_str in exception_dates:
             print(f"Skipping {current_date_str} due to exception")  # Debug line
-            # Calculate next occurrence and continue without incrementing count
-            current_date = calculate_next_occurrence(current_date, recurrence_type, recurrence_interval)
-            if current_date is None:
-                break
-            continue
-        
-        # Create instance for this occurrence
-        instance = create_instance_from_pattern(pattern, current_date, start_time, end_time)
-        instances.append(instance)
+        else:
+            # Create instance for this occurrence
+            instance = create_instance_from_pattern(pattern, current_date, start_time, end_time)
+            instances.append(instance)
+            count += 1
         
-        # Calculate next occurrence
-        current_date = calculate_next_occurrence(current_date, recurrence_type, recurrence_interval)
-        if current_date is None:
+        if index == last_index:
             break
-        
-        count += 1
+        index += 1
+        current_date = occurrence_on(first_occurrence, recurrence_type, recurrence_interval, index)
     
     return instances
 
@@ -83,9 +165,8 @@ def create_instance_from_pattern(pattern, current_date, start_time, end_time):
     if end_time < start_time:
         instance_end = datetime.combine(current_date + timedelta(days=1), end_time)
     
-    instance_id = str(uuid.uuid4())
     return {
-        'id': instance_id,
+        'id': instance_id(pattern['id'], current_date.isoformat()),
         'title': pattern['title'],
         'start': instance_start.strftime('%Y-%m-%dT%H:%M'),
         'end': instance_end.strftime('%Y-%m-%dT%H:%M'),
@@ -96,33 +177,311 @@ def create_instance_from_pattern(pattern, current_date, start_time, end_time):
         'is_recurring_instance': True,
         'pattern_id': pattern['id'],
         'occurrence_date': current_date.isoformat(),
-        'created_at': datetime.now().isoformat()
+        # The occurrence exists since its pattern does
+        'created_at': pattern.get('created_at') or pattern['first_occurrence']
     }
 
-def calculate_next_occurrence(current_date, recurrence_type, recurrence_interval):
-    """Calculate the next occurrence date based on recurrence rules"""
+def occurrence_on(first_occurrence, recurrence_type, recurrence_interval, index):
+    """Date of the index-th occurrence (0-based), computed directly from the first.
+
+    Monthly rules keep the first occurrence's day of month, clamped to the
+    length of shorter months (Jan 31 -> Feb 28 -> Mar 31). Every expansion
+    path (legacy, windowed, batch) takes its dates from this rule.
+    """
+    if recurrence_type == 'daily':
+        return first_occurrence + timedelta(days=index * recurrence_interval)
+    if recurrence_type == 'monthly':
+        months = first_occurrence.month - 1 + index * recurrence_interval
+        year = first_occurrence.year + months // 12
+        month = months % 12 + 1
+        day = min(first_occurrence.day, calendar.monthrange(year, month)[1])
+        return first_occurrence.replace(year=year, month=month, day=day)
+    return first_occurrence + timedelta(weeks=index * recurrence_interval)
+
+def first_index_on_or_after(first_occurrence, recurrence_type, recurrence_interval, target):
+    """Smallest occurrence index whose date is on or after `target`"""
+    if target <= first_occurrence:
+        return 0
+    if recurrence_type == 'monthly':
+        months = (target.year - first_occurrence.year) * 12 + target.month - first_occurrence.month
+        index = months // recurrence_interval
+        while occurrence_on(first_occurrence, recurrence_type, recurrence_interval, index) < target:
+            index += 1
+        return index
+    step = recurrence_interval if recurrence_type == 'daily' else 7 * recurrence_interval
+    return -(-(target - first_occurrence).days // step)
+
+def _to_date(value, round_up=False):
+    """Parse a date/datetime (or ISO string); round_up moves a non-midnight time to the next day"""
+    if isinstance(value, datetime):
+        parsed = value
+    elif hasattr(value, 'isoformat'):
+        return value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace('Z', ''))
+    day = parsed.date()
+    if round_up and parsed.time() != datetime.min.time():
+        day += timedelta(days=1)
+    return day
+
+class WindowPlan:
+    """A pattern parsed for windowed expansion: occurrence indices [first_index, stop_index)"""
+    __slots__ = (
+        'first_occurrence', 'recurrence_type', 'recurrence_interval',
+        'start_time', 'end_time', 'first_index', 'stop_index',
+    )
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def occurrence(self, index):
+        return occurrence_on(self.first_occurrence, self.recurrence_type, self.recurrence_interval, index)
+
+def plan_window(pattern, window_start, window_end, exception_dates):
+    """Work out which occurrence indices of a pattern overlap [window_start, window_end).
+
+    Returns a WindowPlan, or None if the pattern cannot be parsed. Exceptions
+    do not use up a 'count' limit (same as the legacy expansion): a
+    10-occurrence series with one deleted date still generates 10 instances,
+    so the returned range may include exception dates that callers skip.
+    """
     try:
-        if recurrence_type == 'daily':
-            return current_date + timedelta(days=recurrence_interval)
-        elif recurrence_type == 'weekly':
-            return current_date + timedelta(weeks=recurrence_interval)
-        elif recurrence_type == 'monthly':
-            # Add months while preserving day of month
-            new_month = current_date.month + recurrence_interval
-            new_year = current_date.year + (new_month - 1) // 12
-            new_month = ((new_month - 1) % 12) + 1
-            try:
-                return current_date.replace(year=new_year, month=new_month)
-            except ValueError:
-                # Handle day overflow (e.g., Jan 31 -> Feb 28)
-                max_day = calendar.monthrange(new_year, new_month)[1]
-                return current_date.replace(year=new_year, month=new_month, day=min(current_date.day, max_day))
-    except Exception as e:
-        print(f"Error calculating next occurrence: {e}")
+        first_occurrence = datetime.strptime(pattern['first_occurrence'], '%Y-%m-%d').date()
+        start_time = datetime.strptime(pattern['start_time'], '%H:%M').time()
+        end_time = datetime.strptime(pattern['end_time'], '%H:%M').time()
+        window_first = _to_date(window_start)
+        window_stop = _to_date(window_end, round_up=True)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Error parsing pattern window: {e}")
         return None
 
+    recurrence_type = pattern.get('recurrence_type', 'weekly')
+    recurrence_interval = max(int(pattern.get('recurrence_interval', 1) or 1), 1)
+    recurrence_end_type = pattern.get('recurrence_end_type', 'never')
+
+    # An overnight instance that starts the day before still overlaps the window
+    if end_time < start_time:
+        window_first -= timedelta(days=1)
+
+    if recurrence_end_type == 'date' and pattern.get('recurrence_end_date'):
+        try:
+            until = datetime.strptime(pattern['recurrence_end_date'], '%Y-%m-%d').date()
+            window_stop = min(window_stop, until + timedelta(days=1))
+        except ValueError:
+            pass
+
+    first_index = first_index_on_or_after(first_occurrence, recurrence_type, recurrence_interval, window_first)
+    stop_index = max(
+        first_index_on_or_after(first_occurrence, recurrence_type, recurrence_interval, window_stop),
+        first_index,
+    )
+
+    if recurrence_type not in ('daily', 'weekly', 'monthly'):
+        stop_index = min(stop_index, 1)  # unknown rule: only the first occurrence, as the legacy expansion does
+    elif recurrence_end_type == 'count':
+        limit = int(pattern.get('recurrence_end_count') or 0)
+        # Each exception that lands on a counted occurrence pushes the end out by one
+        skipped = []
+        for date_str in exception_dates:
+            try:
+                day = datetime.strptime(date_str, '%Y-%m-%d').date()
+            except (TypeError, ValueError):
+                continue
+            index = first_index_on_or_after(first_occurrence, recurrence_type, recurrence_interval, day)
+            if occurrence_on(first_occurrence, recurrence_type, recurrence_interval, index) == day:
+                skipped.append(index)
+        for index in sorted(skipped):
+            if index < limit:
+                limit += 1
+        stop_index = min(stop_index, limit)
+
+    return WindowPlan(
+        first_occurrence=first_occurrence,
+        recurrence_type=recurrence_type,
+        recurrence_interval=recurrence_interval,
+        start_time=start_time,
+        end_time=end_time,
+        first_index=first_index,
+        stop_index=max(stop_index, first_index),
+    )
+
+def expand_pattern_in_window(pattern, window_start, window_end, exception_dates=None):
+    """Instances of a pattern that overlap [window_start, window_end).
+
+    The first occurrence in the window is computed arithmetically, so the
+    cost is proportional to the occurrences emitted, not to the age of the
+    series.
+    """
+    if exception_dates is None:
+        exception_dates = exception_index.exception_dates(pattern['id'])
+
+    if pattern.get('rrule'):
+        return _expand_rrule_pattern(pattern, window_start, window_end, exception_dates)
+
+    plan = plan_window(pattern, window_start, window_end, exception_dates)
+    if plan is None:
+        return []
+
+    instances = []
+    for index in range(plan.first_index, plan.stop_index):
+        current_date = plan.occurrence(index)
+        if current_date.isoformat() not in exception_dates:
+            instances.append(create_instance_from_pattern(pattern, current_date, plan.start_time, plan.end_time))
+    return instances
+
+def find_occurrence(pattern, occurrence_date):
+    """The generated instance of a pattern on occurrence_date (YYYY-MM-DD), or None.
+
+    An exception already recorded for that date is ignored, so a moved or
+    deleted occurrence is still found.
+    """
+    day = _to_date(occurrence_date)
+    exception_dates = exception_index.exception_dates(pattern['id']) - {day.isoformat()}
+    window_end = day + timedelta(days=1)
+    for instance in expand_pattern_in_window(pattern, day, window_end, exception_dates):
+        if instance['occurrence_date'] == day.isoformat():
+            return instance
+    return None
+
+def _plan_dates(plan):
+    """numpy datetime64[D] array of every occurrence date in a WindowPlan"""
+    index = np.arange(plan.first_index, plan.stop_index, dtype=np.int64)
+    if plan.recurrence_type == 'monthly':
+        months = np.datetime64(plan.first_occurrence, 'M') + index * plan.recurrence_interval
+        month_starts = months.astype('datetime64[D]')
+        month_lengths = ((months + 1).astype('datetime64[D]') - month_starts).astype(np.int64)
+        return month_starts + np.minimum(plan.first_occurrence.day - 1, month_lengths - 1)
+    step = plan.recurrence_interval if plan.recurrence_type == 'daily' else 7 * plan.recurrence_interval
+    return np.datetime64(plan.first_occurrence, 'D') + index * step
+
+def _exception_array(exception_dates):
+    days = []
+    for date_str in exception_dates:
+        try:
+            days.append(np.datetime64(date_str, 'D'))
+        except (TypeError, ValueError):
+            continue
+    return np.array(days, dtype='datetime64[D]')
+
+class ExpandedPattern:
+    """Occurrence dates of one pattern in a window.
+
+    Holds only the dates; instance dicts (the same shape that
+    create_instance_from_pattern builds) are created when iterated.
+    """
+
+    def __init__(self, pattern, start_time, end_time, days):
+        self.pattern = pattern
+        self.start_time = start_time
+        self.end_time = end_time
+        self.days = days  # numpy datetime64[D] array, or a list of dates without numpy
+
+    def __len__(self):
+        return len(self.days)
+
+    def __iter__(self):
+        pattern = self.pattern
+        overnight = self.end_time < self.start_time
+        if np is not None:
+            starts = np.datetime_as_string(self.days).tolist()
+            ends = np.datetime_as_string(self.days + 1).tolist() if overnight else starts
+        else:
+            starts = [day.isoformat() for day in self.days]
+            ends = [(day + timedelta(days=1)).isoformat() for day in self.days] if overnight else starts
+        start_time = self.start_time.strftime('%H:%M')
+        end_time = self.end_time.strftime('%H:%M')
+        template = {
+            'title': pattern['title'],
+            'location': pattern.get('location', ''),
+            'description': pattern.get('description', ''),
+            'all_day': pattern.get('all_day', False),
+            'layer': pattern.get('layer', 'personal'),
+            'is_recurring_instance': True,
+            'pattern_id': pattern['id'],
+            'created_at': pattern.get('created_at') or pattern['first_occurrence'],
+        }
+        for day, end_day in zip(starts, ends):
+            yield {
+                **template,
+                'id': instance_id(pattern['id'], day),
+                'start': f"{day}T{start_time}",
+                'end': f"{end_day}T{end_time}",
+                'occurrence_date': day,
+            }
+
+def expand_patterns_batch(patterns, window_start, window_end, exception_dates_for=None):
+    """Expand many patterns over one window, as a list of ExpandedPattern.
+
+    With numpy installed, each pattern's dates come from one vectorized
+    step (arange for daily/weekly rules, month-offset arithmetic for monthly
+    ones) and exceptions are masked with a vectorized membership test.
+    Without numpy the same plans are walked in Python. RRULE patterns are
+    evaluated by their compiled rule. Nothing is cached.
+    """
+    if exception_dates_for is None:
+        exception_dates_for = exception_index.exception_dates
+    expanded = []
+    for pattern in patterns:
+        exception_dates = exception_dates_for(pattern['id'])
+        if pattern.get('rrule'):
+            occurrences = _rrule_occurrences(pattern, window_start, window_end, exception_dates)
+            if occurrences is not None:
+                start_time, end_time, days = occurrences
+                if np is not None:
+                    days = np.array(days, dtype='datetime64[D]')
+                expanded.append(ExpandedPattern(pattern, start_time, end_time, days))
+            continue
+        plan = plan_window(pattern, window_start, window_end, exception_dates)
+        if plan is None:
+            continue
+        if np is not None:
+            days = _plan_dates(plan)
+            if exception_dates and len(days):
+                days = days[~np.isin(days, _exception_array(exception_dates))]
+        else:
+            days = [
+                day for day in map(plan.occurrence, range(plan.first_index, plan.stop_index))
+                if day.isoformat() not in exception_dates
+            ]
+        expanded.append(ExpandedPattern(pattern, plan.start_time, plan.end_time, days))
+    return expanded
+
+def generate_instances_for_patterns(patterns, window_start, window_end):
+    """{pattern_id: instances} for many patterns over one window.
+
+    Gives the same instances as generate_instances_from_pattern called per
+    pattern, through the same expansion cache, but the patterns that miss
+    the cache are expanded together with expand_patterns_batch.
+    """
+    window = (str(window_start), str(window_end))
+    exception_dates = {}
+    keys = {}
+    found = {}
+    misses = []
+    for pattern in patterns:
+        dates = exception_dates[pattern['id']] = exception_index.exception_dates(pattern['id'])
+        key = keys[pattern['id']] = expansion_cache.key(pattern, dates, window)
+        instances = expansion_cache.get(key)
+        if instances is None:
+            misses.append(pattern)
+        else:
+            found[pattern['id']] = instances
+    for expanded in expand_patterns_batch(misses, window_start, window_end, exception_dates.__getitem__):
+        pattern_id = expanded.pattern['id']
+        found[pattern_id] = expansion_cache.put(keys[pattern_id], expanded)
+    for pattern in misses:
+        if pattern['id'] not in found:  # could not be parsed
+            found[pattern['id']] = expansion_cache.put(keys[pattern['id']], [])
+    return {pattern_id: found[pattern_id] for pattern_id in keys}
+
 def get_recurrence_text(pattern):
     """Generate human-readable recurrence description"""
+    if pattern.get('rrule'):
+        try:
+            return pattern_rule(pattern).to_text()
+        except (ValueError, KeyError):
+            pass  # fall back to the classic fields
     recurrence_type = pattern.get('recurrence_type', 'weekly')
     interval = int(pattern.get('recurrence_interval', 1))
     end_type = pattern.get('recurrence_end_type', 'never')
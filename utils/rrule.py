@@ -0,0 +1,359 @@
+# utils/rrule.py - RFC 5545 Recurrence Rules
+import calendar
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+FREQUENCIES = ('DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY')
+WEEKDAYS = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+WEEKDAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# How many periods in a row without an occurrence after() searches before giving up
+MAX_EMPTY_PERIODS = 5000
+
+_BYDAY_RE = re.compile(r'^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$')
+_UNTIL_RE = re.compile(r'^(\d{4})-?(\d{2})-?(\d{2})(T\d{2}:?\d{2}:?\d{2}Z?)?$')
+
+def _int_list(value, name, limit, allow_negative=True):
+    numbers = set()
+    for part in value.split(','):
+        try:
+            number = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid {name} value: {part}")
+        if number == 0 or abs(number) > limit or (number < 0 and not allow_negative):
+            raise ValueError(f"Invalid {name} value: {part}")
+        numbers.add(number)
+    return tuple(sorted(numbers))
+
+def _parse_byday(value):
+    days = set()
+    for part in value.split(','):
+        match = _BYDAY_RE.match(part)
+        if not match:
+            raise ValueError(f"Invalid BYDAY value: {part}")
+        ordinal = int(match.group(1)) if match.group(1) else None
+        if ordinal is not None and (ordinal == 0 or abs(ordinal) > 53):
+            raise ValueError(f"Invalid BYDAY value: {part}")
+        days.add((ordinal, WEEKDAYS.index(match.group(2))))
+    return tuple(sorted(days, key=lambda day: (day[1], day[0] or 0)))
+
+def _parse_until(value):
+    match = _UNTIL_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid UNTIL value: {value}")
+    return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+def _ordinal_text(number):
+    if number == -1:
+        return 'last'
+    if number < 0:
+        return f"{_ordinal_text(-number)} to last"
+    suffix = 'th' if 10 <= number % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+    return f"{number}{suffix}"
+
+def _weekdays_in(first, last, weekday):
+    """Every date with the given weekday in [first, last]"""
+    day = first + timedelta(days=(weekday - first.weekday()) % 7)
+    days = []
+    while day <= last:
+        days.append(day)
+        day += timedelta(weeks=1)
+    return days
+
+def _pick(items, position):
+    """1-based position from the start, or negative from the end; None if out of range"""
+    index = position - 1 if position > 0 else len(items) + position
+    return items[index] if 0 <= index < len(items) else None
+
+class RecurrenceRule:
+    """A parsed RRULE anchored at a start date, answering range queries directly.
+
+    Occurrences are grouped into periods (a day, week, month or year,
+    depending on FREQ). A query jumps straight to the period that contains
+    its start date and only builds the periods it needs. COUNT is turned
+    into a last occurrence date the first time it is needed, so later
+    queries never walk from the series start again.
+
+    Supported: FREQ=DAILY/WEEKLY/MONTHLY/YEARLY, INTERVAL, COUNT, UNTIL,
+    BYDAY (with ordinals for MONTHLY/YEARLY), BYMONTHDAY, BYMONTH, BYSETPOS
+    and WKST. Works on dates; the time of day comes from the pattern. When
+    BYDAY and BYMONTHDAY are both given, BYDAY only limits by weekday.
+    """
+
+    def __init__(self, dtstart, freq, interval=1, count=None, until=None,
+                 byday=(), bymonthday=(), bymonth=(), bysetpos=(), wkst=0):
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unsupported FREQ: {freq}")
+        if interval < 1:
+            raise ValueError("INTERVAL must be a positive integer")
+        if count is not None and until is not None:
+            raise ValueError("COUNT and UNTIL cannot both be set")
+        if count is not None and count < 1:
+            raise ValueError("COUNT must be a positive integer")
+        if freq in ('DAILY', 'WEEKLY') and any(ordinal for ordinal, _ in byday):
+            raise ValueError(f"BYDAY ordinals are not allowed with FREQ={freq}")
+        self.dtstart = dtstart
+        self.freq = freq
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.byday = tuple(byday)
+        self.bymonthday = tuple(bymonthday)
+        self.bymonth = tuple(bymonth)
+        self.bysetpos = tuple(bysetpos)
+        self.wkst = wkst
+        self._weekdays = {weekday for _, weekday in self.byday}
+        self._first_period = self._period_of(dtstart)
+        self._last = None if count is not None else until
+
+    @classmethod
+    def parse(cls, text, dtstart):
+        """Build a rule from 'FREQ=WEEKLY;BYDAY=MO,WE,FR' (an 'RRULE:' prefix is allowed)"""
+        text = (text or '').strip()
+        if text.upper().startswith('RRULE:'):
+            text = text[len('RRULE:'):]
+        if not text:
+            raise ValueError("Empty RRULE")
+        parts = {}
+        for part in text.upper().split(';'):
+            if not part:
+                continue
+            name, sep, value = part.partition('=')
+            if not sep or not value:
+                raise ValueError(f"Invalid RRULE part: {part}")
+            if name in parts:
+                raise ValueError(f"Duplicate RRULE part: {name}")
+            parts[name] = value
+
+        options = {}
+        for name, value in parts.items():
+            if name == 'FREQ':
+                options['freq'] = value
+            elif name in ('INTERVAL', 'COUNT'):
+                try:
+                    options[name.lower()] = int(value)
+                except ValueError:
+                    raise ValueError(f"Invalid {name} value: {value}")
+            elif name == 'UNTIL':
+                options['until'] = _parse_until(value)
+            elif name == 'BYDAY':
+                options['byday'] = _parse_byday(value)
+            elif name == 'BYMONTHDAY':
+                options['bymonthday'] = _int_list(value, name, 31)
+            elif name == 'BYMONTH':
+                options['bymonth'] = _int_list(value, name, 12, allow_negative=False)
+            elif name == 'BYSETPOS':
+                options['bysetpos'] = _int_list(value, name, 366)
+            elif name == 'WKST':
+                if value not in WEEKDAYS:
+                    raise ValueError(f"Invalid WKST value: {value}")
+                options['wkst'] = WEEKDAYS.index(value)
+            else:
+                raise ValueError(f"Unsupported RRULE part: {name}")
+        if 'freq' not in options:
+            raise ValueError("RRULE needs a FREQ")
+        return cls(dtstart, **options)
+
+    def to_string(self):
+        """Canonical RRULE text (without the 'RRULE:' prefix)"""
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%d')}")
+        if self.byday:
+            parts.append('BYDAY=' + ','.join(
+                f"{ordinal or ''}{WEEKDAYS[weekday]}" for ordinal, weekday in self.byday
+            ))
+        if self.bymonthday:
+            parts.append('BYMONTHDAY=' + ','.join(map(str, self.bymonthday)))
+        if self.bymonth:
+            parts.append('BYMONTH=' + ','.join(map(str, self.bymonth)))
+        if self.bysetpos:
+            parts.append('BYSETPOS=' + ','.join(map(str, self.bysetpos)))
+        if self.wkst:
+            parts.append(f"WKST={WEEKDAYS[self.wkst]}")
+        return ';'.join(parts)
+
+    def to_text(self):
+        """Human-readable description, e.g. 'Monthly on the last Fri, 10 times'"""
+        unit = {'DAILY': 'day', 'WEEKLY': 'week', 'MONTHLY': 'month', 'YEARLY': 'year'}[self.freq]
+        text = self.freq.capitalize() if self.interval == 1 else f"Every {self.interval} {unit}s"
+        if self.bymonth:
+            text += ' in ' + ', '.join(calendar.month_abbr[month] for month in self.bymonth)
+        if self.byday:
+            text += ' on ' + ', '.join(
+                f"the {_ordinal_text(ordinal)} {WEEKDAY_NAMES[weekday]}" if ordinal else WEEKDAY_NAMES[weekday]
+                for ordinal, weekday in self.byday
+            )
+        if self.bymonthday:
+            text += (' and' if self.byday else ' on') + ' day ' + ', '.join(
+                str(day) if day > 0 else ('the last' if day == -1 else f"the {_ordinal_text(day)}")
+                for day in self.bymonthday
+            )
+        if self.bysetpos:
+            text += ', only the ' + ', '.join(_ordinal_text(pos) for pos in self.bysetpos) + f" each {unit}"
+        if self.count is not None:
+            text += f", {self.count} times"
+        elif self.until is not None:
+            text += f", until {self.until.isoformat()}"
+        return text
+
+    # Periods: consecutive integers, one per day / week / month / year
+    def _period_of(self, day):
+        if self.freq == 'DAILY':
+            return day.toordinal()
+        if self.freq == 'WEEKLY':
+            return (day.toordinal() - 1 - self.wkst) // 7
+        if self.freq == 'MONTHLY':
+            return day.year * 12 + day.month - 1
+        return day.year
+
+    def _period_start(self, period):
+        if self.freq == 'DAILY':
+            return date.fromordinal(period)
+        if self.freq == 'WEEKLY':
+            return date.fromordinal(period * 7 + 1 + self.wkst)
+        if self.freq == 'MONTHLY':
+            return date(period // 12, period % 12 + 1, 1)
+        return date(period, 1, 1)
+
+    def _aligned(self, period):
+        """First period on or after `period` that the INTERVAL selects"""
+        if period <= self._first_period:
+            return self._first_period
+        steps = -(-(period - self._first_period) // self.interval)
+        return self._first_period + steps * self.interval
+
+    def _month_days(self, year, month):
+        length = calendar.monthrange(year, month)[1]
+        if self.bymonthday:
+            days = {day if day > 0 else length + 1 + day for day in self.bymonthday}
+            days = {date(year, month, day) for day in days if 1 <= day <= length}
+            if self.byday:
+                days = {day for day in days if day.weekday() in self._weekdays}
+            return days
+        if self.byday:
+            return self._weekday_days(date(year, month, 1), date(year, month, length))
+        if self.dtstart.day <= length:
+            return {date(year, month, self.dtstart.day)}
+        return set()
+
+    def _weekday_days(self, first, last):
+        days = set()
+        for ordinal, weekday in self.byday:
+            matches = _weekdays_in(first, last, weekday)
+            if ordinal is None:
+                days.update(matches)
+            else:
+                picked = _pick(matches, ordinal)
+                if picked is not None:
+                    days.add(picked)
+        return days
+
+    def _period_dates(self, period):
+        """Sorted occurrence candidates of one period, after BYSETPOS"""
+        if self.freq == 'DAILY':
+            day = date.fromordinal(period)
+            keep = (
+                (not self.bymonth or day.month in self.bymonth)
+                and (not self._weekdays or day.weekday() in self._weekdays)
+                and (not self.bymonthday or self._month_days(day.year, day.month) >= {day})
+            )
+            days = [day] if keep else []
+        elif self.freq == 'WEEKLY':
+            start = self._period_start(period)
+            weekdays = self._weekdays or {self.dtstart.weekday()}
+            days = sorted(start + timedelta(days=(weekday - self.wkst) % 7) for weekday in weekdays)
+            if self.bymonth:
+                days = [day for day in days if day.month in self.bymonth]
+        elif self.freq == 'MONTHLY':
+            year, month = period // 12, period % 12 + 1
+            days = [] if self.bymonth and month not in self.bymonth else sorted(self._month_days(year, month))
+        else:
+            year = period
+            if self.byday and not self.bymonth and not self.bymonthday:
+                # Ordinals count weekdays within the whole year
+                days = sorted(self._weekday_days(date(year, 1, 1), date(year, 12, 31)))
+            else:
+                if self.bymonth:
+                    months = self.bymonth
+                elif self.bymonthday:
+                    months = range(1, 13)
+                else:
+                    months = (self.dtstart.month,)
+                days = sorted(day for month in months for day in self._month_days(year, month))
+        if self.bysetpos and days:
+            days = sorted({day for day in (_pick(days, pos) for pos in self.bysetpos) if day is not None})
+        return days
+
+    def _iter_from(self, period):
+        """Occurrence dates (ignoring COUNT) from the aligned period at or after `period`"""
+        period = self._aligned(period)
+        empty = 0
+        while empty < MAX_EMPTY_PERIODS:
+            try:
+                days = self._period_dates(period)
+            except (ValueError, OverflowError):
+                return  # ran past the supported date range
+            empty = 0 if days else empty + 1
+            for day in days:
+                if day < self.dtstart:
+                    continue
+                if self.until is not None and day > self.until:
+                    return
+                yield day
+            period += self.interval
+
+    @property
+    def last(self):
+        """Date of the final occurrence, or None if the rule never ends"""
+        if self.count is not None and self._last is None:
+            seen = 0
+            for day in self._iter_from(self._first_period):
+                seen += 1
+                self._last = day
+                if seen == self.count:
+                    break
+        return self._last
+
+    def between(self, start, end):
+        """Occurrence dates in [start, end), in order"""
+        start = max(start, self.dtstart)
+        last = self.last
+        if last is not None and last < end:
+            end = last + timedelta(days=1)
+        if start >= end:
+            return []
+        days = []
+        period = self._aligned(self._period_of(start))
+        while True:
+            try:
+                if self._period_start(period) >= end:
+                    break
+                candidates = self._period_dates(period)
+            except (ValueError, OverflowError):
+                break
+            days.extend(day for day in candidates if start <= day < end)
+            period += self.interval
+        return days
+
+    def after(self, day, inclusive=False):
+        """First occurrence after `day` (or on it, if inclusive), or None"""
+        last = self.last
+        for candidate in self._iter_from(self._period_of(max(day, self.dtstart))):
+            if last is not None and candidate > last:
+                return None
+            if candidate > day or (inclusive and candidate == day):
+                return candidate
+        return None
+
+@lru_cache(maxsize=1024)
+def compile_rrule(text, dtstart):
+    """Parse an RRULE once per (text, dtstart); dtstart may be a date or 'YYYY-MM-DD'"""
+    if isinstance(dtstart, str):
+        dtstart = datetime.strptime(dtstart, '%Y-%m-%d').date()
+    return RecurrenceRule.parse(text, dtstart)
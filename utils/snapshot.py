@@ -0,0 +1,155 @@
+# utils/snapshot.py - Request-Scoped View of the Store
+from flask import g, has_request_context
+
+from .data_manager import (
+    CollectionView, add_write_listener, collection_version, event_overlaps,
+    load_events, load_events_in_range, load_layers, load_record,
+    load_recurring_patterns, load_tasks, pending_writes,
+)
+
+_LOADERS = {
+    'events': load_events,
+    'recurring_patterns': load_recurring_patterns,
+    'layers': load_layers,
+    'tasks': load_tasks,
+}
+
+class StoreSnapshot:
+    """The store as seen by one request.
+
+    Each collection is loaded the first time it is asked for and then
+    reused, so a request reads and parses every collection at most once no
+    matter how many helpers look at it. Callers get their own
+    CollectionView, so mutating one never leaks into the snapshot. Writes
+    made through data_manager during the request drop the written
+    collection, and the next read sees the new state; writes still held by
+    deferred_writes() are laid over every read.
+    """
+
+    def __init__(self):
+        self._collections = {}
+        # (start, end) -> events overlapping that window
+        self._ranges = {}
+        # (collection, id) -> record or None, for point lookups
+        self._records = {}
+        # collection -> version read just before it was loaded
+        self._versions = {}
+
+    def _base(self, collection):
+        base = self._collections.get(collection)
+        if base is None:
+            self._versions[collection] = collection_version(collection)
+            data = _LOADERS[collection]()
+            base = self._collections[collection] = data.base if isinstance(data, CollectionView) else data
+        return base
+
+    def _staged(self, collection):
+        pending = pending_writes()
+        return pending.staged(collection) if pending is not None else {}
+
+    def load(self, collection):
+        """The whole collection, as a CollectionView private to the caller"""
+        base = self._base(collection)
+        staged = self._staged(collection)
+        if staged:
+            base = dict(base)
+            for record_id, record in staged.items():
+                if record is None:
+                    base.pop(record_id, None)
+                else:
+                    base[record_id] = record
+        return CollectionView(base)
+
+    @property
+    def events(self):
+        return self.load('events')
+
+    @property
+    def recurring_patterns(self):
+        return self.load('recurring_patterns')
+
+    @property
+    def layers(self):
+        return self.load('layers')
+
+    @property
+    def tasks(self):
+        return self.load('tasks')
+
+    def events_in_range(self, start, end):
+        """Events overlapping [start, end), filtered locally if all events are already loaded"""
+        events = self._collections.get('events')
+        if events is not None:
+            found = {
+                event_id: event for event_id, event in events.items()
+                if event_overlaps(event, start, end)
+            }
+        else:
+            key = (start, end)
+            if key not in self._ranges:
+                self._versions.setdefault('events', collection_version('events'))
+                self._ranges[key] = load_events_in_range(start, end)
+            found = dict(self._ranges[key])
+        for event_id, event in self._staged('events').items():
+            found.pop(event_id, None)
+            if event is not None and event_overlaps(event, start, end):
+                found[event_id] = event
+        return found
+
+    def record(self, collection, record_id):
+        """One record by id, or None; served from the collection when it is loaded"""
+        staged = self._staged(collection)
+        if record_id in staged:
+            return staged[record_id]
+        base = self._collections.get(collection)
+        if base is not None:
+            return base.get(record_id)
+        key = (collection, record_id)
+        if key not in self._records:
+            self._versions.setdefault(collection, collection_version(collection))
+            self._records[key] = load_record(collection, record_id)
+        return self._records[key]
+
+    def version(self, collection):
+        """Version the snapshot's copy of `collection` was read at (current if not read yet)"""
+        if collection in self._versions:
+            return self._versions[collection]
+        return collection_version(collection)
+
+    def is_current(self):
+        """True if no collection read so far has changed since it was read"""
+        return all(
+            version == collection_version(collection)
+            for collection, version in self._versions.items()
+        )
+
+    def forget(self, collection=None):
+        """Drop what was read of one collection (or all), so the next read reloads it"""
+        collections = [collection] if collection else list(_LOADERS)
+        for name in collections:
+            self._collections.pop(name, None)
+            self._versions.pop(name, None)
+            if name == 'events':
+                self._ranges.clear()
+        self._records = {key: record for key, record in self._records.items() if key[0] not in collections}
+
+def get_snapshot():
+    """The current request's snapshot (created on first use).
+
+    Outside a request (scripts, background threads) every call returns a
+    fresh snapshot, which behaves like the plain data_manager loaders.
+    """
+    if not has_request_context():
+        return StoreSnapshot()
+    snapshot = g.get('store_snapshot')
+    if snapshot is None:
+        snapshot = g.store_snapshot = StoreSnapshot()
+    return snapshot
+
+def _on_write(collection, puts, deletes):
+    if has_request_context():
+        snapshot = g.get('store_snapshot')
+        if snapshot is not None:
+            snapshot.forget(collection)
+
+add_write_listener(_on_write)
@@ -0,0 +1,239 @@
+# utils/sqlite_store.py - SQLite Storage Backend
+import json
+import sqlite3
+import sys
+import threading
+
+from .data_manager import (
+    COLLECTION_FILES, SQLITE_FILE, CollectionView, ReadOnlyRecord, _bump_store_epoch, load_json_file
+)
+
+# Indexed columns per table: column name -> record field it mirrors.
+# The full record is always kept as JSON in the `data` column.
+TABLE_COLUMNS = {
+    'events': {
+        'start_at': 'start',
+        'end_at': 'end',
+        'layer': 'layer',
+        'original_pattern_id': 'original_pattern_id',
+    },
+    'recurring_patterns': {
+        'first_occurrence': 'first_occurrence',
+        'layer': 'layer',
+    },
+    'layers': {},
+    'tasks': {
+        'date': 'date',
+    },
+}
+
+TABLE_INDEXES = {
+    'events': ['start_at', 'layer', 'original_pattern_id'],
+    'recurring_patterns': ['layer'],
+    'tasks': ['date'],
+}
+
+def _schema_statements():
+    statements = [
+        'CREATE TABLE IF NOT EXISTS store_meta ('
+        'collection TEXT PRIMARY KEY, generation INTEGER NOT NULL DEFAULT 0)'
+    ]
+    for table, columns in TABLE_COLUMNS.items():
+        extra = ''.join(f', {column} TEXT' for column in columns)
+        statements.append(
+            f'CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY{extra}, data TEXT NOT NULL)'
+        )
+        for column in TABLE_INDEXES.get(table, []):
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})'
+            )
+        statements.append(
+            f"INSERT OR IGNORE INTO store_meta (collection, generation) VALUES ('{table}', 0)"
+        )
+    return statements
+
+class SqliteBackend:
+    """Stores every collection as a table in one SQLite database.
+
+    Writes are real row operations inside a transaction. Each write bumps a
+    per-collection generation counter in store_meta, which lets load() reuse
+    its parsed copy until another writer (in any process) changes the table.
+    A generation that moved without a write from this process means another
+    process wrote, which moves the store epoch.
+    """
+
+    def __init__(self, path=SQLITE_FILE):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # collection -> (generation, {id: ReadOnlyRecord})
+        self._cache = {}
+        # collection -> newest generation this process has accounted for
+        self._seen = {}
+        self._seen_lock = threading.Lock()
+        conn = self._connect()
+        with conn:
+            for statement in _schema_statements():
+                conn.execute(statement)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=FULL')
+            self._local.conn = conn
+        return conn
+
+    def _generation(self, conn, collection):
+        row = conn.execute(
+            'SELECT generation FROM store_meta WHERE collection = ?', (collection,)
+        ).fetchone()
+        generation = row[0] if row else 0
+        self._observe(collection, generation)
+        return generation
+
+    def _observe(self, collection, generation):
+        """Note a generation read from the database; bump the epoch if another process moved it"""
+        with self._seen_lock:
+            known = self._seen.get(collection)
+            if known is not None and generation <= known:
+                return
+            self._seen[collection] = generation
+        if known is not None:
+            _bump_store_epoch()
+
+    def _check_collection(self, collection):
+        if collection not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown collection: {collection}")
+
+    def load(self, collection):
+        self._check_collection(collection)
+        conn = self._connect()
+        generation = self._generation(conn, collection)
+        with self._lock:
+            cached = self._cache.get(collection)
+        if cached and cached[0] == generation:
+            return CollectionView(cached[1])
+
+        conn.execute('BEGIN')
+        try:
+            generation = self._generation(conn, collection)
+            rows = conn.execute(f'SELECT id, data FROM {collection}').fetchall()
+        finally:
+            conn.execute('COMMIT')
+        data = {record_id: ReadOnlyRecord(json.loads(raw)) for record_id, raw in rows}
+        with self._lock:
+            self._cache[collection] = (generation, data)
+        return CollectionView(data)
+
+    def load_record(self, collection, record_id):
+        self._check_collection(collection)
+        conn = self._connect()
+        row = conn.execute(
+            f'SELECT data FROM {collection} WHERE id = ?', (record_id,)
+        ).fetchone()
+        return ReadOnlyRecord(json.loads(row[0])) if row else None
+
+    def load_range(self, collection, start, end):
+        """Events overlapping [start, end), answered from the start_at index"""
+        self._check_collection(collection)
+        if collection != 'events':
+            raise ValueError(f"Range queries are only supported for events, not {collection}")
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT id, data FROM events WHERE start_at > '' AND start_at < ? "
+            "AND (COALESCE(NULLIF(end_at, ''), start_at) > ? OR start_at >= ?)",
+            (end, start, start),
+        ).fetchall()
+        return {record_id: ReadOnlyRecord(json.loads(raw)) for record_id, raw in rows}
+
+    def version(self, collection):
+        self._check_collection(collection)
+        return self._generation(self._connect(), collection)
+
+    def write(self, collection, puts=(), deletes=()):
+        return self.write_many({collection: (puts, deletes)})
+
+    def write_many(self, changes):
+        """Apply {collection: (puts, deletes)} in a single transaction"""
+        for collection in changes:
+            self._check_collection(collection)
+        planned = []
+        for collection, (puts, deletes) in changes.items():
+            columns = TABLE_COLUMNS[collection]
+            names = ['id', *columns, 'data']
+            insert = (
+                f'INSERT OR REPLACE INTO {collection} ({", ".join(names)}) '
+                f'VALUES ({", ".join("?" for _ in names)})'
+            )
+            frozen = [ReadOnlyRecord(record) for record in puts]
+            rows = [
+                (record['id'], *(record.get(field) for field in columns.values()), json.dumps(record))
+                for record in frozen
+            ]
+            planned.append((collection, insert, rows, frozen, list(deletes)))
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            before = {}
+            for collection, insert, rows, frozen, deletes in planned:
+                before[collection] = self._generation(conn, collection)
+                if rows:
+                    conn.executemany(insert, rows)
+                if deletes:
+                    conn.executemany(
+                        f'DELETE FROM {collection} WHERE id = ?', [(record_id,) for record_id in deletes]
+                    )
+                conn.execute(
+                    'UPDATE store_meta SET generation = generation + 1 WHERE collection = ?', (collection,)
+                )
+            # Our own bumps are accounted for before any other thread can read them
+            with self._seen_lock:
+                conn.execute('COMMIT')
+                for collection in before:
+                    self._seen[collection] = before[collection] + 1
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        # Patch the cached copies rather than re-reading the tables
+        with self._lock:
+            for collection, insert, rows, frozen, deletes in planned:
+                cached = self._cache.get(collection)
+                if cached and cached[0] == before[collection]:
+                    data = dict(cached[1])
+                    for record in frozen:
+                        data[record['id']] = record
+                    for record_id in deletes:
+                        data.pop(record_id, None)
+                    self._cache[collection] = (before[collection] + 1, data)
+                else:
+                    self._cache.pop(collection, None)
+        return True
+
+def migrate_json_to_sqlite(db_path=SQLITE_FILE):
+    """One-shot import of the data/*.json files into a SQLite database.
+
+    Existing rows with the same id are replaced, so re-running is safe.
+    Returns {collection: number_of_records_imported}.
+    """
+    backend = SqliteBackend(db_path)
+    counts = {}
+    for collection, filepath in COLLECTION_FILES.items():
+        data = load_json_file(filepath)
+        records = [
+            record if record.get('id') == record_id else {**record, 'id': record_id}
+            for record_id, record in data.items()
+        ]
+        if records:
+            backend.write(collection, puts=records)
+        counts[collection] = len(records)
+    return counts
+
+if __name__ == '__main__':
+    # python -m utils.sqlite_store [db_path]
+    target = sys.argv[1] if len(sys.argv) > 1 else SQLITE_FILE
+    for name, count in migrate_json_to_sqlite(target).items():
+        print(f"Imported {count} {name} into {target}")
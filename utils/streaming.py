@@ -0,0 +1,42 @@
+# utils/streaming.py - NDJSON Streaming Responses
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Serialized lines are sent in chunks of roughly this many bytes
+STREAM_CHUNK_BYTES = 32 * 1024
+
+def wants_ndjson():
+    """True if the client opted into streaming (Accept: application/x-ndjson or ?stream=1)"""
+    if request.args.get('stream') in ('1', 'true'):
+        return True
+    accept = request.accept_mimetypes
+    # Must be asked for by name: browsers' */* keeps getting plain JSON
+    named = any(mimetype == NDJSON_MIMETYPE and quality > 0 for mimetype, quality in accept)
+    return named and accept.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+def ndjson_response(items):
+    """Stream an iterable as one JSON document per line.
+
+    Items are serialized with the app's JSON provider (same output as
+    jsonify) as they are produced, and flushed in STREAM_CHUNK_BYTES chunks,
+    so neither the list nor the full body is held in memory.
+    """
+    dumps = current_app.json.dumps
+
+    @stream_with_context
+    def generate():
+        chunk = []
+        size = 0
+        for item in items:
+            line = dumps(item) + '\n'
+            chunk.append(line)
+            size += len(line)
+            if size >= STREAM_CHUNK_BYTES:
+                yield ''.join(chunk)
+                chunk = []
+                size = 0
+        if chunk:
+            yield ''.join(chunk)
+
+    return Response(generate(), mimetype=NDJSON_MIMETYPE, headers={'X-Accel-Buffering': 'no'})